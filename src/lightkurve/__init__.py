@@ -70,6 +70,24 @@ class Conf(_config.ConfigNamespace):
 
     warn_legacy_cache_dir
         If set to True, issue warning if the legacy default cache directory exists. Default is True.
+
+    cache_size_limit
+        Maximum size of the cache directory in bytes. When it is exceeded, the least
+        recently used files are deleted after each download, or after each batch of
+        downloads of `~lightkurve.SearchResult.download_all`. Default is 0 (no limit).
+
+    cache_verify_checksums
+        If set to True, verify the checksum of cached files before using them, and
+        download them again if they are corrupted. Default is False.
+
+    search_cache_ttl
+        Time in seconds during which the results of the search functions are cached
+        on disk and reused, including across sessions. Default is 0 (no caching).
+
+    local_catalog
+        Path of a local catalog of MAST observations and data products, built using
+        `~lightkurve.build_local_catalog`, which the search functions query instead
+        of MAST. Default is None (query MAST).
     """
     # Note: when using list or string_list datatype,
     # the behavior of astropy's parsing of the config file value:
@@ -98,6 +116,34 @@ class Conf(_config.ConfigNamespace):
         module="lightkurve.config"
     )
 
+    cache_size_limit = _config.ConfigItem(
+        0,
+        "Maximum size of the cache directory in bytes; 0 means no limit.",
+        cfgtype="integer",
+        module="lightkurve.config"
+    )
+
+    cache_verify_checksums = _config.ConfigItem(
+        False,
+        "If set to True, verify the checksum of cached files before using them.",
+        cfgtype="boolean",
+        module="lightkurve.config"
+    )
+
+    search_cache_ttl = _config.ConfigItem(
+        0.0,
+        "Time in seconds during which search results are cached on disk; 0 disables the cache.",
+        cfgtype="float",
+        module="lightkurve.config"
+    )
+
+    local_catalog = _config.ConfigItem(
+        None,
+        "Path of a local catalog which the search functions query instead of MAST.",
+        cfgtype="string",
+        module="lightkurve.config"
+    )
+
 conf = Conf()
 
 
@@ -9,7 +9,7 @@ from astropy.table import vstack
 from astropy.utils.decorators import deprecated
 
 from . import MPLSTYLE
-from .utils import LightkurveWarning, LightkurveDeprecationWarning
+from .utils import LightkurveWarning, LightkurveDeprecationWarning, validate_method
 
 
 __all__ = ["LightCurveCollection", "TargetPixelFileCollection"]
@@ -222,6 +222,40 @@ class LightCurveCollection(Collection):
         # Need `join_type='inner'` until AstroPy supports masked Quantities
         return vstack(lcs, join_type="inner", metadata_conflicts="silent")
 
+    def to_periodogram(self, method="lombscargle", **kwargs):
+        """Converts each light curve in the collection to a
+        `~lightkurve.periodogram.Periodogram` power spectrum object.
+
+        For the Lomb-Scargle method, the periodograms share the same frequency
+        grid and are computed together by
+        `LombScarglePeriodogram.from_lightcurves() <lightkurve.periodogram.LombScarglePeriodogram.from_lightcurves>`,
+        which is much faster than calling `LightCurve.to_periodogram()` for
+        each light curve observed at the same times.
+
+        Parameters
+        ----------
+        method : {'lombscargle', 'boxleastsquares', 'ls', 'bls'}
+            Use the Lomb Scargle or Box Least Squares (BLS) method to
+            extract the power spectra. Defaults to ``'lombscargle'``.
+        kwargs : dict
+            Keyword arguments passed to either
+            `LombScarglePeriodogram.from_lightcurves() <lightkurve.periodogram.LombScarglePeriodogram.from_lightcurves>` or
+            `BoxLeastSquaresPeriodogram <lightkurve.periodogram.BoxLeastSquaresPeriodogram.from_lightcurve>`.
+
+        Returns
+        -------
+        periodograms : list of `~lightkurve.periodogram.Periodogram`
+            The power spectra of the light curves, in the same order.
+        """
+        supported_methods = ["ls", "bls", "lombscargle", "boxleastsquares"]
+        method = validate_method(method.replace(" ", ""), supported_methods)
+        if method in ["bls", "boxleastsquares"]:
+            return [lc.to_periodogram(method="bls", **kwargs) for lc in self]
+
+        from .periodogram import LombScarglePeriodogram
+
+        return LombScarglePeriodogram.from_lightcurves(self, **kwargs)
+
     def plot(self, ax=None, offset=0.0, **kwargs) -> matplotlib.axes.Axes:
         """Plots all light curves in the collection on a single plot.
 
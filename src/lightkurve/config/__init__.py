@@ -3,6 +3,9 @@ import warnings
 
 import astropy.config as astropyconfig
 
+from .cache import CacheIndex, SearchCache
+from .catalog import LocalCatalog
+
 
 ROOTNAME = 'lightkurve'
 
@@ -79,6 +82,68 @@ def get_cache_dir():
     return cache_dir
 
 
+def get_search_cache():
+    """
+    Returns the persistent cache of search results, which is stored in the
+    cache directory.
+
+    The cache is only used by the search functions if the ``search_cache_ttl``
+    configuration parameter is positive, in which case search results are
+    reused for ``search_cache_ttl`` seconds, including across sessions and
+    processes.
+
+    Returns
+    -------
+    search_cache : `~lightkurve.config.SearchCache`
+        The search cache.
+
+    Examples
+    --------
+    To reuse search results for one day::
+
+        import lightkurve as lk
+        lk.conf.search_cache_ttl = 86400
+
+    To remove all the cached search results::
+
+        lk.config.get_search_cache().clear()
+    """
+    from .. import conf
+
+    return SearchCache(get_cache_dir(), ttl=conf.search_cache_ttl)
+
+
+def get_local_catalog():
+    """
+    Returns the local catalog of MAST observations and data products used by
+    the search functions instead of MAST, or `None` if MAST is used.
+
+    The catalog is given by the ``local_catalog`` configuration parameter,
+    which is the path of a catalog built using `~lightkurve.build_local_catalog`.
+
+    Returns
+    -------
+    catalog : `~lightkurve.config.LocalCatalog` or `None`
+        The local catalog.
+
+    Examples
+    --------
+    To search a catalog built beforehand, e.g. on a computer without network access::
+
+        import lightkurve as lk
+        lk.conf.local_catalog = '/my_research/catalog.sqlite'
+        lk.search_lightcurve('KIC 11904151')
+    """
+    from .. import conf
+
+    path = conf.local_catalog
+    if path is None or path == "":
+        return None
+    if not os.path.exists(path):
+        raise FileNotFoundError("Local catalog {} does not exist.".format(path))
+    return LocalCatalog(path)
+
+
 def _ensure_cache_dir_exists(cache_dir):
     if os.path.isdir(cache_dir):
         return cache_dir
@@ -0,0 +1,327 @@
+"""Defines tools to index and manage the contents of the Lightkurve cache directory."""
+import hashlib
+import io
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from contextlib import closing, contextmanager
+
+log = logging.getLogger(__name__)
+
+__all__ = ["CacheIndex", "SearchCache"]
+
+
+INDEX_FILENAME = "lightkurve-cache-index.sqlite"
+SEARCH_CACHE_FILENAME = "lightkurve-search-cache.sqlite"
+
+
+def _execute(database, sql, parameters=()):
+    """Executes an SQL statement on a SQLite database in its own transaction
+    and returns the rows it selected.
+
+    Errors raised by SQLite are logged, and an empty list is returned.
+    """
+    try:
+        # A new connection is used for each statement, so that the databases
+        # can be used from several threads.
+        with closing(sqlite3.connect(database, timeout=60)) as conn:
+            with conn:
+                return conn.execute(sql, parameters).fetchall()
+    except sqlite3.Error as exc:
+        log.debug("Unable to access {}: {}".format(database, exc))
+        return []
+
+
+def file_checksum(path, chunk_size=2**20):
+    """Returns the MD5 checksum of a file, which is read in chunks."""
+    md5 = hashlib.md5()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+@contextmanager
+def download_staging_dir(download_dir):
+    """Context manager yielding a temporary directory inside ``download_dir``,
+    which is removed on exit.
+
+    Files are downloaded into this directory and then moved into the cache
+    using `move_into_cache`, so that interrupted downloads never leave
+    truncated files in the cache.
+    """
+    staging_dir = tempfile.mkdtemp(prefix=".download-", dir=download_dir)
+    try:
+        yield staging_dir
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def move_into_cache(path, staging_dir, download_dir):
+    """Atomically moves a file downloaded into ``staging_dir`` to the same
+    relative location in ``download_dir``, and returns its new path."""
+    destination = os.path.join(download_dir, os.path.relpath(path, staging_dir))
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    os.replace(path, destination)
+    return destination
+
+
+class CacheIndex(object):
+    """Persistent index of the files downloaded into a cache directory.
+
+    The index is a small SQLite database stored in the cache directory, which
+    maps a key identifying a data product (e.g. its MAST ``dataURI``) to the
+    path, size, checksum and last access time of the local file.
+    This allows cached files to be found without reconstructing their paths
+    or scanning the directory. The index can be shared by several processes.
+
+    Errors raised by SQLite (e.g. if the cache directory is read-only) are
+    logged and otherwise ignored, in which case the index behaves as if empty.
+
+    The index is also used to bound the size of the cache, by evicting the
+    least recently used files (see `evict`), and to detect corrupted files
+    by verifying their checksums (see `verify`).
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory containing the cached files and the index.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.path = os.path.join(self.cache_dir, INDEX_FILENAME)
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "key TEXT PRIMARY KEY, path TEXT NOT NULL, size INTEGER NOT NULL, "
+            "checksum TEXT, last_access REAL NOT NULL)"
+        )
+
+    def _execute(self, sql, parameters=()):
+        return _execute(self.path, sql, parameters)
+
+    def get(self, key, verify=False):
+        """Returns the path of the cached file for ``key``, or `None`.
+
+        Entries whose file is missing or has a different size than when it
+        was added are removed from the index.  If ``verify`` is `True`, the
+        checksum of the file is also verified, and corrupted files are deleted.
+        """
+        rows = self._execute(
+            "SELECT path, size, checksum FROM files WHERE key = ?", (key,)
+        )
+        if not rows:
+            return None
+        path, size, checksum = rows[0]
+        try:
+            valid = os.path.getsize(path) == size
+        except OSError:
+            valid = False
+        if not valid:
+            log.debug("Removing stale entry {} from the cache index.".format(key))
+            self.remove(key)
+            return None
+        if verify and not self._verify_file(key, path, checksum):
+            return None
+        self._execute(
+            "UPDATE files SET last_access = ? WHERE key = ?", (time.time(), key)
+        )
+        return path
+
+    def add(self, key, path, checksum=None):
+        """Records that the file at ``path`` is the cached copy of ``key``.
+
+        The checksum of the file is computed if it is not given.
+        """
+        path = os.path.abspath(path)
+        if checksum is None:
+            checksum = file_checksum(path)
+        self._execute(
+            "INSERT OR REPLACE INTO files (key, path, size, checksum, last_access) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, path, os.path.getsize(path), checksum, time.time()),
+        )
+
+    def remove(self, key):
+        """Removes ``key`` from the index; the file itself is not deleted."""
+        self._execute("DELETE FROM files WHERE key = ?", (key,))
+
+    def total_size(self):
+        """Returns the total size in bytes of the files in the index."""
+        rows = self._execute("SELECT SUM(size) FROM files")
+        return (rows[0][0] or 0) if rows else 0
+
+    def evict(self, max_size, keep=()):
+        """Deletes the least recently used files until the total size of the
+        cache is at most ``max_size`` bytes.
+
+        Parameters
+        ----------
+        max_size : int
+            Maximum size of the cache in bytes.
+        keep : collection of str
+            Keys of the files which must not be deleted, e.g. because they
+            are in use.
+
+        Returns
+        -------
+        evicted : list of str
+            Keys of the files which were deleted.
+        """
+        total_size = self.total_size()
+        evicted = []
+        for key, path, size, _, _ in self.entries():
+            if total_size <= max_size:
+                break
+            if key in keep:
+                continue
+            log.debug("Evicting {} from the cache.".format(path))
+            _remove_file(path)
+            self.remove(key)
+            evicted.append(key)
+            total_size -= size
+        return evicted
+
+    def verify(self):
+        """Verifies the checksums of all the files in the index.
+
+        Files which are missing or corrupted are deleted and removed from
+        the index.
+
+        Returns
+        -------
+        corrupted : list of str
+            Keys of the files which were missing or corrupted.
+        """
+        corrupted = []
+        for key, path, _, checksum, _ in self.entries():
+            if not self._verify_file(key, path, checksum):
+                corrupted.append(key)
+        return corrupted
+
+    def _verify_file(self, key, path, checksum):
+        """Returns `True` if the file has the expected checksum, otherwise
+        deletes it and removes ``key`` from the index."""
+        try:
+            valid = checksum is None or file_checksum(path) == checksum
+        except OSError:
+            valid = False
+        if not valid:
+            log.warning("Removing corrupted file {} from the cache.".format(path))
+            _remove_file(path)
+            self.remove(key)
+        return valid
+
+    def entries(self):
+        """Returns a list of ``(key, path, size, checksum, last_access)``
+        tuples for all the files in the index, least recently used first."""
+        return self._execute(
+            "SELECT key, path, size, checksum, last_access FROM files "
+            "ORDER BY last_access"
+        )
+
+    def __len__(self):
+        rows = self._execute("SELECT COUNT(*) FROM files")
+        return rows[0][0] if rows else 0
+
+    def __contains__(self, key):
+        return bool(self._execute("SELECT 1 FROM files WHERE key = ?", (key,)))
+
+
+class SearchCache(object):
+    """Persistent cache of the results of the search functions.
+
+    The results are stored in a small SQLite database in the cache directory,
+    keyed on the normalized search criteria, so that they can be shared by
+    several processes and reused across sessions.  Results older than
+    ``ttl`` seconds are considered expired and are not returned.
+
+    The result tables are stored as ECSV text.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Directory containing the database.
+    ttl : float
+        Time-to-live of the cached results, in seconds.
+    """
+
+    def __init__(self, cache_dir, ttl):
+        self.path = os.path.join(os.path.abspath(cache_dir), SEARCH_CACHE_FILENAME)
+        self.ttl = ttl
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS searches ("
+            "key TEXT PRIMARY KEY, created REAL NOT NULL, result TEXT NOT NULL)"
+        )
+
+    def _execute(self, sql, parameters=()):
+        return _execute(self.path, sql, parameters)
+
+    @staticmethod
+    def make_key(criteria):
+        """Returns the key under which the results of a search with the
+        given ``criteria`` (a dictionary) are stored."""
+        normalized = json.dumps(criteria, sort_keys=True, default=str)
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    def get(self, key):
+        """Returns the cached result for ``key``, or `None` if it is missing
+        or has expired."""
+        rows = self._execute(
+            "SELECT result FROM searches WHERE key = ? AND created >= ?",
+            (key, time.time() - self.ttl),
+        )
+        if not rows:
+            return None
+        from astropy.table import Table
+
+        try:
+            return Table.read(rows[0][0], format="ascii.ecsv")
+        except Exception as exc:
+            log.debug("Unable to load cached search result: {}".format(exc))
+            self.invalidate(key)
+            return None
+
+    def set(self, key, result):
+        """Stores ``result``, an `~astropy.table.Table`, under ``key``.
+
+        Tables which cannot be written as ECSV are not cached.
+        """
+        buffer = io.StringIO()
+        try:
+            result.write(buffer, format="ascii.ecsv")
+        except Exception as exc:
+            log.debug("Unable to cache search result: {}".format(exc))
+            return
+        self._execute(
+            "INSERT OR REPLACE INTO searches (key, created, result) VALUES (?, ?, ?)",
+            (key, time.time(), buffer.getvalue()),
+        )
+
+    def invalidate(self, key):
+        """Removes the cached result for ``key``."""
+        self._execute("DELETE FROM searches WHERE key = ?", (key,))
+
+    def clear(self, expired_only=False):
+        """Removes all the cached results, or only the expired ones."""
+        if expired_only:
+            self._execute(
+                "DELETE FROM searches WHERE created < ?", (time.time() - self.ttl,)
+            )
+        else:
+            self._execute("DELETE FROM searches")
+
+    def __len__(self):
+        rows = self._execute("SELECT COUNT(*) FROM searches")
+        return rows[0][0] if rows else 0
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError as exc:
+        log.debug("Unable to remove {}: {}".format(path, exc))
@@ -0,0 +1,403 @@
+"""Defines a local copy of the MAST catalog, which the search functions can
+use instead of MAST on computers without network access."""
+import json
+import logging
+import os
+import re
+import sqlite3
+from contextlib import closing, contextmanager
+
+import numpy as np
+from astropy import units as u
+from astropy.coordinates import SkyCoord
+from astropy.table import MaskedColumn, Row, Table
+
+log = logging.getLogger(__name__)
+
+__all__ = ["LocalCatalog"]
+
+
+# Columns of the tables returned if no observations or products are found,
+# which are used by the search functions
+OBSERVATION_COLUMNS = (
+    "obsid",
+    "obs_id",
+    "target_name",
+    "project",
+    "provenance_name",
+    "sequence_number",
+    "t_exptime",
+    "t_min",
+    "s_ra",
+    "s_dec",
+)
+PRODUCT_COLUMNS = (
+    "obsID",
+    "obs_id",
+    "parent_obsid",
+    "productFilename",
+    "description",
+    "dataURI",
+)
+
+
+class LocalCatalog(object):
+    """Local copy of the MAST observations and data products of a set of targets.
+
+    The catalog is a SQLite database which stores the rows of the tables
+    returned by `astroquery.mast.Observations.query_criteria` and
+    `~astroquery.mast.ObservationsClass.get_product_list`.  It provides the
+    same two methods, so that the search functions return the same
+    `~lightkurve.SearchResult` objects whether they query MAST or the catalog.
+    The search functions use the catalog given by the ``local_catalog``
+    configuration parameter, if any.
+
+    A catalog is built once, on a computer with network access, using
+    `~lightkurve.build_local_catalog`.
+
+    Parameters
+    ----------
+    path : str
+        Path of the database, which is created if it does not exist.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        with self._connect() as conn:
+            conn.executescript(
+                "CREATE TABLE IF NOT EXISTS observations ("
+                "obsid TEXT PRIMARY KEY, target_name TEXT, project TEXT, "
+                "provenance_name TEXT, dataproduct_type TEXT, sequence_number INTEGER, "
+                "t_exptime REAL, dec_min REAL, dec_max REAL, row TEXT NOT NULL);"
+                "CREATE INDEX IF NOT EXISTS observations_target_name "
+                "ON observations (target_name);"
+                "CREATE INDEX IF NOT EXISTS observations_dec ON observations (dec_min);"
+                "CREATE TABLE IF NOT EXISTS products ("
+                "parent_obsid TEXT NOT NULL, filename TEXT NOT NULL, "
+                "row TEXT NOT NULL, PRIMARY KEY (parent_obsid, filename));"
+                "CREATE TABLE IF NOT EXISTS targets ("
+                "name TEXT PRIMARY KEY, ra REAL NOT NULL, dec REAL NOT NULL);"
+            )
+
+    @contextmanager
+    def _connect(self):
+        # The connection is closed after committing or rolling back the transaction
+        with closing(sqlite3.connect(self.path, timeout=60)) as conn:
+            with conn:
+                yield conn
+
+    def add_observations(self, observations):
+        """Adds a table of observations returned by MAST to the catalog,
+        replacing the observations with the same ``obsid``."""
+        rows = []
+        for row in _table_rows(observations):
+            dec_min, dec_max = _dec_range(row.get("s_region"), row.get("s_dec"))
+            rows.append(
+                (
+                    str(row["obsid"]),
+                    row.get("target_name"),
+                    _lower(row.get("project")),
+                    _lower(row.get("provenance_name")),
+                    _lower(row.get("dataproduct_type")),
+                    row.get("sequence_number"),
+                    row.get("t_exptime"),
+                    dec_min,
+                    dec_max,
+                    json.dumps(row),
+                )
+            )
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO observations (obsid, target_name, project, "
+                "provenance_name, dataproduct_type, sequence_number, t_exptime, "
+                "dec_min, dec_max, row) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def add_products(self, products):
+        """Adds a table of data products returned by MAST to the catalog."""
+        rows = [
+            (str(row["parent_obsid"]), row["productFilename"], json.dumps(row))
+            for row in _table_rows(products)
+        ]
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO products (parent_obsid, filename, row) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def add_target(self, name, coord):
+        """Records the coordinates of a target name, so that cone searches
+        around this name can be performed without the MAST name resolver."""
+        self._execute(
+            "INSERT OR REPLACE INTO targets (name, ra, dec) VALUES (?, ?, ?)",
+            (_normalize_name(name), coord.ra.deg, coord.dec.deg),
+        )
+
+    def resolve_object(self, objectname):
+        """Returns the coordinates of a target, which can be a name added
+        using `add_target` or a "ra, dec" string in degrees.
+
+        Raises `~astroquery.exceptions.ResolverError` if the target is unknown.
+        """
+        from astroquery.exceptions import ResolverError
+
+        rows = self._execute(
+            "SELECT ra, dec FROM targets WHERE name = ?", (_normalize_name(objectname),)
+        )
+        if rows:
+            return SkyCoord(rows[0][0], rows[0][1], unit="deg")
+        try:
+            return SkyCoord(str(objectname).replace(",", " "), unit="deg")
+        except ValueError:
+            raise ResolverError(
+                'Could not resolve "{}" in the local catalog {}. Add the target to '
+                "the catalog, or search by coordinates.".format(objectname, self.path)
+            )
+
+    def query_criteria(
+        self,
+        target_name=None,
+        objectname=None,
+        coordinates=None,
+        radius=None,
+        **criteria,
+    ):
+        """Returns the table of the observations matching the criteria, in the
+        same way as `astroquery.mast.Observations.query_criteria`.
+
+        Observations can be selected by their exact ``target_name``, or by a
+        cone search around ``objectname`` or ``coordinates``.  In the latter
+        case, an observation matches if its footprint contains the target or
+        if its center is within ``radius``, and a ``distance`` column is added.
+        The ``project``, ``provenance_name``, ``dataproduct_type``,
+        ``sequence_number`` and ``t_exptime`` criteria are applied as by MAST;
+        other criteria are applied to the columns of the observations.
+        """
+        sql, parameters = ["SELECT row FROM observations WHERE 1"], []
+        for column in ("project", "provenance_name", "dataproduct_type"):
+            values = criteria.pop(column, None)
+            if values is not None:
+                values = [_lower(v) for v in np.atleast_1d(values)]
+                sql.append("AND {} IN ({})".format(column, _placeholders(values)))
+                parameters.extend(values)
+        sequence_number = criteria.pop("sequence_number", None)
+        if sequence_number is not None:
+            values = [int(v) for v in np.atleast_1d(sequence_number)]
+            sql.append("AND sequence_number IN ({})".format(_placeholders(values)))
+            parameters.extend(values)
+        # Exposure time ranges are applied here; other values, e.g. "long", are
+        # applied to the products by the search functions
+        t_exptime = criteria.pop("t_exptime", None)
+        if np.size(t_exptime) == 2 and not isinstance(t_exptime, str):
+            sql.append("AND t_exptime BETWEEN ? AND ?")
+            parameters.extend(float(v) for v in t_exptime)
+        elif isinstance(t_exptime, (int, float)):
+            sql.append("AND t_exptime = ?")
+            parameters.append(float(t_exptime))
+
+        if target_name is not None:
+            values = [str(v) for v in np.atleast_1d(target_name)]
+            sql.append("AND target_name IN ({})".format(_placeholders(values)))
+            parameters.extend(values)
+        elif objectname is not None or coordinates is not None:
+            if coordinates is None:
+                coordinates = self.resolve_object(objectname)
+            elif not isinstance(coordinates, SkyCoord):
+                coordinates = SkyCoord(coordinates, unit="deg")
+            radius = u.Quantity(radius if radius is not None else 0.2 * u.deg, u.deg)
+            sql.append("AND dec_min <= ? AND dec_max >= ?")
+            parameters.extend(
+                [
+                    coordinates.dec.deg + radius.to_value(u.deg),
+                    coordinates.dec.deg - radius.to_value(u.deg),
+                ]
+            )
+        rows = self._execute(" ".join(sql), parameters)
+        observations = _rows_to_table(
+            [json.loads(row) for row, in rows], OBSERVATION_COLUMNS
+        )
+
+        mask = np.ones(len(observations), dtype=bool)
+        for column, values in criteria.items():
+            if column in observations.colnames:
+                mask &= np.isin(observations[column], np.atleast_1d(values))
+        if target_name is None and (objectname is not None or coordinates is not None):
+            distance = _distance(observations, coordinates)
+            in_footprint = np.array(
+                [
+                    _region_contains(region, coordinates)
+                    for region in observations["s_region"]
+                ]
+                if "s_region" in observations.colnames
+                else np.zeros(len(observations), dtype=bool),
+                dtype=bool,
+            )
+            mask &= in_footprint | (distance <= radius.to_value(u.arcsec))
+            observations["distance"] = distance
+        return observations[mask]
+
+    def get_product_list(self, observations):
+        """Returns the table of the data products of one or more observations,
+        given as a table of observations or as a list of ``obsid`` values,
+        in the same way as `astroquery.mast.Observations.get_product_list`."""
+        if isinstance(observations, (Table, Row)):
+            observations = observations["obsid"]
+        obsids = [str(obsid) for obsid in np.atleast_1d(observations)]
+        rows = []
+        # SQLite limits the number of parameters per statement
+        for idx in range(0, len(obsids), 500):
+            batch = obsids[idx : idx + 500]
+            rows.extend(
+                self._execute(
+                    "SELECT row FROM products WHERE parent_obsid IN ({}) "
+                    "ORDER BY rowid".format(_placeholders(batch)),
+                    batch,
+                )
+            )
+        return _rows_to_table([json.loads(row) for row, in rows], PRODUCT_COLUMNS)
+
+    def _execute(self, sql, parameters=()):
+        with self._connect() as conn:
+            return conn.execute(sql, list(parameters)).fetchall()
+
+    def __len__(self):
+        """Returns the number of observations in the catalog."""
+        return self._execute("SELECT COUNT(*) FROM observations")[0][0]
+
+
+def _table_rows(table):
+    """Returns the rows of a table as JSON-serializable dictionaries,
+    in which masked values are `None`."""
+    columns = {}
+    for name in table.colnames:
+        column = table[name]
+        values = np.ma.getdata(column).tolist()
+        mask = np.ma.getmaskarray(column)
+        if isinstance(column, MaskedColumn) or mask.any():
+            values = [None if m else v for v, m in zip(values, mask)]
+        columns[name] = [v.decode() if isinstance(v, bytes) else v for v in values]
+    return [
+        {name: values[idx] for name, values in columns.items()}
+        for idx in range(len(table))
+    ]
+
+
+def _rows_to_table(rows, empty_columns=()):
+    """Creates a table from dictionaries created by `_table_rows`,
+    using masked columns for the columns containing `None` values.
+
+    If there are no rows, a table with the ``empty_columns`` is returned.
+    """
+    if not rows:
+        return Table(names=empty_columns)
+    names = []
+    for row in rows:
+        names.extend(name for name in row if name not in names)
+    table = Table()
+    for name in names:
+        values = [row.get(name) for row in rows]
+        mask = [v is None for v in values]
+        if not any(mask):
+            table[name] = np.array(values)
+            continue
+        valid = [v for v in values if v is not None]
+        if not valid:
+            fill_value = ""
+        elif isinstance(valid[0], str):
+            fill_value = ""
+        elif isinstance(valid[0], bool):
+            fill_value = False
+        elif all(isinstance(v, int) for v in valid):
+            fill_value = 0
+        else:
+            fill_value = np.nan
+        data = np.array([fill_value if m else v for v, m in zip(values, mask)])
+        table[name] = MaskedColumn(data, mask=mask)
+    return table
+
+
+def _distance(observations, coord):
+    """Returns the angular distance in arcseconds between the center of
+    each observation and ``coord``."""
+    if len(observations) == 0 or "s_ra" not in observations.colnames:
+        return np.full(len(observations), np.inf)
+    ra = np.radians(np.ma.filled(np.ma.asarray(observations["s_ra"], float), np.nan))
+    dec = np.radians(np.ma.filled(np.ma.asarray(observations["s_dec"], float), np.nan))
+    ra0, dec0 = coord.ra.radian, coord.dec.radian
+    # Haversine formula, which is accurate for small distances
+    hav = np.sin((dec - dec0) / 2) ** 2 + np.cos(dec) * np.cos(dec0) * np.sin(
+        (ra - ra0) / 2
+    ) ** 2
+    distance = np.degrees(2 * np.arcsin(np.sqrt(np.clip(hav, 0, 1)))) * 3600
+    return np.where(np.isfinite(distance), distance, np.inf)
+
+
+def _parse_region(region):
+    """Returns the shape and the numbers of a footprint in the STC-S format
+    used by MAST, e.g. "POLYGON 10.0 20.0 10.1 20.0 10.1 20.1" or
+    "CIRCLE ICRS 10.0 20.0 0.1", or `None` if it cannot be parsed."""
+    if not isinstance(region, str):
+        return None
+    tokens = region.upper().split()
+    if not tokens or tokens[0] not in ("POLYGON", "CIRCLE"):
+        return None
+    values = []
+    for token in tokens[1:]:
+        if re.match(r"^[-+]?[\d.]+(E[-+]?\d+)?$", token):
+            values.append(float(token))
+        elif token in ("POLYGON", "CIRCLE"):
+            # Only the first shape of regions made of several shapes is used
+            break
+    return tokens[0], values
+
+
+def _dec_range(region, dec):
+    """Returns the range of declinations covered by a footprint, which is
+    used to select the observations close to a target."""
+    parsed = _parse_region(region)
+    if parsed is not None:
+        shape, values = parsed
+        if shape == "POLYGON" and len(values) >= 6:
+            return min(values[1::2]), max(values[1::2])
+        if shape == "CIRCLE" and len(values) == 3:
+            return values[1] - values[2], values[1] + values[2]
+    if dec is None:
+        return None, None
+    return dec, dec
+
+
+def _region_contains(region, coord):
+    """Returns `True` if a footprint in the STC-S format contains ``coord``."""
+    parsed = _parse_region(region)
+    if parsed is None:
+        return False
+    shape, values = parsed
+    if shape == "CIRCLE" and len(values) == 3:
+        center = SkyCoord(values[0], values[1], unit="deg")
+        return center.separation(coord).deg <= values[2]
+    if shape != "POLYGON" or len(values) < 6:
+        return False
+    # Ray casting in the plane tangent to the sky at the target
+    ra = (np.array(values[0::2]) - coord.ra.deg + 180) % 360 - 180
+    x = ra * np.cos(coord.dec.radian)
+    y = np.array(values[1::2]) - coord.dec.deg
+    inside = False
+    for idx in range(len(x)):
+        x1, y1, x2, y2 = x[idx - 1], y[idx - 1], x[idx], y[idx]
+        if (y1 > 0) != (y2 > 0) and 0 < x1 + (x2 - x1) * (0 - y1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def _normalize_name(name):
+    return " ".join(str(name).split()).lower()
+
+
+def _lower(value):
+    return None if value is None else str(value).lower()
+
+
+def _placeholders(values):
+    return ", ".join("?" * len(values))
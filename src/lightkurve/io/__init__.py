@@ -17,6 +17,7 @@ from . import (
 )
 from .detect import *
 from .read import *
+from .scan import *
 
 __all__ = ["read", "open"]
 
@@ -27,9 +27,15 @@ def read_generic_lightcurve(
     centroid_row_column="mom_centr2",
     time_format=None,
     ext=1,
+    columns=None,
 ):
     """Generic helper function to convert a Kepler ot TESS light curve file
     into a generic `LightCurve` object.
+
+    If ``columns`` is a list of column names, only these columns are decoded
+    from the file, in addition to the time, flux, flux_err, quality, cadenceno
+    and centroid columns identified by the other arguments.  By default, all
+    columns are read.
     """
     to_close_hdul = True
     if (isinstance(filename, str) and filename.startswith('s3://')):
@@ -52,7 +58,17 @@ def read_generic_lightcurve(
             # Inconsistencies between TESS data products and the FITS standard
             # out to be addressed at the archive level. (See issue #1216.)
             warnings.simplefilter("ignore", category=UnitsWarning)
-            tab = Table.read(hdulist[ext], format="fits")
+            hdu = hdulist[ext]
+            if columns is not None:
+                # Only decode the requested columns and the standard ones
+                standard_columns = [
+                    time_column, "t", flux_column, flux_column + "_err",
+                    flux_err_column, quality_column, cadenceno_column,
+                    centroid_col_column, centroid_row_column, "time", "flux",
+                    "flux_err", "quality", "cadenceno", "centroid_col", "centroid_row",
+                ]
+                hdu = _select_columns(hdu, list(columns) + standard_columns)
+            tab = Table.read(hdu, format="fits")
 
         # Make sure the meta data also includes header fields from extension #0
         tab.meta.update(hdulist[0].header)
@@ -78,8 +94,8 @@ def read_generic_lightcurve(
             elif unitstr.lower() == "degcelcius":
                 # CDIPS has non-astropy units
                 tab[colname].unit = "deg_C"
-            # Rename columns to lowercase
-            tab.rename_column(colname, colname.lower())
+        # Rename columns to lowercase
+        tab.rename_columns(tab.colnames, [colname.lower() for colname in tab.colnames])
 
         # Some KEPLER files used to have a T column instead of TIME.
         if time_column == "time" and "time" not in tab.columns and "t" in tab.colnames:
@@ -143,3 +159,11 @@ def read_generic_lightcurve(
         if to_close_hdul:
             # avoid hdulist closing from emitting exceptions
             hdulist.close(output_verify="warn")
+
+
+def _select_columns(hdu, names):
+    """Returns a copy of the table ``hdu`` which only contains the columns
+    in ``names`` (case-insensitive), without decoding the other columns."""
+    names = {name.lower() for name in names}
+    selected = [col for col in hdu.columns if col.name.lower() in names]
+    return fits.BinTableHDU.from_columns(selected, header=hdu.header)
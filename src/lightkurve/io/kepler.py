@@ -6,7 +6,7 @@ from .generic import read_generic_lightcurve
 
 
 def read_kepler_lightcurve(
-    filename, flux_column="pdcsap_flux", quality_bitmask="default"
+    filename, flux_column="pdcsap_flux", quality_bitmask="default", columns=None
 ):
     """Returns a Kepler `~lightkurve.lightcurve.LightCurve`.
 
@@ -30,12 +30,18 @@ def read_kepler_lightcurve(
               (`quality_bitmask=2096639`). This mask is not recommended.
 
         See the `~lightkurve.utils.KeplerQualityFlags` class for details on the bitmasks.
+    columns : list of str, optional
+        Names of the columns to read in addition to the standard ones (time,
+        flux, flux_err, quality, cadenceno, centroid_col and centroid_row).
+        Columns which are not requested are not decoded, which makes reading
+        faster. By default, all columns are read.
     """
     lc = read_generic_lightcurve(
         filename,
         flux_column=flux_column,
         quality_column="sap_quality",
         time_format="bkjd",
+        columns=columns,
     )
 
     # Filter out poor-quality data
@@ -1,5 +1,8 @@
 """Functions for reading light curve data."""
 import logging
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 from astropy.io import fits
 from astropy.utils import deprecated
@@ -60,6 +63,11 @@ def read(path_or_url, **kwargs):
     flux_column : str, optional
         (Applicable to LightCurve products only) The column in the FITS file to be read as `flux`. Defaults to 'pdcsap_flux'.
         Typically 'pdcsap_flux' or 'sap_flux'.
+    columns : list of str, optional
+        (Applicable to official Kepler and TESS LightCurve products only) Names of
+        the columns to read in addition to the standard ones (time, flux, flux_err,
+        quality, cadenceno, centroid_col and centroid_row). Pass an empty list to
+        read only the standard columns, which is faster. By default, all columns are read.
     **kwargs : dict
         Dictionary of arguments to be passed to underlying data product type specific reader.
 
@@ -162,22 +170,77 @@ def read(path_or_url, **kwargs):
             "Please remove it from your disk and try again."
         )
 
-def _read_collection(path_list, product, *, stitch=False, **kwargs):
-    """Read multiple product files into a collection"""
-    prod_list = []
-    for path in path_list:
+def _read_collection_item(path, product, kwargs, capture_warnings=True):
+    """Reads one file of a collection, possibly in another process.
+
+    Returns a tuple ``(prod, level, message, caught_warnings)``, in which
+    ``prod`` is `None` if the file is not a valid ``product``, and ``level``
+    and ``message`` describe the message which must be logged in that case.
+    If ``capture_warnings`` is `True`, the warnings raised while reading the
+    file are returned as ``(message, category, filename, lineno)`` tuples, so
+    that they can be raised again by the parent process.
+    """
+    with warnings.catch_warnings(record=capture_warnings) as caught:
+        if capture_warnings:
+            warnings.simplefilter("always")
         try:
             new_prod = read(path, **kwargs)
-
             if isinstance(new_prod, product):
-                prod_list.append(new_prod)
+                result = (new_prod, None, None)
             else:
-                log.debug(f'Unable to read {path}: The file is not a TESS or Kepler {product.__name__}.')
-
+                result = (
+                    None,
+                    logging.DEBUG,
+                    f'Unable to read {path}: The file is not a TESS or Kepler {product.__name__}.',
+                )
         except Exception as e:
-            log.warning(
-                f'Unable to read {path}: {e}. This file will not be added to the collection.'
+            result = (
+                None,
+                logging.WARNING,
+                f'Unable to read {path}: {e}. This file will not be added to the collection.',
             )
+    caught_warnings = [
+        (str(w.message), w.category, w.filename, w.lineno) for w in caught or []
+    ]
+    return result + (caught_warnings,)
+
+
+def _read_collection(path_list, product, *, stitch=False, workers=None, **kwargs):
+    """Read multiple product files into a collection.
+
+    If ``workers`` is greater than one, the files are read in parallel by a
+    pool of processes, and the products are returned in the order of ``path_list``.
+    """
+    path_list = list(path_list)
+    if workers is not None and workers > 1 and len(path_list) > 1:
+        # Send the paths to the processes in chunks to reduce the overhead
+        chunksize = max(1, len(path_list) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    _read_collection_item,
+                    path_list,
+                    repeat(product),
+                    repeat(kwargs),
+                    chunksize=chunksize,
+                )
+            )
+    else:
+        results = (
+            _read_collection_item(path, product, kwargs, capture_warnings=False)
+            for path in path_list
+        )
+
+    prod_list = []
+    registry = {}
+    for new_prod, level, message, caught_warnings in results:
+        # Warnings raised in other processes are raised again here
+        for text, category, filename, lineno in caught_warnings:
+            warnings.warn_explicit(text, category, filename, lineno, registry=registry)
+        if new_prod is not None:
+            prod_list.append(new_prod)
+        else:
+            log.log(level, message)
 
     if not prod_list:
         log.warning(
@@ -190,7 +253,7 @@ def _read_collection(path_list, product, *, stitch=False, **kwargs):
     else:
         return TargetPixelFileCollection(prod_list)
     
-def read_lc_collection(path_list, *, stitch=False, **kwargs):
+def read_lc_collection(path_list, *, stitch=False, workers=None, **kwargs):
     """Reads a list of valid Kepler or TESS light curve(s) and returns an instance of
     `~lightkurve.collections.LightCurveCollection`.
 
@@ -205,6 +268,9 @@ def read_lc_collection(path_list, *, stitch=False, **kwargs):
     stitch : bool, optional
         Whether to stitch the `~lightkurve.collections.LightCurveCollection` into a single
         `~lightkurve.lightcurve.LightCurve`.
+    workers : int, optional
+        Number of processes used to read the files in parallel.
+        By default, the files are read one after the other.
     **kwargs : dict
         Dictionary of arguments to be passed to underlying data product type specific reader.
 
@@ -214,9 +280,11 @@ def read_lc_collection(path_list, *, stitch=False, **kwargs):
                  from ``path_list`` or a single stitched `~lightkurve.lightcurve.LightCurve` if
                  parameter ``stitch=True``.
     """
-    return _read_collection(path_list, LightCurve, stitch=stitch, **kwargs)
+    return _read_collection(
+        path_list, LightCurve, stitch=stitch, workers=workers, **kwargs
+    )
 
-def read_tpf_collection(path_list, **kwargs):
+def read_tpf_collection(path_list, *, workers=None, **kwargs):
     """Reads a list of valid Kepler or TESS target pixel files (TPFs) and returns an instance of
     `~lightkurve.collections.TargetPixelFileCollection`.
 
@@ -228,6 +296,9 @@ def read_tpf_collection(path_list, **kwargs):
     ----------
     path_list : list
         List of paths to TPF FITS files. Can be a filepath, URL, or S3 URI.
+    workers : int, optional
+        Number of processes used to read the files in parallel.
+        By default, the files are read one after the other.
     **kwargs : dict
         Dictionary of arguments to be passed to underlying data product type specific reader.
 
@@ -236,4 +307,6 @@ def read_tpf_collection(path_list, **kwargs):
     collection : a `~lightkurve.collections.TargetPixelFileCollection` containing all valid TPFs
                  from ``path_list``.
     """
-    return _read_collection(path_list, TargetPixelFile, stitch=False, **kwargs)
+    return _read_collection(
+        path_list, TargetPixelFile, stitch=False, workers=workers, **kwargs
+    )
@@ -0,0 +1,223 @@
+"""Provides a function to scan the metadata of Kepler/TESS files quickly."""
+import bz2
+import gzip
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from astropy.io import fits
+from astropy.table import MaskedColumn, Table
+
+from .detect import detect_filetype
+
+log = logging.getLogger(__name__)
+
+__all__ = ["scan_products"]
+
+
+# Size of a FITS block in bytes
+BLOCK_SIZE = 2880
+
+# Columns of the table returned by `scan_products`, with their data types
+SCAN_COLUMNS = (
+    ("path", str),
+    ("filetype", str),
+    ("mission", str),
+    ("author", str),
+    ("targetid", int),
+    ("quarter", int),
+    ("campaign", int),
+    ("sector", int),
+    ("exptime", float),
+    ("ncadences", int),
+    ("ra", float),
+    ("dec", float),
+)
+
+# File types of the official data products, whose author is not the file type
+OFFICIAL_FILETYPES = (
+    "KeplerTargetPixelFile",
+    "KeplerLightCurve",
+    "TessTargetPixelFile",
+    "TessLightCurve",
+)
+
+
+def scan_products(paths, workers=None):
+    """Returns a table describing the Kepler or TESS data products in a list
+    of files, without reading their data.
+
+    Only the headers of the primary HDU and of the first extension are read,
+    i.e. only the first few blocks of each file, including for compressed
+    files.  The type of each data product is determined using
+    `detect_filetype`.  This makes it possible to index a large local
+    archive of data products quickly.
+
+    Parameters
+    ----------
+    paths : list of str
+        Paths of FITS files, which may be compressed with gzip or bzip2.
+    workers : int, optional
+        Number of processes used to scan the files in parallel.
+        By default, the files are scanned one after the other.
+
+    Returns
+    -------
+    table : `~astropy.table.Table`
+        Table with one row per file, in the order of ``paths``, and the
+        columns ``path``, ``filetype``, ``mission``, ``author``, ``targetid``,
+        ``quarter``, ``campaign``, ``sector``, ``exptime`` (the cadence in
+        seconds), ``ncadences``, ``ra`` and ``dec``.  Values which are not
+        available are masked, e.g. the ``filetype`` of files which are not
+        recognized or cannot be read.
+
+    Examples
+    --------
+    Index all the light curves in a directory::
+
+        >>> import glob
+        >>> from lightkurve.io import scan_products
+        >>> table = scan_products(glob.glob("archive/**/*.fits*", recursive=True))  # doctest: +SKIP
+        >>> table[table["sector"] == 14]  # doctest: +SKIP
+    """
+    paths = [str(path) for path in paths]
+    if workers is not None and workers > 1 and len(paths) > 1:
+        # Send the paths to the processes in chunks to reduce the overhead
+        chunksize = max(1, len(paths) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(_scan_product, paths, chunksize=chunksize))
+    else:
+        rows = [_scan_product(path) for path in paths]
+
+    table = Table()
+    for name, dtype in SCAN_COLUMNS:
+        values = [row.get(name) for row in rows]
+        mask = [value is None for value in values]
+        fill_value = dtype()
+        data = np.array(
+            [fill_value if m else value for value, m in zip(values, mask)], dtype=dtype
+        )
+        table[name] = MaskedColumn(data, mask=mask) if any(mask) else data
+    table["exptime"].unit = "s"
+    return table
+
+
+def _scan_product(path):
+    """Returns a dictionary of the metadata of one file, in which the values
+    which are not available are missing."""
+    row = {"path": path}
+    try:
+        hdulist = _read_headers(path)
+        filetype = detect_filetype(hdulist)
+    except Exception as exc:
+        log.debug("Unable to scan {}: {}".format(path, exc))
+        return row
+    if filetype is None:
+        log.debug("{} is not a recognized data product.".format(path))
+        return row
+
+    header, ext_header = hdulist[0].header, hdulist[1].header
+    row["filetype"] = filetype
+    mission = header.get("MISSION") or header.get("TELESCOP")
+    if isinstance(mission, str):
+        row["mission"] = mission.strip()
+    if filetype not in OFFICIAL_FILETYPES:
+        row["author"] = filetype
+    elif filetype.startswith("Kepler"):
+        row["author"] = "K2" if "CAMPAIGN" in header else "Kepler"
+    elif "stsci" in str(header.get("ORIGIN", "")).lower():
+        row["author"] = "TESScut"
+    else:
+        row["author"] = "SPOC"
+    for name, keywords in (
+        ("targetid", ("KEPLERID", "TICID")),
+        ("quarter", ("QUARTER",)),
+        ("campaign", ("CAMPAIGN",)),
+        ("sector", ("SECTOR",)),
+    ):
+        for keyword in keywords:
+            value = header.get(keyword)
+            if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+                row[name] = int(value)
+                break
+    for name, keyword in (("ra", "RA_OBJ"), ("dec", "DEC_OBJ")):
+        value = header.get(keyword)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            row[name] = float(value)
+    # The cadence is given in days by the TIMEDEL keyword
+    timedel = ext_header.get("TIMEDEL")
+    if isinstance(timedel, (int, float)) and not isinstance(timedel, bool):
+        row["exptime"] = round(float(timedel) * 86400, 3)
+    if ext_header.get("NAXIS", 0) >= 2:
+        row["ncadences"] = int(ext_header["NAXIS2"])
+    return row
+
+
+class _HeaderOnlyHDU(object):
+    """Minimal stand-in for an HDU whose data has not been read, providing the
+    attributes used by `detect_filetype`."""
+
+    def __init__(self, header):
+        self.header = header
+        # Like in astropy, only table extensions have columns
+        if header.get("XTENSION") in ("BINTABLE", "TABLE"):
+            self.columns = _HeaderOnlyColumns(header)
+
+
+class _HeaderOnlyColumns(object):
+    def __init__(self, header):
+        self.names = [
+            header.get("TTYPE{}".format(idx))
+            for idx in range(1, header.get("TFIELDS", 0) + 1)
+        ]
+
+
+class _HeaderOnlyHDUList(list):
+    """Minimal stand-in for an `~astropy.io.fits.HDUList` whose data have not
+    been read, providing the attributes used by `detect_filetype`."""
+
+    def __init__(self, hdus, filename):
+        super().__init__(hdus)
+        self._filename = filename
+
+    def filename(self):
+        return self._filename
+
+
+def _read_headers(path):
+    """Reads the headers of the primary HDU and of the first extension of a
+    FITS file, skipping the data of the primary HDU if there is any."""
+    with open(path, "rb") as fh:
+        magic = fh.read(3)
+    if magic[:2] == b"\x1f\x8b":
+        opener = gzip.open
+    elif magic == b"BZh":
+        opener = bz2.open
+    else:
+        opener = open
+    with opener(path, "rb") as fh:
+        header = fits.Header.fromfile(fh)
+        data_size = _data_size(header)
+        if data_size > 0:
+            # Compressed files can only be skipped by reading them
+            if opener is open:
+                fh.seek(data_size, os.SEEK_CUR)
+            else:
+                fh.read(data_size)
+        ext_header = fits.Header.fromfile(fh)
+    return _HeaderOnlyHDUList(
+        [_HeaderOnlyHDU(header), _HeaderOnlyHDU(ext_header)], filename=path
+    )
+
+
+def _data_size(header):
+    """Returns the size in bytes of the data of an HDU, including padding."""
+    naxis = header.get("NAXIS", 0)
+    if naxis == 0:
+        return 0
+    size = abs(header["BITPIX"]) // 8 * header.get("GCOUNT", 1)
+    size *= header.get("PCOUNT", 0) + int(
+        np.prod([header["NAXIS{}".format(idx)] for idx in range(1, naxis + 1)])
+    )
+    return -(-size // BLOCK_SIZE) * BLOCK_SIZE
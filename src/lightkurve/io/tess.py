@@ -6,7 +6,7 @@ from .generic import read_generic_lightcurve
 
 
 def read_tess_lightcurve(
-    filename, flux_column="pdcsap_flux", quality_bitmask="default"
+    filename, flux_column="pdcsap_flux", quality_bitmask="default", columns=None
 ):
     """Returns a TESS `~lightkurve.lightcurve.LightCurve`.
 
@@ -29,8 +29,15 @@ def read_tess_lightcurve(
               This mask is not recommended.
 
         See the `~lightkurve.utils.TessQualityFlags` class for details on the bitmasks.
+    columns : list of str, optional
+        Names of the columns to read in addition to the standard ones (time,
+        flux, flux_err, quality, cadenceno, centroid_col and centroid_row).
+        Columns which are not requested are not decoded, which makes reading
+        faster. By default, all columns are read.
     """
-    lc = read_generic_lightcurve(filename, flux_column=flux_column, time_format="btjd")
+    lc = read_generic_lightcurve(
+        filename, flux_column=flux_column, time_format="btjd", columns=columns
+    )
 
     # Filter out poor-quality data
     # NOTE: Unfortunately Astropy Table masking does not yet work for columns
@@ -28,6 +28,9 @@ from astropy.utils.masked import Masked
 from . import PACKAGEDIR, MPLSTYLE
 from .utils import (
     running_mean,
+    _running_median,
+    _running_biweight,
+    _robust_spline,
     bkjd_to_astropy_time,
     btjd_to_astropy_time,
     validate_method,
@@ -65,6 +68,144 @@ def _is_np_structured_array(data1):
     return isinstance(data1, np.ndarray) and data1.dtype.names is not None
 
 
+def _is_plain_numeric(values):
+    """Returns True if ``values`` is an unmasked numeric ndarray or Quantity."""
+    data = values.value if isinstance(values, Quantity) else values
+    return (
+        isinstance(data, np.ndarray)
+        and not isinstance(data, (np.ma.MaskedArray, Masked))
+        and data.dtype.kind in "biuf"
+    )
+
+
+def _iterative_trend(time, flux, mask, segment_filter, break_tolerance, niters, sigma):
+    """Fits the trend removed by `LightCurve.flatten`.
+
+    The light curve is split into segments at large gaps in time, and
+    ``segment_filter`` is applied to the flux of each segment. This is repeated
+    ``niters`` times, removing outliers from ``mask`` (which is modified in
+    place) after each iteration. Segments which did not lose any cadence
+    since the previous iteration are not filtered again.
+
+    Parameters
+    ----------
+    time, flux : `~numpy.ndarray`
+        Float arrays of times and fluxes.
+    mask : `~numpy.ndarray` of bool
+        Cadences used to fit the trend.
+    segment_filter : callable
+        Function returning the trend of a segment, given the indices of its
+        cadences and their fluxes.
+
+    Returns
+    -------
+    trend : `~numpy.ndarray`
+        The trend, interpolated at all times.
+    """
+    segment_trends = {}
+    for _ in range(niters):
+        index = np.flatnonzero(mask)
+        masked_time, masked_flux = time[index], flux[index]
+        # Split the lightcurve into segments by finding large gaps in time
+        dt = np.diff(masked_time)
+        with warnings.catch_warnings():  # Ignore warnings due to NaNs
+            warnings.simplefilter("ignore", RuntimeWarning)
+            cut = np.where(dt > break_tolerance * np.nanmedian(dt))[0] + 1
+        low = np.append([0], cut)
+        high = np.append(cut, len(index))
+        # Then, apply the filter to each segment separately. Cadences are only
+        # ever removed from the mask, so a segment with the same first and last
+        # cadence and the same length as before is unchanged.
+        trend = np.zeros(len(index))
+        previous_trends, segment_trends = segment_trends, {}
+        for l, h in zip(low, high):
+            key = (index[l], index[h - 1], h - l) if h > l else None
+            segment_trend = previous_trends.get(key)
+            if segment_trend is None:
+                segment_trend = segment_filter(index[l:h], masked_flux[l:h])
+            trend[l:h] = segment_trend
+            segment_trends[key] = segment_trend
+        # Ignore outliers; note we add `1e-14` below to avoid detecting
+        # outliers which are merely caused by numerical noise.
+        residual = masked_flux - trend
+        inliers = np.nan_to_num(np.abs(residual)) < (np.nanstd(residual) * sigma + 1e-14)
+        fit_time, fit_trend = masked_time[inliers], trend[inliers]
+        mask[index] &= inliers
+    return interp1d(fit_time, fit_trend, fill_value="extrapolate")(time)
+
+
+class _TimeBinner:
+    """Aggregates columns into time bins using `np.bincount`.
+
+    Rows are assigned to bins following the conventions of AstroPy's
+    `~astropy.timeseries.aggregate_downsample`: a bin includes its start
+    and end time, a time equal to both the end of a bin and the start of
+    the next one belongs to the next bin, and rows outside of all bins are
+    ignored.
+    """
+
+    def __init__(self, time, bin_start, bin_end):
+        rel_base = time[0] if len(time) else bin_start[0]
+        rel_time = (time - rel_base).to_value(format="sec", subfmt="long")
+        rel_bin_start = np.atleast_1d(
+            (bin_start - rel_base).to_value(format="sec", subfmt="long")
+        )
+        rel_bin_end = np.atleast_1d(
+            (bin_end - rel_base).to_value(format="sec", subfmt="long")
+        )
+        self.n_bins = len(rel_bin_start)
+        if np.all(rel_bin_start[1:] >= rel_bin_end[:-1]):
+            index = np.searchsorted(rel_bin_start, rel_time, side="right") - 1
+        else:
+            # Overlapping bins: rows go to the first bin ending after them
+            index = np.searchsorted(rel_bin_end, rel_time, side="left")
+        index = np.clip(index, 0, self.n_bins - 1)
+        # Rows before the first bin, after the last bin, or in gaps between
+        # bins are discarded; NaN times fail the comparisons as well
+        self.keep = (rel_time >= rel_bin_start[index]) & (rel_time <= rel_bin_end[index])
+        self.index = index[self.keep]
+        self.counts = self._sum(np.ones(len(self.index)))
+
+    def _sum(self, weights):
+        return np.bincount(self.index, weights=weights, minlength=self.n_bins)
+
+    def _nansum_and_count(self, values):
+        isnan = np.isnan(values)
+        return self._sum(np.where(isnan, 0.0, values)), self._sum(~isnan)
+
+    def _values(self, column):
+        values = column.value if isinstance(column, Quantity) else np.asarray(column)
+        return values[self.keep].astype(float)
+
+    def _wrap(self, result, column):
+        """Returns ``result`` with the type aggregate_downsample would return."""
+        if isinstance(column, Quantity):
+            return Quantity(result, unit=column.unit, copy=False)
+        data = np.ma.zeros(self.n_bins, dtype=column.dtype)
+        data.mask = True
+        nonempty = self.counts > 0
+        data[nonempty] = result[nonempty]
+        return data
+
+    def rmse(self, column):
+        """Root-sum-square of ``column`` divided by the number of points in each bin."""
+        values = self._values(column)
+        total, count = self._nansum_and_count(values ** 2)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = np.sqrt(total) / self.counts
+        result[count == 0] = np.nan
+        return self._wrap(result, column)
+
+    def std(self, column):
+        """NaN-ignoring standard deviation of ``column`` in each bin."""
+        values = self._values(column)
+        total, count = self._nansum_and_count(values)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / count
+            residuals, _ = self._nansum_and_count((values - mean[self.index]) ** 2)
+            return self._wrap(np.sqrt(residuals / count), column)
+
+
 class LightCurve(TimeSeries):
     """
     Subclass of AstroPy `~astropy.table.Table` guaranteed to have *time*, *flux*, and *flux_err* columns.
@@ -828,20 +969,26 @@ class LightCurve(TimeSeries):
         niters=3,
         sigma=3,
         mask=None,
+        method="savgol",
         **kwargs,
     ):
         """Removes the low frequency trend using scipy's Savitzky-Golay filter.
 
-        This method wraps `scipy.signal.savgol_filter`.
+        By default, this method wraps `scipy.signal.savgol_filter`.
+        Alternative filters which are more robust against outliers can be
+        selected using the ``method`` parameter.
 
         Parameters
         ----------
-        window_length : int
+        window_length : int or `~astropy.units.Quantity`
             The length of the filter window (i.e. the number of coefficients).
             ``window_length`` must be a positive odd integer.
+            For the "median", "biweight", and "spline" methods, the window
+            may also be specified as a duration (e.g. ``0.5*u.day``), which
+            allows the same value to be used for data with different cadences.
         polyorder : int
             The order of the polynomial used to fit the samples. ``polyorder``
-            must be less than window_length.
+            must be less than window_length.  Only used by the "savgol" method.
         return_trend : bool
             If `True`, the method will return a tuple of two elements
             (flattened_lc, trend_lc) where trend_lc is the removed trend.
@@ -861,6 +1008,15 @@ class LightCurve(TimeSeries):
             mask is True will not be used to flatten the data. An interpolated
             result will be provided for these points. Use this mask to remove
             data you want to preserve, e.g. transits.
+        method : str
+            The filter used to estimate the trend, one of:
+
+            * "savgol": Savitzky-Golay filter (the default);
+            * "median": running median;
+            * "biweight": running Tukey biweight location, which is robust
+              against outliers while being more efficient than the median;
+            * "spline": cubic spline with knots spaced by ``window_length``,
+              iteratively refitted without outliers.
         **kwargs : dict
             Dictionary of arguments to be passed to `scipy.signal.savgol_filter`.
 
@@ -872,74 +1028,95 @@ class LightCurve(TimeSeries):
         trend_lc : `LightCurve`
             New light curve object containing the trend that was removed.
         """
+        method = validate_method(
+            method, supported_methods=["savgol", "median", "biweight", "spline"]
+        )
         if mask is None:
             mask = np.ones(len(self.time), dtype=bool)
         else:
             # Deep copy ensures we don't change the original.
             mask = deepcopy(~mask)
-        # Add NaNs & outliers to the mask
-        extra_mask = np.isfinite(self.flux)
-        extra_mask &= np.nan_to_num(np.abs(self.flux - np.nanmedian(self.flux))) <= (
-            np.nanstd(self.flux) * sigma
-        )
-        # In astropy>=5.0, extra_mask is a masked array
-        if hasattr(extra_mask, 'mask'):
-            mask &= extra_mask.filled(False)
-        else:  # support astropy<5.0
-            mask &= extra_mask
-
-        for iter in np.arange(0, niters):
-            if break_tolerance is None:
-                break_tolerance = np.nan
+        if break_tolerance is None:
+            break_tolerance = np.nan
+        if method == "savgol":
+            if isinstance(window_length, Quantity):
+                raise ValueError(
+                    "`window_length` must be a number of cadences "
+                    "for the 'savgol' method."
+                )
             if polyorder >= window_length:
                 polyorder = window_length - 1
                 log.warning(
                     "polyorder must be smaller than window_length, "
                     "using polyorder={}.".format(polyorder)
                 )
-            # Split the lightcurve into segments by finding large gaps in time
-            dt = self.time.value[mask][1:] - self.time.value[mask][0:-1]
-            with warnings.catch_warnings():  # Ignore warnings due to NaNs
-                warnings.simplefilter("ignore", RuntimeWarning)
-                cut = np.where(dt > break_tolerance * np.nanmedian(dt))[0] + 1
-            low = np.append([0], cut)
-            high = np.append(cut, len(self.time[mask]))
-            # Then, apply the savgol_filter to each segment separately
-            trend_signal = Quantity(np.zeros(len(self.time[mask])), unit=self.flux.unit)
-            for l, h in zip(low, high):
-                # Reduce `window_length` and `polyorder` for short segments;
-                # this prevents `savgol_filter` from raising an exception
-                # If the segment is too short, just take the median
-                if np.any([window_length > (h - l), (h - l) < break_tolerance]):
-                    trend_signal[l:h] = np.nanmedian(self.flux[mask][l:h])
-                else:
-                    # Scipy outputs a warning here that is not useful, will be fixed in version 1.2
-                    with warnings.catch_warnings():
-                        warnings.simplefilter("ignore", FutureWarning)
-                        trsig = savgol_filter(
-                            x=self.flux.value[mask][l:h],
-                            window_length=window_length,
-                            polyorder=polyorder,
-                            **kwargs,
-                        )
-                        trend_signal[l:h] = Quantity(trsig, trend_signal.unit)
-            # Ignore outliers; note we add `1e-14` below to avoid detecting
-            # outliers which are merely caused by numerical noise.
-            mask1 = np.nan_to_num(np.abs(self.flux[mask] - trend_signal)) < (
-                np.nanstd(self.flux[mask] - trend_signal) * sigma
-                + Quantity(1e-14, self.flux.unit)
-            )
-            f = interp1d(
-                self.time.value[mask][mask1],
-                trend_signal[mask1],
-                fill_value="extrapolate",
+
+        # Work on plain float arrays, with masked values set to NaN
+        flux = self.flux.value
+        if isinstance(flux, Masked):
+            flux = flux.filled(np.nan)
+        flux = np.asarray(flux, dtype=float)
+        time = np.asarray(self.time.value, dtype=float)
+
+        # Add NaNs & outliers to the mask
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mask &= np.isfinite(flux)
+            mask &= np.nan_to_num(np.abs(flux - np.nanmedian(flux))) <= (
+                np.nanstd(flux) * sigma
             )
-            trend_signal = Quantity(f(self.time.value), self.flux.unit)
-            # In astropy>=5.0, mask1 is a masked array
-            if hasattr(mask1, 'mask'):
-                mask[mask] &= mask1.filled(False)
-            else:  # support astropy<5.0
-                mask[mask] &= mask1
+
+        def savgol_segment(segment_index, segment_flux):
+            # Reduce `window_length` and `polyorder` for short segments;
+            # this prevents `savgol_filter` from raising an exception
+            # If the segment is too short, just take the median
+            if np.any([window_length > len(segment_flux), len(segment_flux) < break_tolerance]):
+                return np.full(len(segment_flux), np.nanmedian(segment_flux))
+            # Scipy outputs a warning here that is not useful, will be fixed in version 1.2
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", FutureWarning)
+                return savgol_filter(
+                    x=segment_flux,
+                    window_length=window_length,
+                    polyorder=polyorder,
+                    **kwargs,
+                )
+
+        # The other filters operate on windows in time or in cadences
+        if isinstance(window_length, Quantity):
+            window_time = (self.time - self.time[0]).to_value(u.day)
+            window = window_length.to_value(u.day)
+        else:
+            window_time = None
+            window = window_length
+        robust_filter = {
+            "median": lambda x, y: _running_median(x, y, window / 2),
+            "biweight": lambda x, y: _running_biweight(x, y, window / 2),
+            "spline": lambda x, y: _robust_spline(x, y, window, sigma=sigma),
+        }.get(method)
+
+        def robust_segment(segment_index, segment_flux):
+            if window_time is None:
+                x = np.arange(len(segment_flux), dtype=float)
+            else:
+                x = window_time[segment_index]
+            order = np.argsort(x, kind="stable")
+            trend = np.empty(len(segment_flux))
+            trend[order] = robust_filter(x[order], segment_flux[order])
+            return trend
+
+        trend_signal = Quantity(
+            _iterative_trend(
+                time,
+                flux,
+                mask,
+                segment_filter=savgol_segment if method == "savgol" else robust_segment,
+                break_tolerance=break_tolerance,
+                niters=niters,
+                sigma=sigma,
+            ),
+            self.flux.unit,
+        )
 
         flatten_lc = self.copy()
         with warnings.catch_warnings():
@@ -1559,44 +1736,51 @@ class LightCurve(TimeSeries):
         elif not isinstance(time_bin_size, Quantity):
             time_bin_size *= u.day
 
-        # Call AstroPy's aggregate_downsample
+        downsample_kwargs = dict(
+            time_bin_size=time_bin_size,
+            n_bins=n_bins,
+            time_bin_start=time_bin_start,
+            **kwargs
+        )
         with warnings.catch_warnings():
             # ignore uninteresting empty slice warnings
             warnings.simplefilter("ignore", (RuntimeWarning, AstropyUserWarning))
+            # Call AstroPy's aggregate_downsample
             ts = aggregate_downsample(
-                self,
-                time_bin_size=time_bin_size,
-                n_bins=n_bins,
-                time_bin_start=time_bin_start,
-                aggregate_func=aggregate_func,
-                **kwargs
+                self, aggregate_func=aggregate_func, **downsample_kwargs
             )
+            # The uncertainties are aggregated with `np.bincount` in the bins
+            # laid out by aggregate_downsample, which would otherwise call
+            # a Python function for every bin
+            binner = _TimeBinner(self.time, ts.time_bin_start, ts.time_bin_end)
 
             # If `flux_err` is populated, assume the errors combine as the root-mean-square
             if np.any(np.isfinite(self.flux_err)):
-                rmse_func = (
-                    lambda x: np.sqrt(np.nansum(x ** 2)) / len(np.atleast_1d(x))
-                    if np.any(np.isfinite(x))
-                    else np.nan
-                )
-                ts_err = aggregate_downsample(
-                    self,
-                    time_bin_size=time_bin_size,
-                    n_bins=n_bins,
-                    time_bin_start=time_bin_start,
-                    aggregate_func=rmse_func,
-                )
-                ts["flux_err"] = ts_err["flux_err"]
+                if _is_plain_numeric(self.flux_err):
+                    ts["flux_err"] = binner.rmse(self.flux_err)
+                else:
+                    rmse_func = (
+                        lambda x: np.sqrt(np.nansum(x ** 2)) / len(np.atleast_1d(x))
+                        if np.any(np.isfinite(x))
+                        else np.nan
+                    )
+                    ts_err = aggregate_downsample(
+                        TimeSeries(time=self.time.copy(), data={"flux_err": self.flux_err}),
+                        aggregate_func=rmse_func,
+                        **downsample_kwargs
+                    )
+                    ts["flux_err"] = ts_err["flux_err"]
             # If `flux_err` is unavailable, populate `flux_err` as nanstd(flux)
             else:
-                ts_err = aggregate_downsample(
-                    self,
-                    time_bin_size=time_bin_size,
-                    n_bins=n_bins,
-                    time_bin_start=time_bin_start,
-                    aggregate_func=np.nanstd,
-                )
-                ts["flux_err"] = ts_err["flux"]
+                if _is_plain_numeric(self.flux):
+                    ts["flux_err"] = binner.std(self.flux)
+                else:
+                    ts_err = aggregate_downsample(
+                        TimeSeries(time=self.time.copy(), data={"flux": self.flux}),
+                        aggregate_func=np.nanstd,
+                        **downsample_kwargs
+                    )
+                    ts["flux_err"] = ts_err["flux"]
 
         # Prepare a LightCurve object by ensuring there is a time column
         ts._required_columns = []
@@ -2,13 +2,16 @@
 from __future__ import division, print_function
 
 import copy
+import functools
 import logging
 import math
 import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from matplotlib import pyplot as plt
+from scipy.sparse import csr_matrix
 
 import astropy
 from astropy.table import Table
@@ -30,6 +33,315 @@ log = logging.getLogger(__name__)
 __all__ = ["Periodogram", "LombScarglePeriodogram", "BoxLeastSquaresPeriodogram"]
 
 
+class _RegularFrequencyGrid(object):
+    """Evenly spaced frequencies ``f0 + df * arange(n)`` in units of ``unit``,
+    which are only computed when they are needed.
+
+    Slicing the grid returns another grid, whereas other indices return the
+    frequencies as a `~astropy.units.Quantity`.
+    """
+
+    def __init__(self, f0, df, n, unit):
+        self.f0 = float(f0)
+        self.df = float(df)
+        self.n = int(n)
+        self.unit = u.Unit(unit)
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def shape(self):
+        return (self.n,)
+
+    def values(self, idx=None):
+        """Returns the frequencies at the indices ``idx``, or all of them,
+        as an array of values in units of ``unit``."""
+        if idx is None:
+            idx = np.arange(self.n)
+        return self.f0 + self.df * idx
+
+    def to_quantity(self):
+        return u.Quantity(self.values(), self.unit)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.n)
+            return _RegularFrequencyGrid(
+                self.f0 + start * self.df,
+                self.df * step,
+                len(range(start, stop, step)),
+                self.unit,
+            )
+        if isinstance(key, (int, np.integer)):
+            if not -self.n <= key < self.n:
+                raise IndexError(
+                    "index {} is out of bounds for a grid of {} frequencies".format(
+                        key, self.n
+                    )
+                )
+            return u.Quantity(self.values(key % self.n), self.unit)
+        return u.Quantity(self.values(np.arange(self.n)[key]), self.unit)
+
+
+def _logmedian_smooth(frequency, power, filter_width):
+    """Returns the power spectrum smoothed by the 'logmedian' method of
+    `Periodogram.smooth`, i.e. the average of the medians of the windows of
+    half-width ``filter_width`` in log10(frequency) which contain each
+    frequency, where the windows are centered every 0.5 * ``filter_width``.
+
+    The frequencies must be sorted in increasing order.  Each frequency
+    belongs to about four windows, whose index ranges are found using
+    `numpy.searchsorted`, so the computation takes a time which is linear in
+    the number of frequencies.  If ``frequency`` is a `_RegularFrequencyGrid`,
+    the index ranges are computed from the grid, without computing the
+    logarithm of every frequency.
+    """
+    n_frequencies = len(power)
+    if isinstance(frequency, _RegularFrequencyGrid):
+
+        def log_frequency_at(idx):
+            return np.log10(frequency.values(idx))
+
+        def searchsorted(log_values, side):
+            # Approximate indices, which are corrected below
+            position = (10 ** log_values - frequency.f0) / frequency.df
+            if side == "left":
+                idx = np.ceil(position)
+            else:
+                idx = np.floor(position) + 1
+            return np.clip(idx, 0, n_frequencies).astype(int)
+
+    else:
+        log_frequency = np.log10(frequency)
+
+        def log_frequency_at(idx):
+            return log_frequency[idx]
+
+        def searchsorted(log_values, side):
+            return np.searchsorted(log_frequency, log_values, side=side)
+
+    # The window centers are accumulated step by step, as in the original
+    # implementation of this method, to select exactly the same frequencies.
+    centers = []
+    x0 = log_frequency_at(0)
+    while x0 < log_frequency_at(n_frequencies - 1):
+        centers.append(x0)
+        x0 += 0.5 * filter_width
+    centers = np.asarray(centers, dtype=float)
+
+    def in_window(idx):
+        valid = (idx >= 0) & (idx < n_frequencies)
+        idx = np.clip(idx, 0, n_frequencies - 1)
+        return valid & (np.abs(log_frequency_at(idx) - centers) < filter_width)
+
+    # Window `k` contains the frequencies `lo[k]:hi[k]`; the bounds are then
+    # corrected for rounding errors, which can move them by one index
+    lo = searchsorted(centers - filter_width, side="right")
+    hi = searchsorted(centers + filter_width, side="left")
+    lo = np.where(in_window(lo - 1), lo - 1, lo)
+    lo = np.where((lo < hi) & ~in_window(lo), lo + 1, lo)
+    hi = np.where(in_window(hi), hi + 1, hi)
+    hi = np.where((hi > lo) & ~in_window(hi - 1), hi - 1, hi)
+
+    nonempty = hi > lo
+    lo, hi = lo[nonempty], hi[nonempty]
+    corr_factor = (8.0 / 9.0) ** 3
+    medians = np.array(
+        [np.nanmedian(power[start:stop]) for start, stop in zip(lo, hi)]
+    ) / corr_factor
+
+    # Sum the medians of the windows containing each frequency, using the
+    # cumulative sum of the changes at the window bounds.  The medians which
+    # are not finite, e.g. of windows without valid power, cannot be removed
+    # from the cumulative sum and are added to their windows directly.
+    # The arrays are updated in place to limit the memory used by large spectra.
+    finite = np.isfinite(medians)
+    total = np.zeros(n_frequencies + 1)
+    np.add.at(total, lo[finite], medians[finite])
+    np.add.at(total, hi[finite], -medians[finite])
+    total = np.cumsum(total, out=total)[:-1]
+    for start, stop, median in zip(lo[~finite], hi[~finite], medians[~finite]):
+        total[start:stop] += median
+    count = np.zeros(n_frequencies + 1, dtype=np.int32)
+    np.add.at(count, lo, 1)
+    np.add.at(count, hi, -1)
+    total /= np.cumsum(count, out=count)[:-1]
+    return total
+
+
+def _extirpolation_matrix(x, n_grid, n_points=4):
+    """Returns the sparse matrix of shape ``(n_grid, len(x))`` which
+    extirpolates values at the positions ``x`` onto the integer grid
+    ``range(n_grid)``, using the Lagrange polynomial weights of the
+    ``n_points`` nearest grid points.
+
+    This is the extirpolation of Press & Rybicki (1989) used by the 'fast'
+    method of `~astropy.timeseries.LombScargle`.  As a matrix, it can be
+    computed once for a set of times and applied to many light curves.
+    """
+    first = np.clip((x - n_points // 2).astype(int), 0, n_grid - n_points)
+    nodes = first[:, np.newaxis] + np.arange(n_points)
+    distance = x[:, np.newaxis] - nodes
+    weights = np.ones_like(distance)
+    for j in range(n_points):
+        for k in range(n_points):
+            if k != j:
+                weights[:, j] *= distance[:, k] / (j - k)
+    columns = np.repeat(np.arange(len(x)), n_points)
+    return csr_matrix(
+        (weights.ravel(), (nodes.ravel(), columns)), shape=(n_grid, len(x))
+    )
+
+
+# Number of frequencies for which the 'nufft' Lomb-Scargle method computes the
+# power at once, which bounds the memory it uses
+NUFFT_CHUNK_SIZE = 2 ** 18
+
+
+@functools.lru_cache(maxsize=None)
+def _get_finufft():
+    """Returns the ``finufft`` module, or `None` if it is not installed."""
+    try:
+        import finufft
+    except ImportError:
+        return None
+    return finufft
+
+
+def _trig_sums_function(
+    t, df, n_frequencies, use_finufft=False, oversampling=5, n_points=4
+):
+    """Returns a function ``trig_sums(h, f0)`` computing the sums
+    ``S = sum(h * sin(2 pi f t))`` and ``C = sum(h * cos(2 pi f t))`` over the
+    times ``t``, for each column of the 2D array ``h`` and the frequencies
+    ``f = f0 + df * arange(n_frequencies)``, as arrays of shape
+    ``(n_frequencies, h.shape[1])``.
+
+    The sums are computed using a non-uniform FFT of type 1, which is done
+    by the ``finufft`` package if ``use_finufft`` is True.  Otherwise, the sums
+    are approximated using the FFT of the values extirpolated onto a grid
+    oversampled by ``oversampling`` using ``n_points`` points, like
+    `astropy.timeseries.LombScargle` does for a single light curve.  The
+    parts which only depend on the times are computed once, so that the
+    function can be called for many columns or many ranges of frequencies.
+    """
+    t0 = t.min()
+    if use_finufft:
+        finufft = _get_finufft()
+        x = (2 * np.pi * df * (t - t0)) % (2 * np.pi)
+        # finufft returns the modes -n_frequencies // 2 and above
+        shift = np.exp(1j * (n_frequencies // 2) * x)
+    else:
+        n_grid = 1 << int(n_frequencies * oversampling - 1).bit_length()
+        tnorm = ((t - t0) * n_grid * df) % n_grid
+        matrix = _extirpolation_matrix(tnorm, n_grid, n_points)
+
+    def trig_sums(h, f0):
+        if use_finufft:
+            h = h * (np.exp(2j * np.pi * f0 * (t - t0)) * shift)[:, np.newaxis]
+            fftgrid = finufft.nufft1d1(
+                x, np.ascontiguousarray(h.T), n_frequencies, eps=1e-12, isign=1
+            ).T
+        else:
+            if f0 > 0:
+                h = h * np.exp(2j * np.pi * f0 * (t - t0))[:, np.newaxis]
+            grid = matrix @ h
+            if f0 > 0:
+                fftgrid = np.fft.ifft(grid, axis=0)[:n_frequencies] * n_grid
+            else:
+                fftgrid = np.conjugate(np.fft.rfft(grid, axis=0)[:n_frequencies])
+        if t0 != 0:
+            f = f0 + df * np.arange(n_frequencies)
+            fftgrid *= np.exp(2j * np.pi * t0 * f)[:, np.newaxis]
+        return fftgrid.imag, fftgrid.real
+
+    return trig_sums
+
+
+def _lombscargle_power(t, y, weights, f0, df, n_frequencies):
+    """Returns the floating-mean Lomb-Scargle power, with the 'psd'
+    normalization of `~astropy.timeseries.LombScargle`, of each column of
+    ``y`` sampled at the times ``t``, for the frequencies
+    ``f0 + df * arange(n_frequencies)``.
+
+    ``weights`` has the shape of ``y`` and is one for the valid values and
+    zero for the missing ones, which are thereby ignored.  This follows the
+    'fast' method of `~astropy.timeseries.LombScargle` (Press & Rybicki 1989;
+    Zechmeister & Kurster 2009), but shares the trigonometric sums between
+    all the columns.
+
+    The power is computed for ``NUFFT_CHUNK_SIZE`` frequencies at a time,
+    which bounds the memory used by the FFTs independently of the number of
+    frequencies.  The trigonometric sums are computed by ``finufft`` if it is
+    installed, and otherwise using an extirpolation fine enough to match the
+    exact power to about 1e-7.
+    """
+    n_valid = weights.sum(axis=0)
+    w = weights / n_valid
+    y = y - (w * y).sum(axis=0)
+    n_columns = y.shape[1]
+    h = np.hstack([w * y, w])
+
+    chunk_size = min(NUFFT_CHUNK_SIZE, n_frequencies)
+    options = dict(use_finufft=_get_finufft() is not None, oversampling=10, n_points=8)
+    trig_sums = _trig_sums_function(t, df, chunk_size, **options)
+    trig_sums2 = _trig_sums_function(t, 2 * df, chunk_size, **options)
+
+    power = np.empty((n_frequencies, n_columns))
+    for start in range(0, n_frequencies, chunk_size):
+        stop = min(start + chunk_size, n_frequencies)
+        chunk_f0 = f0 + start * df
+        S, C = trig_sums(h, chunk_f0)
+        Sh, Ch = S[: stop - start, :n_columns], C[: stop - start, :n_columns]
+        S, C = S[: stop - start, n_columns:], C[: stop - start, n_columns:]
+        S2, C2 = trig_sums2(w, 2 * chunk_f0)
+        S2, C2 = S2[: stop - start], C2[: stop - start]
+
+        tan_2omega_tau = (S2 - 2 * S * C) / (C2 - (C * C - S * S))
+        S2w = tan_2omega_tau / np.sqrt(1 + tan_2omega_tau * tan_2omega_tau)
+        C2w = 1 / np.sqrt(1 + tan_2omega_tau * tan_2omega_tau)
+        Cw = np.sqrt(0.5) * np.sqrt(1 + C2w)
+        Sw = np.sqrt(0.5) * np.sign(S2w) * np.sqrt(1 - C2w)
+
+        YC = Ch * Cw + Sh * Sw
+        YS = Sh * Cw - Ch * Sw
+        CC = 0.5 * (1 + C2 * C2w + S2 * S2w) - (C * Cw + S * Sw) ** 2
+        SS = 0.5 * (1 - C2 * C2w - S2 * S2w) - (S * Cw - C * Sw) ** 2
+        power[start:stop] = YC * YC / CC + YS * YS / SS
+    return power * 0.5 * n_valid
+
+
+# Number of chunks of the period grid per worker of a parallel BLS search,
+# which balances the load since the longer periods take longer to evaluate
+BLS_CHUNKS_PER_WORKER = 4
+
+
+def _bls_power(bls, period, duration, max_workers=1, **kwargs):
+    """Returns `BoxLeastSquares.power` evaluated for the periods ``period``,
+    which are split into chunks evaluated by ``max_workers`` threads.
+
+    The 'fast' implementation of AstroPy releases the GIL, so the chunks are
+    evaluated in parallel, and the results of the chunks are identical to those
+    of the whole grid because the reference time and flux do not depend on the
+    periods.
+    """
+    n_chunks = min(len(period), BLS_CHUNKS_PER_WORKER * max_workers)
+    if max_workers <= 1 or n_chunks <= 1:
+        return bls.power(period, duration, **kwargs)
+
+    def power(chunk):
+        return bls.power(chunk, duration, **kwargs)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(power, np.array_split(period, n_chunks)))
+    merged = copy.copy(results[0])
+    for key, value in merged.items():
+        if key != "objective":
+            merged[key] = np.concatenate([result[key] for result in results])
+    return merged
+
+
 class Periodogram(object):
     """Generic class to represent a power spectrum (frequency vs power data).
 
@@ -58,9 +370,6 @@ class Periodogram(object):
         Free-form metadata associated with the Periodogram.
     """
 
-    frequency = None
-    """The array of frequency values."""
-
     power = None
     """The array of power values."""
 
@@ -75,13 +384,13 @@ class Periodogram(object):
         meta={},
     ):
         # Input validation
-        if not isinstance(frequency, u.quantity.Quantity):
+        if not isinstance(frequency, (u.quantity.Quantity, _RegularFrequencyGrid)):
             raise ValueError("frequency must be an `astropy.units.Quantity` object.")
         if not isinstance(power, u.quantity.Quantity):
             raise ValueError("power must be an `astropy.units.Quantity` object.")
         # Frequency must have frequency units
         try:
-            frequency.to(u.Hz)
+            frequency.unit.to(u.Hz)
         except u.UnitConversionError:
             raise ValueError("Frequency must be in units of 1/time.")
         # Frequency and power must have sensible shapes
@@ -106,6 +415,41 @@ class Periodogram(object):
             view = self.default_view
         return validate_method(view, ["frequency", "period"])
 
+    @property
+    def frequency(self):
+        """The array of frequency values."""
+        if isinstance(self._frequency, _RegularFrequencyGrid):
+            return self._frequency.to_quantity()
+        return self._frequency
+
+    @frequency.setter
+    def frequency(self, frequency):
+        self._frequency = frequency
+
+    def _new_like(self, frequency=None, power=None):
+        """Returns a copy of the periodogram with the given ``frequency`` and
+        ``power``, which are not copied, and copies of the other attributes.
+
+        This avoids copying the power spectrum of the original periodogram,
+        only to replace it, in the methods which return a new periodogram.
+        """
+        new = copy.copy(self)
+        memo = {}
+        if frequency is not None:
+            memo[id(self._frequency)] = frequency
+        if power is not None:
+            memo[id(self.power)] = power
+        new.__dict__ = copy.deepcopy(self.__dict__, memo)
+        return new
+
+    def _power_quantity(self, power):
+        """Returns ``power`` in the unit of ``self.power``, keeping the single
+        precision of a compact periodogram (see `compact`)."""
+        dtype = np.result_type(self.power.dtype, np.float32)
+        return u.Quantity(
+            np.asarray(power).astype(dtype, copy=False), self.power.unit, copy=False
+        )
+
     def _is_evenly_spaced(self):
         """Returns true if the values in ``frequency`` are evenly spaced.
 
@@ -113,6 +457,8 @@ class Periodogram(object):
         ``estimate_numax()``, and ``estimate_deltanu()``, require a grid of
         evenly-spaced frequencies.
         """
+        if isinstance(self._frequency, _RegularFrequencyGrid):
+            return True
         # verify that the first differences are all equal
         freqdiff = np.diff(self.frequency.value)
         if np.allclose(freqdiff[0], freqdiff):
@@ -132,7 +478,7 @@ class Periodogram(object):
     @property
     def frequency_at_max_power(self):
         """Frequency value corresponding to the highest peak in the periodogram."""
-        return self.frequency[np.nanargmax(self.power)]
+        return self._frequency[np.nanargmax(self.power)]
 
     @property
     def period_at_max_power(self):
@@ -174,10 +520,7 @@ class Periodogram(object):
                 self.power[: m * binsize].reshape((m, binsize)), axis=1
             )
 
-        binned_pg = self.copy()
-        binned_pg.frequency = binned_freq
-        binned_pg.power = binned_power
-        return binned_pg
+        return self._new_like(frequency=binned_freq, power=binned_power)
 
     def smooth(self, method="boxkernel", filter_width=0.1):
         """Smooths the power spectrum using the 'boxkernel' or 'logmedian' method.
@@ -255,12 +598,13 @@ class Periodogram(object):
                     "to have a grid of evenly spaced frequencies."
                 )
 
-            fs = np.mean(np.diff(self.frequency))
+            if isinstance(self._frequency, _RegularFrequencyGrid):
+                fs = u.Quantity(self._frequency.df, self.frequency.unit)
+            else:
+                fs = np.mean(np.diff(self.frequency))
             box_kernel = Box1DKernel(math.ceil((filter_width / fs).value))
             smooth_power = convolve(self.power.value, box_kernel)
-            smooth_pg = self.copy()
-            smooth_pg.power = u.Quantity(smooth_power, self.power.unit)
-            return smooth_pg
+            return self._new_like(power=self._power_quantity(smooth_power))
 
         if method == "logmedian":
             if isinstance(filter_width, astropy.units.quantity.Quantity):
@@ -268,20 +612,12 @@ class Periodogram(object):
                     "the 'logmedian' method requires a dimensionless "
                     "value for `filter_width` in log10(frequency) space."
                 )
-            count = np.zeros(len(self.frequency.value), dtype=int)
-            bkg = np.zeros_like(self.frequency.value)
-            x0 = np.log10(self.frequency[0].value)
-            corr_factor = (8.0 / 9.0) ** 3
-            while x0 < np.log10(self.frequency[-1].value):
-                m = np.abs(np.log10(self.frequency.value) - x0) < filter_width
-                if len(bkg[m] > 0):
-                    bkg[m] += np.nanmedian(self.power[m].value) / corr_factor
-                    count[m] += 1
-                x0 += 0.5 * filter_width
-            bkg /= count
-            smooth_pg = self.copy()
-            smooth_pg.power = u.Quantity(bkg, self.power.unit)
-            return smooth_pg
+            if isinstance(self._frequency, _RegularFrequencyGrid):
+                frequency = self._frequency
+            else:
+                frequency = self.frequency.value
+            bkg = _logmedian_smooth(frequency, self.power.value, filter_width)
+            return self._new_like(power=self._power_quantity(bkg))
 
     def plot(
         self,
@@ -415,10 +751,9 @@ class Periodogram(object):
             returned if `return_trend = True`.
         """
         bkg = self.smooth(method=method, filter_width=filter_width)
-        snr_pg = self / bkg.power
         snr = SNRPeriodogram(
-            snr_pg.frequency,
-            snr_pg.power,
+            copy.deepcopy(self._frequency),
+            self.power / bkg.power,
             nyquist=self.nyquist,
             targetid=self.targetid,
             label=self.label,
@@ -455,19 +790,77 @@ class Periodogram(object):
         """
         return copy.deepcopy(self)
 
+    def compact(self, dtype=None, filename=None):
+        """Reduces the memory used by the Periodogram, in place.
+
+        The evenly-spaced frequencies are replaced by their first value and
+        spacing, from which they are only computed when they are needed.
+        The power values can also be stored in a smaller data type, and in a
+        memory-mapped ``.npy`` file rather than in memory.  This makes it
+        possible to handle periodograms with many millions of frequencies,
+        e.g. of the long-cadence light curves of many sectors or quarters.
+
+        Slicing a compact periodogram returns a compact periodogram which
+        shares the power values of the original, and `smooth` and `flatten`
+        do not compute the frequency array.
+
+        Parameters
+        ----------
+        dtype : str or `numpy.dtype`, optional
+            Data type of the power values, e.g. ``"float32"``, which halves the
+            memory used by the default ``"float64"``.  By default, the data type
+            is not changed.
+        filename : str, optional
+            Path of a ``.npy`` file in which the power values are stored, and
+            which is then mapped in memory.  The file is overwritten if it
+            already exists.
+
+        Returns
+        -------
+        pg : `Periodogram`
+            The same Periodogram object, for convenience.
+
+        Raises
+        ------
+        ValueError
+            If the frequencies are not evenly spaced.
+        """
+        if not isinstance(self._frequency, _RegularFrequencyGrid):
+            if not self._is_evenly_spaced():
+                raise ValueError(
+                    "only a periodogram with evenly-spaced frequencies can be compacted."
+                )
+            frequency = self._frequency
+            n_frequencies = len(frequency)
+            f0 = frequency[0].value
+            df = (frequency[-1].value - f0) / (n_frequencies - 1)
+            self._frequency = _RegularFrequencyGrid(
+                f0, df, n_frequencies, frequency.unit
+            )
+
+        power = self.power.value
+        if dtype is None:
+            dtype = power.dtype
+        if filename is not None:
+            stored = np.lib.format.open_memmap(
+                filename, mode="w+", dtype=dtype, shape=power.shape
+            )
+            stored[:] = power
+            stored.flush()
+            power = stored
+        else:
+            power = power.astype(dtype, copy=False)
+        self.power = u.Quantity(power, self.power.unit, copy=False)
+        return self
+
     def __repr__(self):
         return "Periodogram(ID: {})".format(self.label)
 
     def __getitem__(self, key):
-        copy_self = self.copy()
-        copy_self.frequency = self.frequency[key]
-        copy_self.power = self.power[key]
-        return copy_self
+        return self._new_like(frequency=self._frequency[key], power=self.power[key])
 
     def __add__(self, other):
-        copy_self = self.copy()
-        copy_self.power = copy_self.power + u.Quantity(other, self.power.unit)
-        return copy_self
+        return self._new_like(power=self.power + u.Quantity(other, self.power.unit))
 
     def __radd__(self, other):
         return self.__add__(other)
@@ -476,14 +869,10 @@ class Periodogram(object):
         return self.__add__(-other)
 
     def __rsub__(self, other):
-        copy_self = self.copy()
-        copy_self.power = other - copy_self.power
-        return copy_self
+        return self._new_like(power=other - self.power)
 
     def __mul__(self, other):
-        copy_self = self.copy()
-        copy_self.power = other * copy_self.power
-        return copy_self
+        return self._new_like(power=other * self.power)
 
     def __rmul__(self, other):
         return self.__mul__(other)
@@ -492,9 +881,7 @@ class Periodogram(object):
         return self.__mul__(1.0 / other)
 
     def __rtruediv__(self, other):
-        copy_self = self.copy()
-        copy_self.power = other / copy_self.power
-        return copy_self
+        return self._new_like(power=other / self.power)
 
     def __div__(self, other):
         return self.__truediv__(other)
@@ -717,6 +1104,13 @@ class LombScarglePeriodogram(Periodogram):
         will use the 'fastchi2' method for regular grids, and 'chi2' for
         irregular grids.
 
+        For very large regular grids, e.g. of long 20-second cadence light
+        curves, the 'nufft' method computes the same power as the 'fast'
+        method using a non-uniform FFT on chunks of ``NUFFT_CHUNK_SIZE``
+        frequencies at a time, which bounds the memory used. The non-uniform
+        FFT is done by the ``finufft`` package if it is installed, which is more
+        accurate, and otherwise by extirpolation as in the 'fast' method.
+
         Caution: this method assumes that the LightCurve's time (lc.time)
         is given in units of days.
 
@@ -769,7 +1163,7 @@ class LombScarglePeriodogram(Periodogram):
             (`'amplitude'`).
         ls_method : str
             Default: `'fast'`. Passed to the `method` keyword of
-            `astropy.timeseries.LombScargle()`.
+            `astropy.timeseries.LombScargle()`, unless it is `'nufft'`.
         kwargs : dict
             Keyword arguments passed to
             `LombScargle() <astropy.timeseries.LombScargle>`
@@ -797,6 +1191,290 @@ class LombScarglePeriodogram(Periodogram):
         if oversample_factor is None:
             oversample_factor = 5.0 if normalization == "amplitude" else 1.0
 
+        time = lc.time.copy()
+
+        # Approximate Nyquist Frequency and frequency bin width in terms of days
+        nyquist = 0.5 * (1.0 / (np.median(np.diff(time.value)))) * (1 / cds.d)
+        fs = (1.0 / (time[-1] - time[0])) / oversample_factor
+
+        # Convert these values to requested frequency unit
+        nyquist = nyquist.to(freq_unit)
+        fs = fs.to(freq_unit)
+
+        grid = LombScarglePeriodogram._frequency_grid(
+            nyquist=nyquist,
+            fs=fs,
+            minimum_frequency=minimum_frequency,
+            maximum_frequency=maximum_frequency,
+            minimum_period=minimum_period,
+            maximum_period=maximum_period,
+            frequency=frequency,
+            period=period,
+            nterms=nterms,
+            nyquist_factor=nyquist_factor,
+            freq_unit=freq_unit,
+            ls_method=ls_method,
+            kwargs=kwargs,
+        )
+        frequency, default_view, ls_method, nterms = grid
+
+        if ls_method == "nufft":
+            if kwargs:
+                raise ValueError(
+                    "The 'nufft' method does not support the `{}` argument(s).".format(
+                        "`, `".join(kwargs)
+                    )
+                )
+            LS = LombScargle(time, lc.flux, nterms=nterms, normalization="psd")
+            flux = u.Quantity(getattr(lc.flux, "unmasked", lc.flux))
+            f_day = frequency.to(1 / u.day).value
+            power = _lombscargle_power(
+                time.value,
+                flux.value[:, np.newaxis],
+                np.ones((len(time), 1)),
+                f_day[0],
+                f_day[1] - f_day[0] if len(f_day) > 1 else 1.0,
+                len(f_day),
+            )
+            power = power[:, 0] * flux.unit ** 2
+        elif float(astropy.__version__[0]) >= 3:
+            LS = LombScargle(
+                time, lc.flux, nterms=nterms, normalization="psd", **kwargs
+            )
+            power = LS.power(frequency, method=ls_method)
+        else:
+            LS = LombScargle(time, lc.flux, nterms=nterms, **kwargs)
+            power = LS.power(frequency, method=ls_method, normalization="psd")
+
+        if normalization == "psd":  # Power spectral density
+            # Rescale from the unnormalized power output by Astropy's
+            # Lomb-Scargle function to units of flux_variance / [frequency unit]
+            # that may be of more interest for asteroseismology.
+            power *= 2.0 / (len(time) * oversample_factor * fs)
+        elif normalization == "amplitude":
+            power = np.sqrt(power) * np.sqrt(4.0 / len(lc.time))
+
+        # Periodogram needs properties
+        return LombScarglePeriodogram(
+            frequency=frequency,
+            power=power,
+            nyquist=nyquist,
+            targetid=lc.meta.get("TARGETID"),
+            label=lc.meta.get("LABEL"),
+            default_view=default_view,
+            ls_obj=LS,
+            nterms=nterms,
+            ls_method=ls_method,
+            meta=lc.meta,
+        )
+
+    @staticmethod
+    def from_lightcurves(
+        lightcurves,
+        minimum_frequency=None,
+        maximum_frequency=None,
+        minimum_period=None,
+        maximum_period=None,
+        frequency=None,
+        period=None,
+        nterms=1,
+        nyquist_factor=1,
+        oversample_factor=None,
+        freq_unit=None,
+        normalization="amplitude",
+        ls_method="fast",
+        batch_size=16,
+        **kwargs
+    ):
+        """Creates Lomb-Scargle periodograms of many light curves on a shared
+        frequency grid.
+
+        This gives the same periodograms as calling `from_lightcurve` for
+        each light curve with the same ``frequency`` grid, but is much faster
+        for many light curves observed at the same times, e.g. the targets of
+        one TESS sector: the grid, the unit conversions and the trigonometric
+        sums are computed once and the power of all the light curves sharing
+        their times is evaluated together.  The 'fast' and 'nufft' methods
+        both evaluate the power using the non-uniform FFT of the 'nufft'
+        method, which matches the exact power to about 1e-7.  Cadences at
+        which the flux is NaN are ignored, so that they do not need to be
+        shared.
+
+        Unless ``frequency`` or ``period`` is given, the grid is computed as
+        in `from_lightcurve` using the longest time baseline and the highest
+        Nyquist frequency of the light curves.  The power is normalized using
+        the number of cadences and the time baseline of each light curve.
+
+        Parameters
+        ----------
+        lightcurves : `~lightkurve.collections.LightCurveCollection` or list of `LightCurve`
+            The light curves from which to compute the periodograms.
+        batch_size : int
+            Default 16. Maximum number of light curves whose power is
+            evaluated together, which bounds the memory used.
+        minimum_frequency, maximum_frequency, minimum_period, maximum_period, frequency, period, nterms, nyquist_factor, oversample_factor, freq_unit, normalization, ls_method, kwargs
+            See `from_lightcurve`.  The power is only evaluated together
+            for the 'fast' and 'nufft' methods with ``nterms=1``, and
+            otherwise computed for each light curve in turn.
+
+        Returns
+        -------
+        periodograms : list of `LombScarglePeriodogram`
+            The periodograms of the light curves, in the same order.
+
+        Examples
+        --------
+        Compute the periodograms of the targets of a sector::
+
+            >>> import lightkurve as lk
+            >>> lcs = lk.search_lightcurve('TOI-700', radius=600, sector=1).download_all()  # doctest: +SKIP
+            >>> pgs = lk.LombScarglePeriodogram.from_lightcurves(lcs)  # doctest: +SKIP
+        """
+        normalization = validate_method(normalization, ["psd", "amplitude"])
+        lightcurves = list(lightcurves)
+        if len(lightcurves) == 0:
+            return []
+
+        # Setting default frequency units
+        if freq_unit is None:
+            freq_unit = 1 / u.day if normalization == "amplitude" else u.microhertz
+
+        # Default oversample factor
+        if oversample_factor is None:
+            oversample_factor = 5.0 if normalization == "amplitude" else 1.0
+
+        # Times, fluxes and valid cadences of each light curve, and their
+        # Nyquist frequency and frequency bin width in terms of days
+        times, fluxes, valid, nyquists, baselines = [], [], [], [], []
+        for lc in lightcurves:
+            flux = lc.flux
+            invalid = np.isnan(getattr(flux, "unmasked", flux).value)
+            if hasattr(flux, "mask"):
+                invalid |= flux.mask
+            time = lc.time.value
+            good_time = time[~invalid]
+            times.append(time)
+            fluxes.append(u.Quantity(getattr(flux, "unmasked", flux)))
+            valid.append(~invalid)
+            nyquists.append(0.5 * (1.0 / (np.median(np.diff(good_time)))))
+            baselines.append(good_time[-1] - good_time[0])
+        nyquist = max(nyquists) * (1 / cds.d)
+        fs = (1.0 / (max(baselines) * cds.d)) / oversample_factor
+
+        grid = LombScarglePeriodogram._frequency_grid(
+            nyquist=nyquist.to(freq_unit),
+            fs=fs.to(freq_unit),
+            minimum_frequency=minimum_frequency,
+            maximum_frequency=maximum_frequency,
+            minimum_period=minimum_period,
+            maximum_period=maximum_period,
+            frequency=frequency,
+            period=period,
+            nterms=nterms,
+            nyquist_factor=nyquist_factor,
+            freq_unit=freq_unit,
+            ls_method=ls_method,
+            kwargs=kwargs,
+        )
+        frequency, default_view, ls_method, nterms = grid
+
+        # Other methods are only available for one light curve at a time
+        batched = ls_method in ["fast", "nufft"] and nterms == 1 and not kwargs
+        if not batched or len(frequency) < 2:
+            periodograms = []
+            for lc in lightcurves:
+                pg = LombScarglePeriodogram.from_lightcurve(
+                    lc,
+                    frequency=frequency,
+                    nterms=nterms,
+                    oversample_factor=oversample_factor,
+                    freq_unit=freq_unit,
+                    normalization=normalization,
+                    ls_method=ls_method,
+                    **kwargs
+                )
+                pg.default_view = default_view
+                periodograms.append(pg)
+            return periodograms
+
+        # Group the light curves observed at the same times
+        groups = {}
+        for idx, time in enumerate(times):
+            key = (len(time), time.tobytes())
+            groups.setdefault(key, []).append(idx)
+
+        f_day = frequency.to(1 / u.day).value
+        f0, df = f_day[0], f_day[1] - f_day[0]
+        power = [None] * len(lightcurves)
+        for indices in groups.values():
+            time = times[indices[0]]
+            for start in range(0, len(indices), batch_size):
+                batch = indices[start : start + batch_size]
+                weights = np.stack([valid[idx] for idx in batch], axis=1)
+                y = np.stack([fluxes[idx].value for idx in batch], axis=1)
+                y = np.where(weights, y, 0.0)
+                batch_power = _lombscargle_power(
+                    time,
+                    y,
+                    weights.astype(float),
+                    f0,
+                    df,
+                    len(f_day),
+                )
+                for col, idx in enumerate(batch):
+                    power[idx] = batch_power[:, col]
+
+        periodograms = []
+        for idx, lc in enumerate(lightcurves):
+            time = lc.time[valid[idx]]
+            flux = fluxes[idx][valid[idx]]
+            LS = LombScargle(time, flux, nterms=nterms, normalization="psd")
+            pg_power = power[idx] * flux.unit ** 2
+            if normalization == "psd":  # Power spectral density
+                lc_fs = (1.0 / (time[-1] - time[0])) / oversample_factor
+                lc_fs = lc_fs.to(freq_unit)
+                pg_power *= 2.0 / (len(time) * oversample_factor * lc_fs)
+            elif normalization == "amplitude":
+                pg_power = np.sqrt(pg_power) * np.sqrt(4.0 / len(time))
+            lc_nyquist = nyquists[idx] * (1 / cds.d)
+            periodograms.append(
+                LombScarglePeriodogram(
+                    frequency=frequency,
+                    power=pg_power,
+                    nyquist=lc_nyquist.to(freq_unit),
+                    targetid=lc.meta.get("TARGETID"),
+                    label=lc.meta.get("LABEL"),
+                    default_view=default_view,
+                    ls_obj=LS,
+                    nterms=nterms,
+                    ls_method=ls_method,
+                    meta=lc.meta,
+                )
+            )
+        return periodograms
+
+    @staticmethod
+    def _frequency_grid(
+        nyquist,
+        fs,
+        minimum_frequency,
+        maximum_frequency,
+        minimum_period,
+        maximum_period,
+        frequency,
+        period,
+        nterms,
+        nyquist_factor,
+        freq_unit,
+        ls_method,
+        kwargs,
+    ):
+        """Returns the frequency grid, the default view, the LombScargle method
+        and the number of terms to use given the arguments of `from_lightcurve`,
+        where ``nyquist`` and ``fs`` are the Nyquist frequency and the frequency
+        spacing in units of ``freq_unit``.  Deprecated keywords are removed
+        from the ``kwargs`` dictionary.
+        """
         if "min_period" in kwargs:
             warnings.warn(
                 "`min_period` keyword is deprecated, "
@@ -843,16 +1521,6 @@ class LombScarglePeriodogram(Periodogram):
                 "Please only use one."
             )
 
-        time = lc.time.copy()
-
-        # Approximate Nyquist Frequency and frequency bin width in terms of days
-        nyquist = 0.5 * (1.0 / (np.median(np.diff(time.value)))) * (1 / cds.d)
-        fs = (1.0 / (time[-1] - time[0])) / oversample_factor
-
-        # Convert these values to requested frequency unit
-        nyquist = nyquist.to(freq_unit)
-        fs = fs.to(freq_unit)
-
         # Warn if there is confusing input
         if (frequency is not None) & (
             any([a is not None for a in [minimum_frequency, maximum_frequency]])
@@ -916,9 +1584,12 @@ class LombScarglePeriodogram(Periodogram):
         if not implementations.main._is_regular(frequency) and ls_method in [
             "fastchi2",
             "fast",
+            "nufft",
         ]:
             oldmethod = ls_method
-            ls_method = {"fastchi2": "chi2", "fast": "slow"}[ls_method]
+            ls_method = {"fastchi2": "chi2", "fast": "slow", "nufft": "slow"}[
+                ls_method
+            ]
             log.warning(
                 "The requested periodogram is not evenly sampled in frequency.\n"
                 "Method has been changed from '{}' to '{}' to allow for this.".format(
@@ -938,36 +1609,7 @@ class LombScarglePeriodogram(Periodogram):
             )
             nterms = 1
 
-        if float(astropy.__version__[0]) >= 3:
-            LS = LombScargle(
-                time, lc.flux, nterms=nterms, normalization="psd", **kwargs
-            )
-            power = LS.power(frequency, method=ls_method)
-        else:
-            LS = LombScargle(time, lc.flux, nterms=nterms, **kwargs)
-            power = LS.power(frequency, method=ls_method, normalization="psd")
-
-        if normalization == "psd":  # Power spectral density
-            # Rescale from the unnormalized power output by Astropy's
-            # Lomb-Scargle function to units of flux_variance / [frequency unit]
-            # that may be of more interest for asteroseismology.
-            power *= 2.0 / (len(time) * oversample_factor * fs)
-        elif normalization == "amplitude":
-            power = np.sqrt(power) * np.sqrt(4.0 / len(lc.time))
-
-        # Periodogram needs properties
-        return LombScarglePeriodogram(
-            frequency=frequency,
-            power=power,
-            nyquist=nyquist,
-            targetid=lc.meta.get("TARGETID"),
-            label=lc.meta.get("LABEL"),
-            default_view=default_view,
-            ls_obj=LS,
-            nterms=nterms,
-            ls_method=ls_method,
-            meta=lc.meta,
-        )
+        return frequency, default_view, ls_method, nterms
 
     def model(self, time, frequency=None):
         """Obtain the flux model for a given frequency and time
@@ -1042,6 +1684,12 @@ class BoxLeastSquaresPeriodogram(Periodogram):
         frequency_factor : float, optional
             If ``period`` is not provided, a factor to control the frequency spacing of periods
             to be considered.
+        max_workers : int, optional
+            Number of threads among which the periods are split, which are
+            evaluated in parallel by the default 'fast' method of
+            `BoxLeastSquares.power() <astropy.timeseries.BoxLeastSquares.power>`.
+            The results do not depend on the number of threads.
+            By default, the periods are evaluated in a single thread.
         kwargs : dict
             Keyword arguments passed to
             `BoxLeastSquares.power() <astropy.timeseries.BoxLeastSquares.power>`
@@ -1125,6 +1773,11 @@ class BoxLeastSquaresPeriodogram(Periodogram):
                 "{} is not a valid value for `time_unit`".format(time_unit)
             )
 
+        # Validate user input for `max_workers`
+        max_workers = kwargs.pop("max_workers", 1)
+        if max_workers is None or max_workers < 1:
+            raise ValueError("`max_workers` must be a positive integer")
+
         # Validate user input for `frequency_factor`
         frequency_factor = kwargs.pop("frequency_factor", 10)
         df = (
@@ -1144,7 +1797,8 @@ class BoxLeastSquaresPeriodogram(Periodogram):
             log.warning(
                 "`period` contains {} points."
                 "Periodogram is likely to be large, and slow to evaluate. "
-                "Consider setting `frequency_factor` to a higher value."
+                "Consider setting `frequency_factor` to a higher value, "
+                "or `max_workers` to search it in parallel."
                 "".format(np.round(npoints, 4))
             )
 
@@ -1157,7 +1811,7 @@ class BoxLeastSquaresPeriodogram(Periodogram):
                 maximum_period=maximum_period,
                 frequency_factor=frequency_factor,
             )
-        result = bls.power(period, duration, **kwargs)
+        result = _bls_power(bls, period, duration, max_workers=max_workers, **kwargs)
         if not isinstance(result.period, u.quantity.Quantity):
             result.period = u.Quantity(result.period, time_unit)
         if not isinstance(result.power, u.quantity.Quantity):
@@ -1,21 +1,28 @@
 """Defines tools to retrieve Kepler data from the archive at MAST."""
 from __future__ import division
 
+import collections
+import contextlib
 import glob
 import logging
 import os
 import re
+import threading
+import time
 import warnings
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 import numpy as np
 from astropy import units as u
 from astropy.coordinates import SkyCoord
 from astropy.io import ascii
-from astropy.table import Row, Table, join
+from astropy.table import Row, Table, join, vstack
 from astropy.time import Time
 from astropy.utils import deprecated
 from memoization import cached
 from requests import HTTPError
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+from tqdm import tqdm
 
 from . import PACKAGEDIR, conf, config
 from .collections import LightCurveCollection, TargetPixelFileCollection
@@ -34,7 +41,9 @@ __all__ = [
     "search_targetpixelfile",
     "search_lightcurve",
     "search_lightcurvefile",
+    "search_lightcurve_batch",
     "search_tesscut",
+    "build_local_catalog",
     "SearchResult",
 ]
 
@@ -72,6 +81,77 @@ class SearchError(Exception):
     pass
 
 
+# Network errors which may go away if a download is retried
+TRANSIENT_DOWNLOAD_ERRORS = (
+    RequestsConnectionError,
+    Timeout,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+class TransientDownloadError(LightkurveError):
+    """Raised when MAST fails to serve a data product with an HTTP error
+    which may go away if the download is retried, i.e. status 429 (Too Many
+    Requests) or 5xx (server errors)."""
+
+    pass
+
+
+def _is_transient_download_error(exc):
+    """Returns `True` if a download which raised ``exc`` may succeed if it is
+    retried, i.e. for connection errors, timeouts, and HTTP errors with status
+    429 (Too Many Requests) or 5xx (server errors)."""
+    if isinstance(exc, TransientDownloadError):
+        return True
+    if isinstance(exc, HTTPError):
+        status = getattr(exc.response, "status_code", None)
+        if status is None:
+            # The HTTP errors raised by lightkurve itself, e.g. for TESSCut
+            # "504 Gateway Timeout" errors, only give the status in the message
+            match = re.search(r"\b(429|5\d\d)\b", str(exc))
+            return match is not None
+        return status == 429 or 500 <= status < 600
+    return isinstance(exc, TRANSIENT_DOWNLOAD_ERRORS)
+
+
+# Number of threads of this process using each key of the download cache,
+# whose files must not be evicted, see `_cache_keys_in_use()`
+_CACHE_KEYS_IN_USE = collections.Counter()
+_CACHE_KEYS_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def _cache_keys_in_use(*keys):
+    """Protects the files of the download cache with keys ``keys`` from being
+    evicted by other threads, e.g. while they are downloaded and read."""
+    with _CACHE_KEYS_LOCK:
+        _CACHE_KEYS_IN_USE.update(keys)
+    try:
+        yield
+    finally:
+        with _CACHE_KEYS_LOCK:
+            _CACHE_KEYS_IN_USE.subtract(keys)
+            for key in keys:
+                if _CACHE_KEYS_IN_USE[key] <= 0:
+                    del _CACHE_KEYS_IN_USE[key]
+
+
+def _tesscut_size_str(cutout_size):
+    """Returns the TESScut cutout size as a "<columns>x<rows>" string."""
+    if cutout_size is None:
+        cutout_size = 5
+    if isinstance(cutout_size, int):
+        return str(int(cutout_size)) + "x" + str(int(cutout_size))
+    elif isinstance(cutout_size, tuple) or isinstance(cutout_size, list):
+        return str(int(cutout_size[1])) + "x" + str(int(cutout_size[0]))
+
+
+def _tesscut_cache_key(target, sector, cutout_size):
+    """Returns the key of a TESScut cutout in the download cache index."""
+    return "tesscut:{}:{}:{}".format(target, sector, _tesscut_size_str(cutout_size))
+
+
 class SearchResult(object):
     """Container for the results returned by the search functions.
 
@@ -275,13 +355,51 @@ class SearchResult(object):
         return self.table["distance"].quantity
 
     def _download_one(
-        self, table, quality_bitmask, download_dir, cutout_size, **kwargs
+        self, table, quality_bitmask, download_dir, cutout_size, evict=True, **kwargs
     ):
         """Private method used by `download()` and `download_all()` to download
         exactly one file from the MAST archive.
 
-        Always returns a `TargetPixelFile` or `LightCurve` object.
+        Always returns a `TargetPixelFile` or `LightCurve` object.  The file is
+        protected from being evicted from the cache by other threads until it
+        has been read.  If ``evict`` is `False`, the cache is not evicted after
+        the download, e.g. because the caller evicts it once after downloading
+        a batch of files.
         """
+        if download_dir is None:
+            download_dir = self._default_download_dir()
+        if "FFI Cutout" in table[0]["description"]:
+            cache_key = _tesscut_cache_key(
+                table[0]["target_name"], table[0]["sequence_number"], cutout_size
+            )
+        else:
+            cache_key = table[:1]["dataURI"][0]
+        with _cache_keys_in_use(cache_key):
+            product = self._download_and_read(
+                table, quality_bitmask, download_dir, cutout_size, **kwargs
+            )
+        if evict:
+            self._evict_cache(download_dir)
+        return product
+
+    def _evict_cache(self, download_dir=None):
+        """Deletes the least recently used files of the download cache if its
+        size exceeds the ``cache_size_limit`` configuration parameter, except
+        the files in use by other threads."""
+        if conf.cache_size_limit <= 0:
+            return
+        if download_dir is None:
+            download_dir = self._default_download_dir()
+        with _CACHE_KEYS_LOCK:
+            config.CacheIndex(download_dir).evict(
+                conf.cache_size_limit, keep=set(_CACHE_KEYS_IN_USE)
+            )
+
+    def _download_and_read(
+        self, table, quality_bitmask, download_dir, cutout_size, **kwargs
+    ):
+        """Private method used by `_download_one()` to download and read one
+        file, without evicting the cache."""
         # Make sure astroquery uses the same level of verbosity
         logging.getLogger("astropy").setLevel(log.getEffectiveLevel())
 
@@ -333,34 +451,54 @@ class SearchResult(object):
             # a HTTP request will be sent to determine the length of the file
             # prior to checking if the file already exists in the local cache.
             # For performance, we skip this HTTP request and immediately try to
-            # find the file in the cache.  The path we check here is consistent
-            # with the one hard-coded inside `astroquery.mast.Observations._download_files()`
-            # in Astroquery v0.4.1.  It would be good to submit a PR to astroquery
-            # so we can avoid having to use this hard-coded hack.
-            path = os.path.join(
-                download_dir.rstrip("/"),
-                "mastDownload",
-                table["obs_collection"][0],
-                table["obs_id"][0],
-                table["productFilename"][0],
-            )
-            if os.path.exists(path):
+            # find the file in the cache index.
+            cache_index = config.CacheIndex(download_dir)
+            download_url = table[:1]["dataURI"][0]
+            path = cache_index.get(download_url, verify=conf.cache_verify_checksums)
+            if path is not None:
                 log.debug("File found in local cache.")
             else:
-                from astroquery.mast import Observations
-
-                download_url = table[:1]["dataURI"][0]
-                log.debug("Started downloading {}.".format(download_url))
-                download_response = Observations.download_products(
-                    table[:1], mrp_only=False, download_dir=download_dir
-                )[0]
-                if download_response["Status"] != "COMPLETE":
-                    raise LightkurveError(
-                        f"Download of {download_url} failed. "
-                        f"MAST returns {download_response['Status']}: {download_response['Message']}"
-                    )
-                path = download_response["Local Path"]
-                log.debug("Finished downloading.")
+                # Files which are not in the index yet may still be in the cache.
+                # The path we check here is consistent with the one hard-coded inside
+                # `astroquery.mast.Observations._download_files()` in Astroquery v0.4.1.
+                # It would be good to submit a PR to astroquery so we can avoid
+                # having to use this hard-coded hack.
+                path = os.path.join(
+                    download_dir.rstrip("/"),
+                    "mastDownload",
+                    table["obs_collection"][0],
+                    table["obs_id"][0],
+                    table["productFilename"][0],
+                )
+                if os.path.exists(path):
+                    log.debug("File found in local cache.")
+                else:
+                    from astroquery.mast import Observations
+
+                    log.debug("Started downloading {}.".format(download_url))
+                    # Download into a staging directory first, so that an
+                    # interrupted download does not leave a truncated file
+                    with config.cache.download_staging_dir(download_dir) as staging_dir:
+                        download_response = Observations.download_products(
+                            table[:1], mrp_only=False, download_dir=staging_dir
+                        )[0]
+                        if download_response["Status"] != "COMPLETE":
+                            message = (
+                                f"Download of {download_url} failed. "
+                                f"MAST returns {download_response['Status']}: {download_response['Message']}"
+                            )
+                            # Astroquery reports HTTP errors as an "ERROR" status
+                            # with a "HTTPError: <status> ..." message
+                            if re.match(
+                                r"HTTPError: (429|5\d\d)\b", str(download_response["Message"])
+                            ):
+                                raise TransientDownloadError(message)
+                            raise LightkurveError(message)
+                        path = config.cache.move_into_cache(
+                            download_response["Local Path"], staging_dir, download_dir
+                        )
+                    log.debug("Finished downloading.")
+                cache_index.add(download_url, path)
             return read(path, quality_bitmask=quality_bitmask, **kwargs)
 
     @suppress_stdout
@@ -440,7 +578,15 @@ class SearchResult(object):
 
     @suppress_stdout
     def download_all(
-        self, quality_bitmask="default", download_dir=None, cutout_size=None, **kwargs
+        self,
+        quality_bitmask="default",
+        download_dir=None,
+        cutout_size=None,
+        max_workers=1,
+        max_retries=0,
+        retry_delay=1.0,
+        show_progress=False,
+        **kwargs,
     ):
         """Download and open all data products in the search result.
 
@@ -471,6 +617,18 @@ class SearchResult(object):
         cutout_size : int, float or tuple, optional
             Side length of cutout in pixels. Tuples should have dimensions (y, x).
             Default size is (5, 5)
+        max_workers : int, optional
+            Maximum number of products to download concurrently.
+            By default, the products are downloaded one after the other.
+        max_retries : int, optional
+            Number of times the download of a product is retried after a
+            transient network error, i.e. a connection error, a timeout, or an
+            HTTP error with status 429 or 5xx.
+        retry_delay : float, optional
+            Delay in seconds before the first retry, which is doubled before
+            each subsequent retry.
+        show_progress : bool, optional
+            Whether to display a progress bar of the number of products downloaded.
         flux_column : str, optional
             The column in the FITS file to be read as `flux`. Defaults to 'pdcsap_flux'.
             Typically 'pdcsap_flux' or 'sap_flux'.
@@ -498,22 +656,198 @@ class SearchResult(object):
             return None
         log.debug("{} files will be downloaded.".format(len(self.table)))
 
-        products = []
-        for idx in range(len(self.table)):
-            products.append(
-                self._download_one(
-                    table=self.table[idx : idx + 1],
-                    quality_bitmask=quality_bitmask,
-                    download_dir=download_dir,
-                    cutout_size=cutout_size,
-                    **kwargs,
-                )
-            )
+        # Download the products concurrently, but return them in their original
+        # order; if any download fails, the pending ones are cancelled.
+        products = [None] * len(self.table)
+        downloads = self._iter_download(
+            quality_bitmask=quality_bitmask,
+            download_dir=download_dir,
+            cutout_size=cutout_size,
+            max_workers=max_workers,
+            max_pending=len(self.table),
+            ordered=False,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            **kwargs,
+        )
+        with tqdm(
+            total=len(products), desc="Downloading", disable=not show_progress
+        ) as progress:
+            for idx, product in downloads:
+                products[idx] = product
+                progress.update(1)
         if isinstance(products[0], TargetPixelFile):
             return TargetPixelFileCollection(products)
         else:
             return LightCurveCollection(products)
 
+    def iter_download(
+        self,
+        quality_bitmask="default",
+        download_dir=None,
+        cutout_size=None,
+        max_workers=1,
+        ordered=True,
+        max_retries=0,
+        retry_delay=1.0,
+        **kwargs,
+    ):
+        """Download and open the data products in the search result one at a
+        time, yielding each of them as soon as it is available.
+
+        Unlike `download_all`, which returns once all the products have been
+        downloaded, this generator downloads the next products in the
+        background while the caller processes the previous one.  At most
+        ``max_workers`` products are downloaded ahead, so that the memory used
+        does not grow with the number of products if the caller does not keep
+        references to them.
+
+        Parameters
+        ----------
+        quality_bitmask : str or int, optional
+            Bitmask (integer) which identifies the quality flag bitmask that should
+            be used to mask out bad cadences. See `download_all` for details.
+        download_dir : str, optional
+            Location where the data files will be stored.
+            If `None` is passed, the value from `cache_dir` configuration parameter is used,
+            with "~/.lightkurve/cache" as the default.
+        cutout_size : int, float or tuple, optional
+            Side length of cutout in pixels. Tuples should have dimensions (y, x).
+            Default size is (5, 5)
+        max_workers : int, optional
+            Maximum number of products downloaded in the background.
+        ordered : bool, optional
+            If `True` (default), the products are yielded in the order of the
+            search result.  Otherwise, they are yielded in the order in which
+            their downloads complete.
+        max_retries : int, optional
+            Number of times the download of a product is retried after a
+            transient network error, i.e. a connection error, a timeout, or an
+            HTTP error with status 429 or 5xx.
+        retry_delay : float, optional
+            Delay in seconds before the first retry, which is doubled before
+            each subsequent retry.
+        kwargs : dict, optional
+            Extra keyword arguments passed on to the file format reader function.
+
+        Yields
+        ------
+        data : `TargetPixelFile` or `LightCurve` object
+            The data products of the search result.
+
+        Raises
+        ------
+        HTTPError
+            If the TESSCut service times out (i.e. returns HTTP status 504).
+        SearchError
+            If any other error occurs.
+
+        Examples
+        --------
+        Process the light curves of a target one sector at a time::
+
+            >>> for lc in lk.search_lightcurve("TIC 25155310").iter_download():  # doctest: +SKIP
+            ...     results.append(process(lc))  # doctest: +SKIP
+        """
+        if len(self.table) == 0:
+            warnings.warn(
+                "Cannot download from an empty search result.", LightkurveWarning
+            )
+            return
+        downloads = self._iter_download(
+            quality_bitmask=quality_bitmask,
+            download_dir=download_dir,
+            cutout_size=cutout_size,
+            max_workers=max_workers,
+            max_pending=max_workers,
+            ordered=ordered,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            **kwargs,
+        )
+        for _, product in downloads:
+            yield product
+            # Release the product before waiting for the next one
+            del product
+
+    def _iter_download(
+        self,
+        quality_bitmask,
+        download_dir,
+        cutout_size,
+        max_workers,
+        max_pending,
+        ordered,
+        max_retries,
+        retry_delay,
+        **kwargs,
+    ):
+        """Private generator used by `download_all()` and `iter_download()`,
+        which downloads the products using ``max_workers`` threads and yields
+        ``(index, product)`` tuples.
+
+        At most ``max_pending`` downloads are submitted ahead of the products
+        yielded.  The pending downloads are cancelled if an error occurs or if
+        the generator is closed.
+        """
+
+        def download_with_retries(idx):
+            for attempt in range(max_retries + 1):
+                try:
+                    product = self._download_one(
+                        table=self.table[idx : idx + 1],
+                        quality_bitmask=quality_bitmask,
+                        download_dir=download_dir,
+                        cutout_size=cutout_size,
+                        evict=False,
+                        **kwargs,
+                    )
+                    return idx, product
+                except Exception as exc:
+                    transient = _is_transient_download_error(exc)
+                    if attempt == max_retries or not transient:
+                        raise
+                    delay = retry_delay * 2**attempt
+                    log.debug(
+                        "Download of product #{} failed ({}), retrying in {}s."
+                        "".format(idx, exc, delay)
+                    )
+                    time.sleep(delay)
+
+        indices = iter(range(len(self.table)))
+        pending = []
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        def submit_next():
+            idx = next(indices, None)
+            if idx is not None:
+                pending.append(executor.submit(download_with_retries, idx))
+
+        try:
+            for _ in range(max_pending):
+                submit_next()
+            while pending:
+                if ordered:
+                    future = pending[0]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = min(done, key=pending.index)
+                pending.remove(future)
+                idx, product = future.result()
+                # Start the next download before the caller processes the product
+                submit_next()
+                yield idx, product
+                del product
+        finally:
+            # Cancel the pending downloads if an error occurred or if the
+            # caller stopped iterating
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            # The cache is evicted once all the products of the batch have been
+            # read, so that the files of the batch cannot evict each other
+            self._evict_cache(download_dir)
+
     def _default_download_dir(self):
         return config.get_cache_dir()
 
@@ -536,18 +870,26 @@ class SearchResult(object):
         """
         from astroquery.mast import TesscutClass
 
-        coords = _resolve_object(target)
-
         # Set cutout_size defaults
         if cutout_size is None:
             cutout_size = 5
+        size_str = _tesscut_size_str(cutout_size)
+
+        # Look up the cutout in the cache index first, which avoids resolving
+        # the target and querying the available sectors
+        cache_index = config.CacheIndex(download_dir)
+        cache_key = _tesscut_cache_key(target, sector, cutout_size)
+        path = cache_index.get(cache_key, verify=conf.cache_verify_checksums)
+        if path is not None:
+            log.debug("Cached file found.")
+            return path
 
         # Check existence of `~/.lightkurve-cache/tesscut`
         tesscut_dir = os.path.join(download_dir, "tesscut")
         if not os.path.isdir(tesscut_dir):
             # if it doesn't exist, make a new cache directory
             try:
-                os.mkdir(tesscut_dir)
+                os.makedirs(tesscut_dir, exist_ok=True)
             # downloads into default cache if OSError occurs
             except OSError:
                 tesscut_dir = download_dir
@@ -559,10 +901,6 @@ class SearchResult(object):
         # this is necessary to ensure cutouts are not downloaded multiple times
         sec = TesscutClass().get_sectors(coordinates=coords)
         sector_name = sec[sec["sector"] == sector]["sectorName"][0]
-        if isinstance(cutout_size, int):
-            size_str = str(int(cutout_size)) + "x" + str(int(cutout_size))
-        elif isinstance(cutout_size, tuple) or isinstance(cutout_size, list):
-            size_str = str(int(cutout_size[1])) + "x" + str(int(cutout_size[0]))
 
         # search cache for file with matching ra, dec, and cutout size
         # ra and dec are searched within 0.001 degrees of input target
@@ -582,11 +920,16 @@ class SearchResult(object):
             log.debug("Cached file found.")
         # otherwise the file will be downloaded
         else:
-            cutout_path = TesscutClass().download_cutouts(
-                coordinates=coords, size=cutout_size, sector=sector, path=tesscut_dir
-            )
-            path = cutout_path[0][0]  # the cutoutpath already contains testcut_dir
+            with config.cache.download_staging_dir(tesscut_dir) as staging_dir:
+                cutout_path = TesscutClass().download_cutouts(
+                    coordinates=coords, size=cutout_size, sector=sector, path=staging_dir
+                )
+                # the cutoutpath already contains staging_dir
+                path = config.cache.move_into_cache(
+                    cutout_path[0][0], staging_dir, tesscut_dir
+                )
             log.debug("Finished downloading.")
+        cache_index.add(cache_key, path)
         return path
 
 
@@ -887,6 +1230,183 @@ def search_tesscut(target, sector=None):
         return SearchResult(None)
 
 
+def search_lightcurve_batch(
+    targets,
+    radius=None,
+    exptime=None,
+    cadence=None,
+    mission=("Kepler", "K2", "TESS"),
+    author=None,
+    quarter=None,
+    month=None,
+    campaign=None,
+    sector=None,
+    limit=None,
+    batch_size=100,
+    max_workers=4,
+):
+    """Search the `MAST data archive <https://archive.stsci.edu>`_ for the light
+    curves of many targets at once.
+
+    This function returns the same results as calling `search_lightcurve` for
+    each target, but requires far fewer requests to MAST.  Kepler, K2 and TESS
+    identifiers (e.g. "KIC 11904151", "EPIC 205998445", "TIC 25155310") are
+    looked up in batches of ``batch_size`` targets, the data products of all the
+    observations found are listed in batches, and the requests are performed
+    concurrently.  Other targets are searched individually, but concurrently.
+
+    Parameters
+    ----------
+    targets : list of str or int
+        Targets to search for. See `search_lightcurve` for valid inputs.
+    batch_size : int
+        Maximum number of targets or observations per request to MAST.
+    max_workers : int
+        Maximum number of requests to MAST performed concurrently.
+
+    See `search_lightcurve` for a description of the other parameters, which
+    apply to all the targets.
+
+    Returns
+    -------
+    results : dict
+        Dictionary mapping each target to a :class:`SearchResult` object.
+    """
+    return _search_products_batch(
+        targets,
+        radius=radius,
+        filetype="Lightcurve",
+        exptime=exptime or cadence,
+        mission=mission,
+        provenance_name=author,
+        quarter=quarter,
+        month=month,
+        campaign=campaign,
+        sector=sector,
+        limit=limit,
+        batch_size=batch_size,
+        max_workers=max_workers,
+    )
+
+
+def build_local_catalog(
+    targets,
+    path,
+    radius=None,
+    mission=("Kepler", "K2", "TESS"),
+    batch_size=100,
+    max_workers=4,
+):
+    """Copies the MAST observations and data products of a list of targets
+    into a local catalog, which the search functions can query instead of MAST.
+
+    This allows searches to be performed on computers without network access,
+    e.g. the compute nodes of a cluster.  The catalog is built once, on a
+    computer with network access, and it is used by setting the
+    ``local_catalog`` configuration parameter to its path.  The searches then
+    return the same `SearchResult` objects as if MAST were queried.  Building
+    a catalog which already exists adds the targets to it.
+
+    The observations of all the provenances are copied, but the data products
+    are only listed for the light curves and target pixel files.  The
+    coordinates of the targets are also recorded, so that cone searches
+    around them can be performed.  Data products can be downloaded into the
+    cache beforehand using `SearchResult.download_all`.
+
+    Parameters
+    ----------
+    targets : list of str, int, or `astropy.coordinates.SkyCoord` objects
+        Targets whose observations are copied. See `search_lightcurve` for
+        valid inputs.
+    path : str
+        Path of the catalog, which is created if it does not exist.
+    radius : float or `astropy.units.Quantity` object
+        Radius of the cone searches around the targets.  If a float is given
+        it will be assumed to be in units of arcseconds.  Searches using a
+        larger radius may miss observations.
+    mission : str, list of str
+        'Kepler', 'K2', or 'TESS'. By default, all will be copied.
+    batch_size : int
+        Maximum number of observations per request to MAST.
+    max_workers : int
+        Maximum number of requests to MAST performed concurrently.
+
+    Returns
+    -------
+    catalog : `~lightkurve.config.LocalCatalog`
+        The local catalog.
+
+    Examples
+    --------
+    Build a catalog on a computer with network access::
+
+        >>> lk.build_local_catalog(["KIC 11904151", "Kepler-10"], "catalog.sqlite")  # doctest: +SKIP
+
+    and search it on a computer without network access::
+
+        >>> lk.conf.local_catalog = "catalog.sqlite"  # doctest: +SKIP
+        >>> lk.search_lightcurve("KIC 11904151", quarter=4)  # doctest: +SKIP
+    """
+    from astroquery.exceptions import ResolverError
+    from astroquery.mast import Observations
+
+    catalog = config.LocalCatalog(path)
+    mission = np.atleast_1d(mission).tolist()
+
+    def query_target(target):
+        try:
+            obs = _query_mast(
+                target,
+                radius=radius,
+                project=mission,
+                exptime=None,
+                service=Observations,
+            )
+        except SearchError as exc:
+            log.error(exc)
+            return None, None
+        # Record the coordinates of target names for cone searches
+        coord = None
+        if not isinstance(target, SkyCoord):
+            try:
+                coord = _resolve_object(str(target))
+            except ResolverError:
+                log.debug('Unable to resolve the coordinates of "{}".'.format(target))
+        return obs, coord
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        observations = []
+        for target, (obs, coord) in zip(targets, executor.map(query_target, targets)):
+            if coord is not None:
+                catalog.add_target(target, coord)
+            if obs is not None and len(obs) > 0:
+                catalog.add_observations(obs)
+                observations.append(obs)
+
+        # Only list the products of the light curves and target pixel files,
+        # because full frame images have a very large number of products
+        obsids = set()
+        for obs in observations:
+            is_pipeline = np.isin(
+                np.char.lower(np.asarray(obs["dataproduct_type"], dtype=str)),
+                ["cube", "timeseries"],
+            )
+            obsids.update(np.asarray(obs["obsid"], dtype=str)[is_pipeline])
+        obsids = sorted(obsids)
+        batches = [
+            obsids[idx : idx + batch_size] for idx in range(0, len(obsids), batch_size)
+        ]
+        for products in executor.map(Observations.get_product_list, batches):
+            if len(products) > 0:
+                catalog.add_products(products)
+    log.debug(
+        "Copied the observations of {} targets into {}.".format(
+            len(targets), catalog.path
+        )
+    )
+    return catalog
+
+
 def _search_products(
     target,
     radius=None,
@@ -955,21 +1475,43 @@ def _search_products(
                 "".format(target)
             )
 
-    # Specifying quarter, campaign, or quarter should constrain the mission
-    if quarter is not None:
-        mission = "Kepler"
-    if campaign is not None:
-        mission = "K2"
-    if sector is not None:
-        mission = "TESS"
-    # Ensure mission is a list
-    mission = np.atleast_1d(mission).tolist()
+    mission, provenance_name = _normalize_mission_and_provenance(
+        mission, provenance_name, quarter=quarter, campaign=campaign, sector=sector
+    )
 
-    # Avoid filtering on `provenance_name` if `author` equals "any" or "all"
-    if provenance_name in ("any", "all") or provenance_name is None:
-        provenance_name = None
-    else:
-        provenance_name = np.atleast_1d(provenance_name).tolist()
+    # Query the local catalog instead of MAST if one is configured
+    service = _observations_service()
+    is_local = isinstance(service, config.LocalCatalog)
+
+    # Reuse the result of an identical search if the persistent cache is enabled
+    search_cache = None
+    if conf.search_cache_ttl > 0 and not is_local:
+        search_cache = config.get_search_cache()
+        if isinstance(target, SkyCoord):
+            target_str = "{}, {}".format(target.ra.deg, target.dec.deg)
+        else:
+            target_str = " ".join(str(target).split())
+        if radius is not None and not isinstance(radius, u.Quantity):
+            radius = radius * u.arcsec
+        cache_key = search_cache.make_key(
+            {
+                "target": target_str,
+                "radius": None if radius is None else radius.to_value(u.arcsec),
+                "filetype": filetype.lower(),
+                "mission": sorted(mission),
+                "provenance_name": provenance_name and sorted(provenance_name),
+                "exptime": exptime,
+                "quarter": quarter,
+                "month": month,
+                "campaign": campaign,
+                "sector": sector,
+                "limit": limit,
+            }
+        )
+        table = search_cache.get(cache_key)
+        if table is not None:
+            log.debug("Search result found in the persistent cache.")
+            return SearchResult(table)
 
     # Speed up by restricting the MAST query if we don't want FFI image data
     extra_query_criteria = {}
@@ -988,6 +1530,7 @@ def _search_products(
         provenance_name=provenance_name,
         exptime=exptime,
         sequence_number=campaign or sector,
+        service=service,
         **extra_query_criteria,
     )
     log.debug(
@@ -1000,61 +1543,20 @@ def _search_products(
 
     # Light curves and target pixel files
     if filetype.lower() != "ffi":
-        from astroquery.mast import Observations
-
-        products = Observations.get_product_list(observations)
-        result = join(
+        products = service.get_product_list(observations)
+        search_result = _make_search_result(
             observations,
             products,
-            keys="obs_id",
-            join_type="right",
-            uniq_col_name="{col_name}{table_name}",
-            table_names=["", "_products"],
-        )
-        result.sort(["distance", "obs_id"])
-
-        # Add the user-friendly 'author' column (synonym for 'provenance_name')
-        result["author"] = result["provenance_name"]
-        # Add the user-friendly 'mission' column
-        result["mission"] = None
-        obs_prefix = {"Kepler": "Quarter", "K2": "Campaign", "TESS": "Sector"}
-        for idx in range(len(result)):
-            obs_project = result["project"][idx]
-            tmp_seqno = result["sequence_number"][idx]
-            obs_seqno = f"{tmp_seqno:02d}" if tmp_seqno else ""
-            # Kepler sequence_number values were not populated at the time of
-            # writing this code, so we parse them from the description field.
-            if obs_project == "Kepler" and result["sequence_number"].mask[idx]:
-                try:
-                    tmp_seqno = re.findall(r".*Q(\d+)", result["description"][idx])[0]
-                    obs_seqno = f"{int(tmp_seqno):02d}"
-                except IndexError:
-                    obs_seqno = ""
-            # K2 campaigns 9, 10, and 11 were split into two sections, which are
-            # listed separately in the table with suffixes "a" and "b"
-            if obs_project == "K2" and result["sequence_number"][idx] in [9, 10, 11]:
-                for half, letter in zip([1, 2], ["a", "b"]):
-                    if f"c{tmp_seqno}{half}" in result["productFilename"][idx]:
-                        obs_seqno = f"{int(tmp_seqno):02d}{letter}"
-            result["mission"][idx] = "{} {} {}".format(
-                obs_project, obs_prefix.get(obs_project, ""), obs_seqno
-            )
-
-        masked_result = _filter_products(
-            result,
             filetype=filetype,
-            campaign=campaign,
-            quarter=quarter,
             exptime=exptime,
-            project=mission,
+            mission=mission,
             provenance_name=provenance_name,
+            quarter=quarter,
             month=month,
+            campaign=campaign,
             sector=sector,
             limit=limit,
         )
-        log.debug("MAST found {} matching data products.".format(len(masked_result)))
-        masked_result["distance"].info.format = ".1f"  # display <0.1 arcsec
-        return SearchResult(masked_result)
 
     # Full Frame Images
     else:
@@ -1090,7 +1592,292 @@ def _search_products(
             masked_result.sort(["distance", "sequence_number"])
         else:
             masked_result = None
-        return SearchResult(masked_result)
+        search_result = SearchResult(masked_result)
+
+    if search_cache is not None:
+        search_cache.set(cache_key, search_result.table)
+    return search_result
+
+
+def _search_products_batch(
+    targets,
+    radius=None,
+    filetype="Lightcurve",
+    mission=("Kepler", "K2", "TESS"),
+    provenance_name=None,
+    exptime=(0, 9999),
+    quarter=None,
+    month=None,
+    campaign=None,
+    sector=None,
+    limit=None,
+    batch_size=100,
+    max_workers=4,
+):
+    """Helper function which returns a dictionary mapping each target to a
+    `SearchResult` containing the MAST products that match several criteria.
+
+    See `_search_products` for a description of the criteria.
+    """
+    from astroquery.exceptions import NoResultsWarning
+
+    service = _observations_service()
+    mission, provenance_name = _normalize_mission_and_provenance(
+        mission, provenance_name, quarter=quarter, campaign=campaign, sector=sector
+    )
+    query_criteria = _mast_query_criteria(
+        project=mission,
+        provenance_name=provenance_name,
+        exptime=exptime,
+        sequence_number=campaign or sector,
+        # Restrict the MAST query to non-FFI pipeline products
+        dataproduct_type=["cube", "timeseries"],
+    )
+
+    def query_target_names(target_names):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=NoResultsWarning)
+            warnings.filterwarnings("ignore", message="t_exptime is continuous")
+            return service.query_criteria(target_name=target_names, **query_criteria)
+
+    def query_target(target):
+        # Targets whose exact name was not found are searched by cone search,
+        # which `_query_mast` performs if a radius is given
+        target_radius = radius
+        if target in exact_target_names:
+            target_radius = 0.0001 * u.arcsec
+        try:
+            return _query_mast(
+                target,
+                radius=target_radius,
+                project=mission,
+                provenance_name=provenance_name,
+                exptime=exptime,
+                sequence_number=campaign or sector,
+                service=service,
+                dataproduct_type=["cube", "timeseries"],
+            )
+        except SearchError as exc:
+            log.error(exc)
+            return None
+
+    observations = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Look up the exact target names of Kepler, K2 and TESS identifiers in batches
+        exact_target_names = {}
+        if radius is None:
+            for target in targets:
+                exact_target_name = _exact_target_name(target)
+                if exact_target_name is not None:
+                    exact_target_names[target] = exact_target_name
+        unique_names = sorted(set(exact_target_names.values()))
+        batches = [
+            unique_names[idx : idx + batch_size]
+            for idx in range(0, len(unique_names), batch_size)
+        ]
+        observations_by_name = {}
+        for obs in executor.map(query_target_names, batches):
+            if len(obs) == 0:
+                continue
+            # We use `exptime` as an alias for `t_exptime`
+            obs["exptime"] = obs["t_exptime"]
+            # astroquery does not report distance when querying by `target_name`
+            obs["distance"] = 0.0
+            obs = obs.group_by("target_name")
+            for name, group in zip(obs.groups.keys["target_name"], obs.groups):
+                observations_by_name[name] = group
+        for target, name in exact_target_names.items():
+            if name in observations_by_name:
+                observations[target] = observations_by_name[name]
+
+        # Search for the other targets individually, including by cone search
+        # for identifiers which are not known by their exact name
+        remaining = [target for target in targets if target not in observations]
+        for target, obs in zip(remaining, executor.map(query_target, remaining)):
+            if obs is not None and len(obs) > 0:
+                observations[target] = obs
+
+        # List the products of all the observations found, in batches
+        obsids = np.unique(
+            np.concatenate(
+                [np.asarray(obs["obsid"], dtype=str) for obs in observations.values()]
+                + [np.array([], dtype=str)]
+            )
+        ).tolist()
+        batches = [
+            obsids[idx : idx + batch_size] for idx in range(0, len(obsids), batch_size)
+        ]
+        product_tables = [
+            products
+            for products in executor.map(service.get_product_list, batches)
+            if len(products) > 0
+        ]
+
+    # Products are attributed to the targets via the observation they belong to
+    all_products = vstack(product_tables) if product_tables else Table()
+    rows_by_obsid = {}
+    if len(all_products) > 0:
+        for idx, obsid in enumerate(all_products["parent_obsid"]):
+            rows_by_obsid.setdefault(str(obsid), []).append(idx)
+
+    results = {}
+    for target in targets:
+        obs = observations.get(target)
+        rows = []
+        if obs is not None:
+            for obsid in np.unique(np.asarray(obs["obsid"], dtype=str)):
+                rows.extend(rows_by_obsid.get(obsid, []))
+        if not rows:
+            log.error('No data found for target "{}".'.format(target))
+            results[target] = SearchResult(None)
+            continue
+        results[target] = _make_search_result(
+            obs,
+            all_products[rows],
+            filetype=filetype,
+            exptime=exptime,
+            mission=mission,
+            provenance_name=provenance_name,
+            quarter=quarter,
+            month=month,
+            campaign=campaign,
+            sector=sector,
+            limit=limit,
+        )
+    return results
+
+
+def _normalize_mission_and_provenance(
+    mission, provenance_name, quarter=None, campaign=None, sector=None
+):
+    """Returns the lists of missions and provenance names to search for,
+    or `None` for the latter if products of any provenance are accepted."""
+    # Specifying quarter, campaign, or quarter should constrain the mission
+    if quarter is not None:
+        mission = "Kepler"
+    if campaign is not None:
+        mission = "K2"
+    if sector is not None:
+        mission = "TESS"
+    # Ensure mission is a list
+    mission = np.atleast_1d(mission).tolist()
+
+    # Avoid filtering on `provenance_name` if `author` equals "any" or "all"
+    if provenance_name in ("any", "all") or provenance_name is None:
+        provenance_name = None
+    else:
+        provenance_name = np.atleast_1d(provenance_name).tolist()
+    return mission, provenance_name
+
+
+def _make_search_result(
+    observations,
+    products,
+    filetype="Lightcurve",
+    exptime=(0, 9999),
+    mission=("Kepler", "K2", "TESS"),
+    provenance_name=None,
+    quarter=None,
+    month=None,
+    campaign=None,
+    sector=None,
+    limit=None,
+):
+    """Joins tables of MAST observations and of their data products, and
+    returns a `SearchResult` containing the products matching the criteria.
+
+    See `_search_products` for a description of the criteria.
+    """
+    result = join(
+        observations,
+        products,
+        keys="obs_id",
+        join_type="right",
+        uniq_col_name="{col_name}{table_name}",
+        table_names=["", "_products"],
+    )
+    result.sort(["distance", "obs_id"])
+
+    # Add the user-friendly 'author' column (synonym for 'provenance_name')
+    result["author"] = result["provenance_name"]
+    # Add the user-friendly 'mission' column
+    result["mission"] = _mission_names(result)
+
+    masked_result = _filter_products(
+        result,
+        filetype=filetype,
+        campaign=campaign,
+        quarter=quarter,
+        exptime=exptime,
+        project=mission,
+        provenance_name=provenance_name,
+        month=month,
+        sector=sector,
+        limit=limit,
+    )
+    log.debug("MAST found {} matching data products.".format(len(masked_result)))
+    masked_result["distance"].info.format = ".1f"  # display <0.1 arcsec
+    return SearchResult(masked_result)
+
+
+def _mission_names(products):
+    """Returns the user-friendly mission names of a table of products,
+    e.g. "Kepler Quarter 05", "K2 Campaign 10a" or "TESS Sector 14".
+
+    The names are computed column-wise, so that large tables are processed quickly.
+    """
+    project = np.asarray(products["project"], dtype=str)
+    sequence_number = products["sequence_number"]
+    is_masked = np.ma.getmaskarray(sequence_number)
+    seqno = np.ma.filled(sequence_number, 0).astype(int)
+    obs_seqno = np.where(
+        ~is_masked & (seqno != 0), np.char.mod("%02d", seqno), ""
+    ).astype(object)
+
+    # Kepler sequence_number values were not populated at the time of
+    # writing this code, so we parse them from the description field.
+    # Descriptions are shared by many products, so we only parse unique values.
+    is_kepler = (project == "Kepler") & is_masked
+    if is_kepler.any():
+        descriptions, inverse = np.unique(
+            np.asarray(products["description"], dtype=str)[is_kepler],
+            return_inverse=True,
+        )
+        quarters = []
+        for description in descriptions:
+            match = re.findall(r".*Q(\d+)", description)
+            quarters.append(f"{int(match[0]):02d}" if match else "")
+        obs_seqno[is_kepler] = np.asarray(quarters, dtype=object)[inverse.ravel()]
+
+    # K2 campaigns 9, 10, and 11 were split into two sections, which are
+    # listed separately in the table with suffixes "a" and "b"
+    is_split_k2 = (project == "K2") & ~is_masked & np.isin(seqno, [9, 10, 11])
+    if is_split_k2.any():
+        filenames = np.asarray(products["productFilename"], dtype=str)[is_split_k2]
+        campaigns = seqno[is_split_k2]
+        split_seqno = obs_seqno[is_split_k2]
+        for half, letter in zip([1, 2], ["a", "b"]):
+            pattern = np.char.mod("c%d{}".format(half), campaigns)
+            has_half = np.char.find(filenames, pattern) >= 0
+            split_seqno[has_half] = np.char.mod("%02d" + letter, campaigns[has_half])
+        obs_seqno[is_split_k2] = split_seqno
+
+    obs_prefix = {"Kepler": "Quarter", "K2": "Campaign", "TESS": "Sector"}
+    projects, inverse = np.unique(project, return_inverse=True)
+    prefix = np.array([obs_prefix.get(p, "") for p in projects], dtype=object)
+    return project.astype(object) + " " + prefix[inverse.ravel()] + " " + obs_seqno
+
+
+def _observations_service():
+    """Returns the service queried for observations and data products: the
+    local catalog given by the ``local_catalog`` configuration parameter if
+    any, otherwise `astroquery.mast.Observations`."""
+    catalog = config.get_local_catalog()
+    if catalog is not None:
+        return catalog
+    from astroquery.mast import Observations
+
+    return Observations
 
 
 def _query_mast(
@@ -1100,6 +1887,7 @@ def _query_mast(
     provenance_name=None,
     exptime=(0, 9999),
     sequence_number=None,
+    service=None,
     **extra_query_criteria,
 ):
     """Helper function which wraps `astroquery.mast.Observations.query_criteria()`
@@ -1127,6 +1915,9 @@ def _query_mast(
         for Kepler short cadence and `(1799, 1801)` for Kepler long cadence.
     sequence_number : int, list of int
         Quarter, Campaign, or Sector number.
+    service : `~astroquery.mast.ObservationsClass` or `~lightkurve.config.LocalCatalog`
+        Service to query.  By default, the local catalog given by the
+        ``local_catalog`` configuration parameter if any, otherwise MAST.
     **extra_query_criteria : kwargs
         Extra criteria to be passed to `astroquery.mast.Observations.query_criteria`.
 
@@ -1137,7 +1928,9 @@ def _query_mast(
     """
     # Local astroquery import because the package is not used elsewhere
     from astroquery.exceptions import NoResultsWarning, ResolverError
-    from astroquery.mast import Observations
+
+    if service is None:
+        service = _observations_service()
 
     # If passed a SkyCoord, convert it to an "ra, dec" string for MAST
     if isinstance(target, SkyCoord):
@@ -1145,31 +1938,18 @@ def _query_mast(
 
     # We pass the following `query_criteria` to MAST regardless of whether
     # we search by position or target name:
-    query_criteria = {"project": project, **extra_query_criteria}
-    if provenance_name is not None:
-        query_criteria["provenance_name"] = provenance_name
-    if sequence_number is not None:
-        query_criteria["sequence_number"] = sequence_number
-    if exptime is not None:
-        query_criteria["t_exptime"] = exptime
+    query_criteria = _mast_query_criteria(
+        project=project,
+        provenance_name=provenance_name,
+        exptime=exptime,
+        sequence_number=sequence_number,
+        **extra_query_criteria,
+    )
 
     # If an exact KIC ID is passed, we will search by the exact `target_name`
     # under which MAST will know the object to prevent source confusion.
     # For discussion, see e.g. GitHub issues #148, #718.
-    exact_target_name = None
-    target_lower = str(target).lower()
-    # Was a Kepler target ID passed?
-    kplr_match = re.match(r"^(kplr|kic) ?(\d+)$", target_lower)
-    if kplr_match:
-        exact_target_name = f"kplr{kplr_match.group(2).zfill(9)}"
-    # Was a K2 target ID passed?
-    ktwo_match = re.match(r"^(ktwo|epic) ?(\d+)$", target_lower)
-    if ktwo_match:
-        exact_target_name = f"ktwo{ktwo_match.group(2).zfill(9)}"
-    # Was a TESS target ID passed?
-    tess_match = re.match(r"^(tess|tic) ?(\d+)$", target_lower)
-    if tess_match:
-        exact_target_name = f"{tess_match.group(2).zfill(9)}"
+    exact_target_name = _exact_target_name(target)
 
     if exact_target_name and radius is None:
         log.debug(
@@ -1179,7 +1959,7 @@ def _query_mast(
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", category=NoResultsWarning)
             warnings.filterwarnings("ignore", message="t_exptime is continuous")
-            obs = Observations.query_criteria(
+            obs = service.query_criteria(
                 target_name=exact_target_name, **query_criteria
             )
         if len(obs) > 0:
@@ -1208,7 +1988,7 @@ def _query_mast(
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", category=NoResultsWarning)
             warnings.filterwarnings("ignore", message="t_exptime is continuous")
-            obs = Observations.query_criteria(objectname=target, **query_criteria)
+            obs = service.query_criteria(objectname=target, **query_criteria)
         obs.sort("distance")
         # We use `exptime` as an alias for `t_exptime`
         obs["exptime"] = obs["t_exptime"]
@@ -1218,6 +1998,44 @@ def _query_mast(
         raise SearchError(exc) from exc
 
 
+def _mast_query_criteria(
+    project=("Kepler", "K2", "TESS"),
+    provenance_name=None,
+    exptime=(0, 9999),
+    sequence_number=None,
+    **extra_query_criteria,
+):
+    """Returns the criteria passed to `astroquery.mast.Observations.query_criteria()`,
+    regardless of whether we search by position or target name."""
+    query_criteria = {"project": project, **extra_query_criteria}
+    if provenance_name is not None:
+        query_criteria["provenance_name"] = provenance_name
+    if sequence_number is not None:
+        query_criteria["sequence_number"] = sequence_number
+    if exptime is not None:
+        query_criteria["t_exptime"] = exptime
+    return query_criteria
+
+
+def _exact_target_name(target):
+    """Returns the exact `target_name` under which MAST knows a Kepler, K2 or
+    TESS target identifier (e.g. "KIC 11904151"), or `None` for other targets."""
+    target_lower = str(target).lower()
+    # Was a Kepler target ID passed?
+    kplr_match = re.match(r"^(kplr|kic) ?(\d+)$", target_lower)
+    if kplr_match:
+        return f"kplr{kplr_match.group(2).zfill(9)}"
+    # Was a K2 target ID passed?
+    ktwo_match = re.match(r"^(ktwo|epic) ?(\d+)$", target_lower)
+    if ktwo_match:
+        return f"ktwo{ktwo_match.group(2).zfill(9)}"
+    # Was a TESS target ID passed?
+    tess_match = re.match(r"^(tess|tic) ?(\d+)$", target_lower)
+    if tess_match:
+        return f"{tess_match.group(2).zfill(9)}"
+    return None
+
+
 def _filter_products(
     products,
     campaign=None,
@@ -1266,34 +2084,25 @@ def _filter_products(
     mask = np.ones(len(products), dtype=bool)
 
     # Kepler data needs a special filter for quarter and month
-    mask &= ~np.array(
-        [prov.lower() == "kepler" for prov in products["provenance_name"]]
-    )
+    provenance = np.char.lower(np.asarray(products["provenance_name"], dtype=str))
+    mask &= provenance != "kepler"
     if "kepler" in provenance_lower and campaign is None and sector is None:
         mask |= _mask_kepler_products(products, quarter=quarter, month=month)
 
     # HLSP products need to be filtered by extension
+    filenames = np.char.lower(np.asarray(products["productFilename"], dtype=str))
     if filetype.lower() == "lightcurve":
-        mask &= np.array(
-            [uri.lower().endswith("lc.fits") for uri in products["productFilename"]]
-        )
+        mask &= np.char.endswith(filenames, "lc.fits")
     elif filetype.lower() == "target pixel":
-        mask &= np.array(
-            [
-                uri.lower().endswith(("tp.fits", "targ.fits.gz"))
-                for uri in products["productFilename"]
-            ]
+        mask &= np.char.endswith(filenames, "tp.fits") | np.char.endswith(
+            filenames, "targ.fits.gz"
         )
     elif filetype.lower() == "ffi":
-        mask &= np.array(["TESScut" in desc for desc in products["description"]])
+        descriptions = np.asarray(products["description"], dtype=str)
+        mask &= np.char.find(descriptions, "TESScut") >= 0
 
     # Allow only fits files
-    mask &= np.array(
-        [
-            uri.lower().endswith("fits") or uri.lower().endswith("fits.gz")
-            for uri in products["productFilename"]
-        ]
-    )
+    mask &= np.char.endswith(filenames, "fits") | np.char.endswith(filenames, "fits.gz")
 
     # Filter by cadence
     mask &= _mask_by_exptime(products, exptime)
@@ -1308,22 +2117,20 @@ def _filter_products(
 
 def _mask_kepler_products(products, quarter=None, month=None):
     """Returns a mask flagging the Kepler products that match the criteria."""
-    mask = np.array([proj.lower() == "kepler" for proj in products["provenance_name"]])
+    provenance = np.char.lower(np.asarray(products["provenance_name"], dtype=str))
+    mask = provenance == "kepler"
     if mask.sum() == 0:
         return mask
+    descriptions = np.asarray(products["description"], dtype=str)
 
     # Identify quarter by the description.
     # This is necessary because the `sequence_number` field was not populated
     # for Kepler prime data at the time of writing this function.
     if quarter is not None:
         quarter_mask = np.zeros(len(products), dtype=bool)
+        normalized = np.char.replace(np.char.lower(descriptions), "-", "")
         for q in np.atleast_1d(quarter):
-            quarter_mask |= np.array(
-                [
-                    desc.lower().replace("-", "").endswith("q{}".format(q))
-                    for desc in products["description"]
-                ]
-            )
+            quarter_mask |= np.char.endswith(normalized, "q{}".format(q))
         mask &= quarter_mask
 
     # For Kepler short cadence data the month can be specified
@@ -1339,9 +2146,7 @@ def _mask_kepler_products(products, quarter=None, month=None):
         table["StartTime"] = table["StartTime"].astype(str)
         # Grab the dates of each of the short cadence files.
         # Make sure every entry has the correct month
-        is_shortcadence = mask & np.asarray(
-            ["Short" in desc for desc in products["description"]]
-        )
+        is_shortcadence = mask & (np.char.find(descriptions, "Short") >= 0)
         for idx in np.where(is_shortcadence)[0]:
             quarter = int(
                 products["description"][idx].split(" - ")[-1][1:].replace("-", "")
@@ -2,8 +2,11 @@
 
 from __future__ import division
 import datetime
+import functools
+import io
 import os
 import warnings
+import weakref
 import logging
 
 import collections
@@ -33,6 +36,7 @@ from copy import deepcopy
 
 from . import PACKAGEDIR, MPLSTYLE
 from .lightcurve import LightCurve, KeplerLightCurve, TessLightCurve
+from .collections import LightCurveCollection
 from .prf import KeplerPRF
 from .utils import (
     KeplerQualityFlags,
@@ -91,6 +95,175 @@ class HduToMetaMapping(collections.abc.Mapping):
         return self._dict.__str__()
 
 
+def _aperture_photometry_kernel(
+    flux,
+    flux_err,
+    aperture_mask,
+    column=0,
+    row=0,
+    flux_method="sum",
+    centroid_method="moments",
+):
+    """Performs aperture photometry on a block of cadences in a single pass.
+
+    Parameters
+    ----------
+    flux, flux_err : ndarray
+        Arrays of shape (n_cadences, n_rows, n_cols).
+    aperture_mask : ndarray
+        Boolean array of shape (n_rows, n_cols).
+    column, row : int
+        CCD coordinates of the bottom left pixel, added to the centroids.
+    flux_method : 'sum', 'median', or 'mean'
+        How the pixel values within the aperture are combined.
+    centroid_method : 'moments' or 'quadratic'
+        See `TargetPixelFile.estimate_centroids()`.
+
+    Returns
+    -------
+    flux, flux_err, centroid_col, centroid_row : ndarray
+        Arrays of length n_cadences.  Cadences with only NaN values inside the
+        aperture, or only zero values across the entire image (cf. #873),
+        yield a NaN flux.
+    """
+    if flux_method == "sum" and centroid_method == "moments":
+        numba_kernel = _get_numba_aperture_photometry_kernel()
+        if numba_kernel is not None:
+            # Numba does not support non-native byte orders (FITS is big-endian)
+            flux, flux_err = (
+                values.astype(values.dtype.newbyteorder("="), copy=False)
+                for values in (flux, flux_err)
+            )
+            pixels = np.flatnonzero(aperture_mask)
+            n_cols = aperture_mask.shape[1]
+            return numba_kernel(
+                flux.reshape(len(flux), -1),
+                flux_err.reshape(len(flux_err), -1),
+                pixels,
+                column + pixels % n_cols,
+                row + pixels // n_cols,
+            )
+
+    apflux = flux[:, aperture_mask]
+    apflux_err = flux_err[:, aperture_mask]
+
+    # Estimate centroids
+    if centroid_method == "moments":
+        yy, xx = np.indices(aperture_mask.shape)
+        total_flux = np.nansum(apflux, axis=1)
+        with warnings.catch_warnings():
+            # RuntimeWarnings may occur below if total_flux contains zeros
+            warnings.simplefilter("ignore", RuntimeWarning)
+            centroid_col = (
+                np.nansum((column + xx[aperture_mask]) * apflux, axis=1) / total_flux
+            )
+            centroid_row = (
+                np.nansum((row + yy[aperture_mask]) * apflux, axis=1) / total_flux
+            )
+    else:
+        centroid_col, centroid_row = centroid_quadratic(flux, mask=aperture_mask)
+        centroid_col, centroid_row = centroid_col + column, centroid_row + row
+
+    # Estimate flux
+    if flux_method == "sum":
+        phot_flux = np.nansum(apflux, axis=1)
+    elif flux_method == "median":
+        phot_flux = np.nanmedian(apflux, axis=1)
+    elif flux_method == "mean":
+        phot_flux = np.nanmean(apflux, axis=1)
+    else:
+        raise ValueError("`flux_method` must be one of 'sum', 'median', or 'mean'.")
+
+    # We use ``np.nansum`` above to be robust against a subset of pixels
+    # being NaN, however if *all* pixels are NaN, we propagate a NaN.
+    is_allnan = ~np.any(np.isfinite(apflux), axis=1)
+    phot_flux[is_allnan] = np.nan
+
+    # Similarly, if *all* pixel values across the TPF are exactly zero,
+    # we propagate NaN (cf. #873 for an example of this happening)
+    is_allzero = ~np.any(flux, axis=(1, 2))
+    phot_flux[is_allzero] = np.nan
+
+    # Estimate flux_err
+    with warnings.catch_warnings():
+        # Ignore warnings due to negative errors
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if flux_method == "sum":
+            phot_flux_err = np.nansum(apflux_err ** 2, axis=1) ** 0.5
+        elif flux_method == "median":
+            phot_flux_err = np.nanmedian(apflux_err ** 2, axis=1) ** 0.5
+        elif flux_method == "mean":
+            phot_flux_err = np.nanmean(apflux_err ** 2, axis=1) ** 0.5
+
+        is_allnan = ~np.any(np.isfinite(apflux_err), axis=1)
+        phot_flux_err[is_allnan] = np.nan
+
+    return phot_flux, phot_flux_err, centroid_col, centroid_row
+
+
+@functools.lru_cache(maxsize=None)
+def _get_numba_aperture_photometry_kernel():
+    """Returns a Numba-compiled version of the "sum" and "moments" code path
+    of `_aperture_photometry_kernel()`, or `None` if Numba is not installed.
+
+    The kernel visits every pixel value once, rather than once per statistic.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(nogil=True, error_model="numpy")
+    def kernel(flux, flux_err, pixels, pixel_cols, pixel_rows):
+        n_cadences, n_pixels = flux.shape
+        phot_flux = np.empty(n_cadences, dtype=flux.dtype)
+        phot_flux_err = np.empty(n_cadences, dtype=flux_err.dtype)
+        centroid_col = np.empty(n_cadences)
+        centroid_row = np.empty(n_cadences)
+        for idx in range(n_cadences):
+            total, col_total, row_total, err_total = 0.0, 0.0, 0.0, 0.0
+            any_finite, any_finite_err = False, False
+            for pix_idx in range(len(pixels)):
+                value = flux[idx, pixels[pix_idx]]
+                if not np.isnan(value):
+                    total += value
+                    col_total += pixel_cols[pix_idx] * value
+                    row_total += pixel_rows[pix_idx] * value
+                    any_finite = any_finite or np.isfinite(value)
+                err = flux_err[idx, pixels[pix_idx]]
+                if not np.isnan(err):
+                    err_total += err * err
+                    any_finite_err = any_finite_err or np.isfinite(err)
+            all_zero = True
+            for pix_idx in range(n_pixels):
+                if flux[idx, pix_idx] != 0:
+                    all_zero = False
+                    break
+            centroid_col[idx] = col_total / total
+            centroid_row[idx] = row_total / total
+            phot_flux[idx] = total if (any_finite and not all_zero) else np.nan
+            phot_flux_err[idx] = np.sqrt(err_total) if any_finite_err else np.nan
+        return phot_flux, phot_flux_err, centroid_col, centroid_row
+
+    return kernel
+
+
+ColumnCacheInfo = collections.namedtuple(
+    "ColumnCacheInfo", ["hits", "misses", "currsize", "nbytes"]
+)
+
+
+def _unpickle_target_pixel_file(cls, data, state):
+    """Recreates a target pixel file pickled by `TargetPixelFile.__reduce__`."""
+    tpf = cls(
+        fits.open(io.BytesIO(data)),
+        quality_bitmask=state["_quality_bitmask"],
+        targetid=state.get("targetid"),
+    )
+    tpf.__dict__.update(state)
+    return tpf
+
+
 class TargetPixelFile(object):
     """Abstract class representing FITS files which contain time series imaging data.
 
@@ -98,29 +271,55 @@ class TargetPixelFile(object):
     see `KeplerTargetPixelFile` and `TessTargetPixelFile` instead.
     """
 
-    def __init__(self, path, quality_bitmask="default", targetid=None, **kwargs):
+    # Number of cadences read from disk at a time by lazily-opened files
+    lazy_block_size = 1024
+
+    def __init__(
+        self, path, quality_bitmask="default", targetid=None, lazy=False, **kwargs
+    ):
+        # Quality-masked data columns are materialized once and cached here,
+        # see `_get_masked_column()`.
+        self._column_cache = {}
+        self._column_cache_hits = 0
+        self._column_cache_misses = 0
+        # Slices which share their data table with this object, or the object
+        # whose data table this slice shares, see `_slice_view()`.
+        self._views = weakref.WeakSet()
+        self._base = None
         self.path = path
+        self.lazy = lazy
         if isinstance(path, fits.HDUList):
             self.hdu = path
         elif (isinstance(path, str) and path.startswith('s3://')):
             # Filename is an S3 cloud URI
             self.hdu = fits.open(path, use_fsspec=True, fsspec_kwargs={"anon": True}, **kwargs)
         else:
+            if lazy:
+                # Keep the pixel data on disk until a block of it is needed,
+                # even if memory mapping is disabled in AstroPy's configuration
+                kwargs.setdefault("memmap", True)
             self.hdu = fits.open(self.path, **kwargs)
         try:
             self.quality_bitmask = quality_bitmask
             self.targetid = targetid
 
             # For consistency with `LightCurve`, provide a `meta` dictionary
-            self.meta = HduToMetaMapping(self.hdu[0])
+            self.meta = HduToMetaMapping(self._hdu[0])
         except Exception as e:
             # Cannot instantiate TargetPixelFile, close the HDU to release the file handle
-            self.hdu.close()
+            self._hdu.close()
             raise e
 
     def __getitem__(self, key):
         """Implements indexing and slicing.
 
+        If the selected cadences form a contiguous range of rows in the data
+        table (ignoring rows rejected by the quality mask), the returned object
+        shares its data with this one instead of copying it.  The data are
+        copied on write: as soon as the `hdu` attribute of either object is
+        accessed, through which the data may be modified, the slices stop
+        sharing their data with this object.
+
         Note: the implementation below cannot be be simplified using
             `copy[1].data = copy[1].data[self.quality_mask][key]`
         due to the complicated behavior of AstroPy's `FITS_rec`.
@@ -139,19 +338,127 @@ class TargetPixelFile(object):
         else:
             selected_idx = quality_idx[key]
 
-        # Step 2: use the indexes to create a new copy of the data.
+        # Step 2: avoid copying the data if a view of the table will do.
+        view = self._slice_view(selected_idx)
+        if view is not None:
+            return view
+
+        # Step 3: use the indexes to create a new copy of the data.
         with warnings.catch_warnings():
             # Ignore warnings about empty fields
             warnings.simplefilter("ignore", UserWarning)
             # AstroPy added `HDUList.copy()` in v3.1, allowing us to avoid manually
             # copying the HDUs, which brought along unexpected memory leaks.
-            copy = self.hdu.copy()
+            copy = self._hdu.copy()
             copy[1] = BinTableHDU(
-                data=self.hdu[1].data[selected_idx], header=self.hdu[1].header
+                data=self._hdu[1].data[selected_idx], header=self._hdu[1].header
+            )
+        tpf = self.__class__(
+            copy,
+            quality_bitmask=self.quality_bitmask,
+            targetid=self.targetid,
+            lazy=self.lazy,
+        )
+        tpf.lazy_block_size = self.lazy_block_size
+        return tpf
+
+    def _slice_view(self, selected_idx):
+        """Returns a new object whose data table is a view of rows
+        ``selected_idx[0]`` to ``selected_idx[-1]`` of this object's table.
+
+        Returns `None` if the selected cadences cannot be represented by such
+        a view, e.g. if good-quality cadences were skipped by a stepped slice.
+        """
+        if len(selected_idx) == 0 or np.any(np.diff(selected_idx) <= 0):
+            return None
+        start, stop = selected_idx[0], selected_idx[-1] + 1
+        # All rows in the view which were not selected need to be rejected
+        # by the quality mask, otherwise the view would contain extra cadences.
+        view_mask = np.zeros(stop - start, dtype=bool)
+        view_mask[selected_idx - start] = True
+        if not np.array_equal(view_mask, self.quality_mask[start:stop]):
+            return None
+
+        with warnings.catch_warnings():
+            # Ignore warnings about empty fields
+            warnings.simplefilter("ignore", UserWarning)
+            hdulist = fits.HDUList(
+                [
+                    BinTableHDU(
+                        data=self._hdu[1].data[start:stop], header=self._hdu[1].header
+                    )
+                    if idx == 1
+                    else hdu.copy()
+                    for idx, hdu in enumerate(self._hdu)
+                ]
             )
-        return self.__class__(
-            copy, quality_bitmask=self.quality_bitmask, targetid=self.targetid
+        view = self.__class__(
+            hdulist,
+            quality_bitmask=self.quality_bitmask,
+            targetid=self.targetid,
+            lazy=self.lazy,
         )
+        view.lazy_block_size = self.lazy_block_size
+        # The quality mask may have been modified after the object was created
+        if not np.array_equal(view.quality_mask, view_mask):
+            return None
+        # The views of a view share the data of the original object
+        view._base = self if self._base is None else self._base
+        view._base._views.add(view)
+        return view
+
+    def _unshare_data(self):
+        """Stops sharing the data table with other objects, before it may be
+        modified in place through `hdu`.
+
+        A slice copies the rows of the data table it shares, whereas the object
+        from which slices were created makes these slices copy their rows.
+        """
+        if self._base is not None:
+            self._base._views.discard(self)
+            self._base = None
+            with warnings.catch_warnings():
+                # Ignore warnings about empty fields
+                warnings.simplefilter("ignore", UserWarning)
+                self._hdu[1] = BinTableHDU(
+                    data=self._hdu[1].data.copy(), header=self._hdu[1].header
+                )
+        for view in list(self._views):
+            view._unshare_data()
+
+    def copy(self):
+        """Returns a copy which does not share any data with this object.
+
+        Returns
+        -------
+        tpf : `TargetPixelFile`
+            A deep copy of this Target Pixel File.
+        """
+        tpf = self.__class__(
+            deepcopy(self._hdu),
+            quality_bitmask=self.quality_bitmask,
+            targetid=self.targetid,
+            lazy=self.lazy,
+        )
+        tpf.lazy_block_size = self.lazy_block_size
+        tpf.quality_mask = self.quality_mask.copy()
+        return tpf
+
+    def __reduce__(self):
+        """Allows target pixel files to be pickled, e.g. to be sent to other
+        processes.  The HDU list is pickled as an in-memory FITS file, because
+        it may refer to an open file."""
+        buffer = io.BytesIO()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", AstropyWarning)
+            self._hdu.writeto(buffer, output_verify="ignore")
+        state = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key
+            not in ("_hdu", "meta", "_column_cache", "lazy", "_views", "_base")
+        }
+        return (_unpickle_target_pixel_file, (self.__class__, buffer.getvalue(), state))
 
     def __len__(self):
         return len(self.time)
@@ -159,14 +466,14 @@ class TargetPixelFile(object):
     def __add__(self, other):
         if isinstance(other, Quantity):
             other = other.value
-        hdu = deepcopy(self.hdu)
+        hdu = deepcopy(self._hdu)
         hdu[1].data["FLUX"][self.quality_mask] += other
         return type(self)(hdu, quality_bitmask=self.quality_bitmask)
 
     def __mul__(self, other):
         if isinstance(other, Quantity):
             other = other.value
-        hdu = deepcopy(self.hdu)
+        hdu = deepcopy(self._hdu)
         hdu[1].data["FLUX"][self.quality_mask] *= other
         hdu[1].data["FLUX_ERR"][self.quality_mask] *= other
         return type(self)(hdu, quality_bitmask=self.quality_bitmask)
@@ -174,7 +481,7 @@ class TargetPixelFile(object):
     def __rtruediv__(self, other):
         if isinstance(other, Quantity):
             other = other.value
-        hdu = deepcopy(self.hdu)
+        hdu = deepcopy(self._hdu)
         hdu[1].data["FLUX"][self.quality_mask] /= other
         hdu[1].data["FLUX_ERR"][self.quality_mask] /= other
         return type(self)(hdu, quality_bitmask=self.quality_bitmask)
@@ -208,6 +515,15 @@ class TargetPixelFile(object):
 
     @property
     def hdu(self):
+        """The `~astropy.io.fits.HDUList` object of the file.
+
+        Because the data may be modified in place through this attribute, e.g.
+        ``tpf.hdu[1].data["FLUX"][0] = 0``, accessing it empties the cache of
+        quality-masked data columns (see `column_cache_info()`), and copies
+        the data shared with slices of this object (see `__getitem__()`).
+        """
+        self._unshare_data()
+        self._invalidate_column_cache()
         return self._hdu
 
     @hdu.setter
@@ -229,7 +545,145 @@ class TargetPixelFile(object):
                     "File {} does not have a {} column, "
                     "is this a target pixel file?".format(self.path, key)
                 )
+        # The slices keep a copy of the data they share with the previous value
+        if self._base is not None:
+            self._base._views.discard(self)
+            self._base = None
+        for view in list(self._views):
+            view._unshare_data()
         self._hdu = value
+        self._invalidate_column_cache()
+
+    @property
+    def quality_bitmask(self):
+        return self._quality_bitmask
+
+    @quality_bitmask.setter
+    def quality_bitmask(self, value):
+        self._quality_bitmask = value
+        self._invalidate_column_cache()
+
+    @property
+    def quality_mask(self):
+        """Boolean array flagging the good-quality cadences."""
+        return self._quality_mask
+
+    @quality_mask.setter
+    def quality_mask(self, value):
+        self._quality_mask = value
+        self._invalidate_column_cache()
+
+    def _invalidate_column_cache(self):
+        """Drops the cached quality-masked columns, e.g. because `hdu` changed."""
+        self._column_cache = {}
+
+    def _get_masked_column(self, name):
+        """Returns the good-quality cadences of data column ``name``.
+
+        The masked array is computed once and cached, so that the methods
+        which use the data repeatedly do not copy the full data cube again.
+        The cached array is read-only and must not be returned to users, see
+        `_get_masked_quantity()`.  The cache is invalidated whenever `hdu` is
+        accessed, or `quality_bitmask` or `quality_mask` are set.
+
+        If the file was opened with ``lazy=True``, the pixel data are read in
+        blocks of cadences every time and are not cached, so that they do not
+        stay in memory.  The array returned is then writable.
+        """
+        try:
+            values = self._column_cache[name]
+        except KeyError:
+            self._column_cache_misses += 1
+            column = self._hdu[1].data[name]
+            if self.lazy and column.ndim > 1:
+                values = np.empty(
+                    (np.count_nonzero(self.quality_mask),) + column.shape[1:],
+                    dtype=column.dtype,
+                )
+                start = 0
+                for block in self._iter_masked_column_blocks(name):
+                    values[start : start + len(block)] = block
+                    start += len(block)
+                return values
+            values = column[self.quality_mask]
+            values.flags.writeable = False
+            self._column_cache[name] = values
+        else:
+            self._column_cache_hits += 1
+        return values
+
+    def _get_masked_quantity(self, name, unit=None, copy=True):
+        """Returns the good-quality cadences of data column ``name`` as a
+        `~astropy.units.Quantity`.
+
+        By default, the values are a writable copy of the cached column, which
+        the public properties such as `flux` return.  Internal methods which do
+        not modify the values can pass ``copy=False`` to avoid the copy.
+        """
+        values = self._get_masked_column(name)
+        if copy and not values.flags.writeable:
+            values = values.copy()
+        return Quantity(values, unit=unit, copy=False)
+
+    def _iter_masked_column_blocks(self, name, aperture_mask=None):
+        """Yields the good-quality cadences of data column ``name`` in blocks.
+
+        If the file was opened with ``lazy=True``, blocks of at most
+        `lazy_block_size` cadences are yielded, which are read from disk unless
+        the column has been cached already.  The blocks are the same for every
+        column, so that the blocks of several columns can be zipped together.
+        Otherwise, the cached column is yielded as a single block.
+        If ``aperture_mask`` is given, only the selected pixels are yielded,
+        i.e. each block has shape (n_cadences, n_pixels).
+        """
+        if not self.lazy:
+            blocks = [self._get_masked_column(name)]
+        else:
+            cadences = np.flatnonzero(self.quality_mask)
+            # `max()` ensures an empty block is yielded if there are no cadences
+            starts = range(0, max(len(cadences), 1), self.lazy_block_size)
+            stops = (start + self.lazy_block_size for start in starts)
+            if name in self._column_cache:
+                column = self._column_cache[name]
+                blocks = (column[start:stop] for start, stop in zip(starts, stops))
+            else:
+                column = self._hdu[1].data[name]
+                blocks = (
+                    column[cadences[start:stop]] for start, stop in zip(starts, stops)
+                )
+        for block in blocks:
+            if aperture_mask is not None:
+                block = block[:, aperture_mask]
+            yield block
+
+    def column_cache_info(self):
+        """Returns statistics on the cache of quality-masked data columns.
+
+        Returns
+        -------
+        info : `ColumnCacheInfo`
+            Named tuple containing the number of cache ``hits`` and ``misses``,
+            the number of columns currently cached (``currsize``), and the
+            memory they occupy (``nbytes``).
+        """
+        return ColumnCacheInfo(
+            hits=self._column_cache_hits,
+            misses=self._column_cache_misses,
+            currsize=len(self._column_cache),
+            nbytes=sum(v.nbytes for v in self._column_cache.values()),
+        )
+
+    def clear_column_cache(self):
+        """Empties the cache of quality-masked data columns and resets its statistics.
+
+        The cache is also emptied whenever `hdu` is accessed, so this only
+        needs to be called after modifying the data of an `hdu` object which
+        was obtained before the data columns were read, for the change to be
+        reflected by properties such as `flux`.
+        """
+        self._invalidate_column_cache()
+        self._column_cache_hits = 0
+        self._column_cache_misses = 0
 
     def get_keyword(self, keyword, hdu=0, default=None):
         """Returns a header keyword value.
@@ -237,7 +691,7 @@ class TargetPixelFile(object):
         If the keyword is Undefined or does not exist,
         then return ``default`` instead.
         """
-        return self.hdu[hdu].header.get(keyword, default)
+        return self._hdu[hdu].header.get(keyword, default)
 
     @property
     @deprecated(
@@ -245,7 +699,7 @@ class TargetPixelFile(object):
     )
     def header(self):
         """DEPRECATED. Please use ``get_header()`` instead."""
-        return self.hdu[0].header
+        return self._hdu[0].header
 
     def get_header(self, ext=0):
         """Returns the metadata embedded in the file.
@@ -270,7 +724,7 @@ class TargetPixelFile(object):
         header : `~astropy.io.fits.header.Header`
             Header object containing metadata keywords.
         """
-        return self.hdu[ext].header
+        return self._hdu[ext].header
 
     @property
     def ra(self):
@@ -295,12 +749,12 @@ class TargetPixelFile(object):
     @property
     def pos_corr1(self):
         """Returns the column position correction."""
-        return self.hdu[1].data["POS_CORR1"][self.quality_mask]
+        return self._get_masked_column("POS_CORR1").copy()
 
     @property
     def pos_corr2(self):
         """Returns the row position correction."""
-        return self.hdu[1].data["POS_CORR2"][self.quality_mask]
+        return self._get_masked_column("POS_CORR2").copy()
 
     @property
     def pipeline_mask(self):
@@ -313,26 +767,29 @@ class TargetPixelFile(object):
         # bit number 2 in the aperture mask extension, e.g. see Section 6 of
         # the TESS Data Products documentation (EXP-TESS-ARC-ICD-TM-0014.pdf).
         try:
-            return self.hdu[2].data & 2 > 0
+            return self._hdu[2].data & 2 > 0
         except (IndexError, TypeError):
             # `IndexError` may be raised if the aperture extension (#2) is missing
             # `TypeError` may be raised because early versions of TESScut returned floats in HDU 2
-            return np.ones(self.hdu[1].data["FLUX"][0].shape, dtype=bool)
+            return np.ones(self._hdu[1].data["FLUX"][0].shape, dtype=bool)
 
     @property
     def shape(self):
         """Return the cube dimension shape."""
-        return self.flux.shape
+        n_cadences = np.count_nonzero(self.quality_mask)
+        return (n_cadences,) + self._hdu[1].data["FLUX"].shape[1:]
 
     @property
     def time(self) -> Time:
         """Returns the time for all good-quality cadences."""
-        time_values = self.hdu[1].data["TIME"][self.quality_mask]
+        time_values = self._get_masked_column("TIME")
         # Some data products have missing time values;
         # we need to set these to zero or `Time` cannot be instantiated.
-        time_values[~np.isfinite(time_values)] = 0
+        time_finite = np.isfinite(time_values)
+        if not time_finite.all():
+            time_values = np.where(time_finite, time_values, 0)
 
-        bjdrefi = self.hdu[1].header.get("BJDREFI")
+        bjdrefi = self._hdu[1].header.get("BJDREFI")
         if bjdrefi == 2454833:
             time_format = "bkjd"
         elif bjdrefi == 2457000:
@@ -342,32 +799,35 @@ class TargetPixelFile(object):
 
         return Time(
             time_values,
-            scale=self.hdu[1].header.get("TIMESYS", "tdb").lower(),
+            scale=self._hdu[1].header.get("TIMESYS", "tdb").lower(),
             format=time_format,
         )
 
     @property
     def cadenceno(self):
         """Return the cadence number for all good-quality cadences."""
-        cadenceno = self.hdu[1].data["CADENCENO"][self.quality_mask]
+        cadenceno = self._get_masked_column("CADENCENO")
         # The TESScut service returns an array of zeros as CADENCENO.
         # If this is the case, return frame numbers from 0 instead.
         if cadenceno[0] == 0:
             return np.arange(0, len(cadenceno), 1, dtype=int)
-        return cadenceno
+        return cadenceno.copy()
 
     @property
     def nan_time_mask(self):
         """Returns a boolean mask flagging cadences whose time is `nan`."""
         return self.time.value == 0
 
+    @property
+    def _flux_unit(self):
+        if self.get_header(1).get("TUNIT5") == "e-/s":
+            return u.Unit("electron/s")
+        return None
+
     @property
     def flux(self) -> Quantity:
         """Returns the flux for all good-quality cadences."""
-        unit = None
-        if self.get_header(1).get("TUNIT5") == "e-/s":
-            unit = "electron/s"
-        return Quantity(self.hdu[1].data["FLUX"][self.quality_mask], unit=unit)
+        return self._get_masked_quantity("FLUX", unit=self._flux_unit)
 
     @property
     def flux_err(self) -> Quantity:
@@ -375,25 +835,21 @@ class TargetPixelFile(object):
         unit = None
         if self.get_header(1).get("TUNIT6") == "e-/s":
             unit = "electron/s"
-        return Quantity(self.hdu[1].data["FLUX_ERR"][self.quality_mask], unit=unit)
+        return self._get_masked_quantity("FLUX_ERR", unit=unit)
 
     @property
     def flux_bkg(self) -> Quantity:
         """Returns the background flux for all good-quality cadences."""
-        return Quantity(
-            self.hdu[1].data["FLUX_BKG"][self.quality_mask], unit="electron/s"
-        )
+        return self._get_masked_quantity("FLUX_BKG", unit="electron/s")
 
     @property
     def flux_bkg_err(self) -> Quantity:
-        return Quantity(
-            self.hdu[1].data["FLUX_BKG_ERR"][self.quality_mask], unit="electron/s"
-        )
+        return self._get_masked_quantity("FLUX_BKG_ERR", unit="electron/s")
 
     @property
     def quality(self):
         """Returns the quality flag integer of every good cadence."""
-        return self.hdu[1].data["QUALITY"][self.quality_mask]
+        return self._get_masked_column("QUALITY").copy()
 
     @property
     def wcs(self) -> WCS:
@@ -405,11 +861,11 @@ class TargetPixelFile(object):
         w : `astropy.wcs.WCS` object
             WCS solution
         """
-        if "MAST" in self.hdu[0].header["ORIGIN"]:  # Is it a TessCut TPF?
+        if "MAST" in self._hdu[0].header["ORIGIN"]:  # Is it a TessCut TPF?
             # TPF's generated using the TESSCut service in early 2019 only appear
             # to contain a valid WCS in the second extension (the aperture
             # extension), so we treat such files as a special case.
-            return WCS(self.hdu[2])
+            return WCS(self._hdu[2])
         else:
             # For standard (Ames-pipeline-produced) TPF files, we use the WCS
             # keywords provided in the first extension (the data table extension).
@@ -434,8 +890,8 @@ class TargetPixelFile(object):
             }
             mywcs = {}
             for oldkey, newkey in wcs_keywords.items():
-                if self.hdu[1].header.get(oldkey, None) is not None:
-                    mywcs[newkey] = self.hdu[1].header[oldkey]
+                if self._hdu[1].header.get(oldkey, None) is not None:
+                    mywcs[newkey] = self._hdu[1].header[oldkey]
             return WCS(mywcs)
 
     def get_coordinates(self, cadence="all"):
@@ -459,8 +915,8 @@ class TargetPixelFile(object):
         """
         w = self.wcs
         X, Y = np.meshgrid(np.arange(self.shape[2]), np.arange(self.shape[1]))
-        pos_corr1_pix = np.copy(self.hdu[1].data["POS_CORR1"])
-        pos_corr2_pix = np.copy(self.hdu[1].data["POS_CORR2"])
+        pos_corr1_pix = np.copy(self._hdu[1].data["POS_CORR1"])
+        pos_corr2_pix = np.copy(self._hdu[1].data["POS_CORR2"])
 
         # We zero POS_CORR* when the values are NaN or make no sense (>50px)
         with warnings.catch_warnings():  # Comparing NaNs to numbers is OK here
@@ -712,7 +1168,17 @@ class TargetPixelFile(object):
         # Calculate the median image
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            median_image = np.nanmedian(self.flux, axis=0)
+            if self.lazy and "FLUX" not in self._column_cache:
+                # Read one row of pixels at a time to bound the memory usage
+                flux = self._hdu[1].data["FLUX"]
+                median_image = np.array(
+                    [
+                        np.nanmedian(flux[:, row][self.quality_mask], axis=0)
+                        for row in range(flux.shape[1])
+                    ]
+                )
+            else:
+                median_image = np.nanmedian(self._get_masked_column("FLUX"), axis=0)
         vals = median_image[np.isfinite(median_image)].flatten()
         # Calculate the theshold value in flux units
         mad_cut = (1.4826 * MAD(vals) * threshold) + np.nanmedian(median_image)
@@ -773,7 +1239,13 @@ class TargetPixelFile(object):
         """
         mask = self._parse_aperture_mask(aperture_mask)
         # For each cadence, compute the median pixel flux across the background
-        simple_bkg = np.nanmedian(self.flux[:, mask], axis=1) / u.pixel
+        simple_bkg = np.concatenate(
+            [
+                np.nanmedian(block, axis=1)
+                for block in self._iter_masked_column_blocks("FLUX", mask)
+            ]
+        )
+        simple_bkg = Quantity(simple_bkg, unit=self._flux_unit) / u.pixel
         return LightCurve(time=self.time, flux=simple_bkg)
 
     def estimate_centroids(self, aperture_mask="default", method="moments"):
@@ -834,16 +1306,13 @@ class TargetPixelFile(object):
         yy, xx = np.indices(self.shape[1:])
         yy = self.row + yy
         xx = self.column + xx
-        total_flux = np.nansum(self.flux[:, aperture_mask], axis=1)
+        flux = self._get_masked_quantity("FLUX", unit=self._flux_unit, copy=False)
+        total_flux = np.nansum(flux[:, aperture_mask], axis=1)
         with warnings.catch_warnings():
             # RuntimeWarnings may occur below if total_flux contains zeros
             warnings.simplefilter("ignore", RuntimeWarning)
-            col_centr = (
-                np.nansum(xx * aperture_mask * self.flux, axis=(1, 2)) / total_flux
-            )
-            row_centr = (
-                np.nansum(yy * aperture_mask * self.flux, axis=(1, 2)) / total_flux
-            )
+            col_centr = np.nansum(xx * aperture_mask * flux, axis=(1, 2)) / total_flux
+            row_centr = np.nansum(yy * aperture_mask * flux, axis=(1, 2)) / total_flux
         return col_centr * u.pixel, row_centr * u.pixel
 
     def _estimate_centroids_via_quadratic(self, aperture_mask):
@@ -851,12 +1320,12 @@ class TargetPixelFile(object):
         this is a helper method for `estimate_centroids()`."""
         aperture_mask = self._parse_aperture_mask(aperture_mask)
         col_centr, row_centr = [], []
-        for idx in range(len(self.time)):
-            col, row = centroid_quadratic(self.flux[idx], mask=aperture_mask)
+        for flux in self._iter_masked_column_blocks("FLUX"):
+            col, row = centroid_quadratic(flux, mask=aperture_mask)
             col_centr.append(col)
             row_centr.append(row)
-        col_centr = np.asfarray(col_centr) + self.column
-        row_centr = np.asfarray(row_centr) + self.row
+        col_centr = np.concatenate(col_centr) + self.column
+        row_centr = np.concatenate(row_centr) + self.row
         col_centr = Quantity(col_centr, unit="pixel")
         row_centr = Quantity(row_centr, unit="pixel")
         return col_centr, row_centr
@@ -866,6 +1335,9 @@ class TargetPixelFile(object):
     ):
         """Helper method for ``extract_aperture photometry``.
 
+        The flux, flux_err, and centroids are computed together by
+        `_aperture_photometry_kernel()` in a single pass over the data cube.
+
         Returns
         -------
         flux, flux_err, centroid_col, centroid_row
@@ -874,58 +1346,176 @@ class TargetPixelFile(object):
         apmask = self._parse_aperture_mask(aperture_mask)
         if apmask.sum() == 0:
             log.warning("Warning: aperture mask contains zero pixels.")
+        centroid_method = validate_method(centroid_method, ["moments", "quadratic"])
+        if flux_method not in ["sum", "median", "mean"]:
+            raise ValueError("`flux_method` must be one of 'sum', 'median', or 'mean'.")
 
-        # Estimate centroids
-        centroid_col, centroid_row = self.estimate_centroids(
-            apmask, method=centroid_method
+        blocks = zip(
+            self._iter_masked_column_blocks("FLUX"),
+            self._iter_masked_column_blocks("FLUX_ERR"),
         )
+        results = [
+            _aperture_photometry_kernel(
+                flux,
+                flux_err,
+                apmask,
+                column=self.column,
+                row=self.row,
+                flux_method=flux_method,
+                centroid_method=centroid_method,
+            )
+            for flux, flux_err in blocks
+        ]
+        flux, flux_err, centroid_col, centroid_row = (
+            np.concatenate(values) for values in zip(*results)
+        )
+        centroid_col = Quantity(centroid_col, unit="pixel")
+        centroid_row = Quantity(centroid_row, unit="pixel")
 
-        # Estimate flux
-        if flux_method == "sum":
-            flux = np.nansum(self.flux[:, apmask], axis=1)
-
-        elif flux_method == "median":
-            flux = np.nanmedian(self.flux[:, apmask], axis=1)
+        if self.get_header(1).get("TUNIT5") == "e-/s":
+            flux = Quantity(flux, unit="electron/s")
+        if self.get_header(1).get("TUNIT6") == "e-/s":
+            flux_err = Quantity(flux_err, unit="electron/s")
 
-        elif flux_method == "mean":
-            flux = np.nanmean(self.flux[:, apmask], axis=1)
-        else:
-            raise ValueError("`flux_method` must be one of 'sum', 'median', or 'mean'.")
+        return flux, flux_err, centroid_col, centroid_row
 
-        # In the future we may wish to add a user specified function
+    def extract_aperture_photometry_batch(
+        self, aperture_masks, flux_method="sum", centroid_method="moments"
+    ):
+        """Returns the light curves obtained using several aperture masks.
 
-        # We use ``np.nansum`` above to be robust against a subset of pixels
-        # being NaN, however if *all* pixels are NaN, we propagate a NaN.
-        is_allnan = ~np.any(np.isfinite(self.flux[:, apmask]), axis=1)
-        flux[is_allnan] = np.nan
+        This is equivalent to calling `extract_aperture_photometry()` for each
+        mask, but much faster for many masks: the photometry for all masks is
+        computed together using a single matrix product of the
+        (n_cadences x n_pixels) data with the (n_pixels x n_masks) masks.
 
-        # Similarly, if *all* pixel values across the TPF are exactly zero,
-        # we propagate NaN (cf. #873 for an example of this happening)
-        is_allzero = np.all(self.flux == 0, axis=(1, 2))
-        flux[is_allzero] = np.nan
+        Parameters
+        ----------
+        aperture_masks : list or 3D array-like
+            Sequence of aperture masks, e.g. a boolean array of shape
+            (n_masks, n_rows, n_cols). Each element accepts the same values as
+            the ``aperture_mask`` argument of `extract_aperture_photometry()`.
+        flux_method: 'sum', 'median', or 'mean'
+            Determines how the pixel values within each aperture mask are
+            combined at each cadence. Only 'sum' and 'mean' benefit from the
+            matrix product; 'median' falls back to one extraction per mask.
+        centroid_method : str, 'moments' or 'quadratic'
+            For the details on this arguments, please refer to the documentation
+            for `estimate_centroids()`.
 
-        # Estimate flux_err
-        with warnings.catch_warnings():
-            # Ignore warnings due to negative errors
-            warnings.simplefilter("ignore", RuntimeWarning)
-            if flux_method == "sum":
-                flux_err = np.nansum(self.flux_err[:, apmask] ** 2, axis=1) ** 0.5
+        Returns
+        -------
+        lcs : `LightCurveCollection` object
+            One light curve per aperture mask, in the order of ``aperture_masks``.
+        """
+        aperture_masks = [
+            self._resolve_default_aperture_mask(mask) for mask in aperture_masks
+        ]
+        if flux_method == "median":
+            return LightCurveCollection(
+                [
+                    self.extract_aperture_photometry(
+                        mask, flux_method=flux_method, centroid_method=centroid_method
+                    )
+                    for mask in aperture_masks
+                ]
+            )
+        results = self._aperture_photometry_batch(
+            [self._parse_aperture_mask(mask) for mask in aperture_masks],
+            flux_method=flux_method,
+            centroid_method=centroid_method,
+        )
+        return LightCurveCollection(
+            [
+                self._make_aperture_lightcurve(*result, aperture_mask=mask)
+                for result, mask in zip(results, aperture_masks)
+            ]
+        )
 
-            elif flux_method == "median":
-                flux_err = np.nanmedian(self.flux_err[:, apmask] ** 2, axis=1) ** 0.5
+    def _aperture_photometry_batch(
+        self, aperture_masks, flux_method="sum", centroid_method="moments"
+    ):
+        """Helper method for ``extract_aperture_photometry_batch``.
 
-            elif flux_method == "mean":
-                flux_err = np.nanmean(self.flux_err[:, apmask] ** 2, axis=1) ** 0.5
+        Returns
+        -------
+        results : list of tuples
+            (flux, flux_err, centroid_col, centroid_row) for each mask.
+        """
+        centroid_method = validate_method(centroid_method, ["moments", "quadratic"])
+        if flux_method not in ["sum", "mean"]:
+            raise ValueError("`flux_method` must be one of 'sum' or 'mean'.")
+        for mask in aperture_masks:
+            if mask.sum() == 0:
+                log.warning("Warning: aperture mask contains zero pixels.")
+        # Weight matrix of shape (n_pixels, n_masks)
+        weights = np.reshape(aperture_masks, (len(aperture_masks), -1)).T.astype(float)
+        yy, xx = np.indices(self.shape[1:])
+        pixel_cols = (self.column + xx).ravel()
+        pixel_rows = (self.row + yy).ravel()
 
-            is_allnan = ~np.any(np.isfinite(self.flux_err[:, apmask]), axis=1)
-            flux_err[is_allnan] = np.nan
+        blocks = zip(
+            self._iter_masked_column_blocks("FLUX"),
+            self._iter_masked_column_blocks("FLUX_ERR"),
+        )
+        block_results = []
+        for flux_cube, flux_err_cube in blocks:
+            flux = flux_cube.reshape(len(flux_cube), -1)
+            flux_err = flux_err_cube.reshape(len(flux_err_cube), -1)
+            is_finite = np.isfinite(flux)
+            # Equivalent to `np.nansum` for finite values; non-finite values
+            # are zeroed because 0 * inf would contaminate the other masks.
+            flux_finite = np.where(is_finite, flux, 0)
+            total = flux_finite @ weights
+            n_finite = is_finite @ weights
+            n_notnan = ~np.isnan(flux) @ weights
+            is_inf = np.isinf(flux)
+            if is_inf.any():
+                # Rare case: propagate infinities the way `np.nansum` does
+                for idx, mask_idx in np.argwhere(is_inf @ weights > 0):
+                    total[idx, mask_idx] = np.nansum(
+                        flux[idx, weights[:, mask_idx] > 0]
+                    )
+            with warnings.catch_warnings():
+                # RuntimeWarnings may occur below if total contains zeros
+                warnings.simplefilter("ignore", RuntimeWarning)
+                if centroid_method == "moments":
+                    centroid_col = ((flux_finite * pixel_cols) @ weights) / total
+                    centroid_row = ((flux_finite * pixel_rows) @ weights) / total
+                else:
+                    centroids = [
+                        centroid_quadratic(flux_cube, mask=mask)
+                        for mask in aperture_masks
+                    ]
+                    centroid_col = np.transpose([c[0] for c in centroids]) + self.column
+                    centroid_row = np.transpose([c[1] for c in centroids]) + self.row
+                flux_err_sq = np.where(np.isnan(flux_err), 0, flux_err ** 2)
+                total_err_sq = flux_err_sq @ weights
+                if flux_method == "mean":
+                    total = total / n_notnan
+                    total_err_sq = total_err_sq / (~np.isnan(flux_err) @ weights)
+                total_err = total_err_sq ** 0.5
+            # Propagate NaNs for all-NaN apertures and all-zero images (cf. #873)
+            total[n_finite == 0] = np.nan
+            total[~np.any(flux, axis=1)] = np.nan
+            total_err[(np.isfinite(flux_err) @ weights) == 0] = np.nan
+            block_results.append((total, total_err, centroid_col, centroid_row))
+
+        flux, flux_err, centroid_col, centroid_row = (
+            np.concatenate(values) for values in zip(*block_results)
+        )
+        centroid_col = Quantity(centroid_col, unit="pixel")
+        centroid_row = Quantity(centroid_row, unit="pixel")
 
         if self.get_header(1).get("TUNIT5") == "e-/s":
             flux = Quantity(flux, unit="electron/s")
         if self.get_header(1).get("TUNIT6") == "e-/s":
             flux_err = Quantity(flux_err, unit="electron/s")
 
-        return flux, flux_err, centroid_col, centroid_row
+        return [
+            (flux[:, idx], flux_err[:, idx], centroid_col[:, idx], centroid_row[:, idx])
+            for idx in range(len(aperture_masks))
+        ]
 
     def query_solar_system_objects(
         self,
@@ -1126,7 +1716,7 @@ class TargetPixelFile(object):
                 else:
                     data_to_plot = self.flux[frame]
             else:
-                data_to_plot = self.hdu[1].data[column][self.quality_mask][frame]
+                data_to_plot = self._get_masked_column(column)[frame]
         except KeyError:
             raise ValueError(
                 "column must be one of the following: ('FLUX','FLUX_ERR',"
@@ -1233,7 +1823,7 @@ class TargetPixelFile(object):
 
         def animate(i):
             frame = i * step
-            ax.images[0].set_data(self.hdu[1].data[column][self.quality_mask][frame])
+            ax.images[0].set_data(self._get_masked_column(column)[frame])
             ax.set_title(f"Frame {frame}")
             return ax.images
 
@@ -1279,7 +1869,7 @@ class TargetPixelFile(object):
         """Writes the TPF to a FITS file on disk."""
         if output_fn is None:
             output_fn = "{}-targ.fits".format(self.targetid)
-        self.hdu.writeto(output_fn, overwrite=overwrite, checksum=True)
+        self._hdu.writeto(output_fn, overwrite=overwrite, checksum=True)
 
     def interact(
         self,
@@ -1471,7 +2061,7 @@ class TargetPixelFile(object):
             New and smaller Target Pixel File object containing only the data
             cut out.
         """
-        imshape = self.flux.shape[1:]
+        imshape = self.shape[1:]
 
         # Parse the user input (``center``) into an (x, y) coordinate
         if center is None:
@@ -1498,10 +2088,10 @@ class TargetPixelFile(object):
         )
 
         # Make a copy of the data extension
-        hdu = self.hdu[0].copy()
+        hdu = self._hdu[0].copy()
 
         # Find the new object coordinates
-        r, d = self.get_coordinates(cadence=len(self.flux) // 2)
+        r, d = self.get_coordinates(cadence=self.shape[0] // 2)
         hdu.header["RA_OBJ"] = np.nanmean(
             r[row_edges[0] : row_edges[1], col_edges[0] : col_edges[1]]
         )
@@ -1532,29 +2122,33 @@ class TargetPixelFile(object):
         hdus = [hdu]
 
         # Copy the header
-        hdr = deepcopy(self.hdu[1].header)
+        hdr = deepcopy(self._hdu[1].header)
 
-        # Trim any columns that have the shape of the image, to be the new shape
+        # Trim any columns that have the shape of the image, to be the new shape.
+        # Only the pixels of the cutout are read, so that the full data cube
+        # of a lazily-opened file is not loaded in memory.
         data_columns = []
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            for idx, datacol in enumerate(self.hdu[1].columns):
+            for idx, datacol in enumerate(self._hdu[1].columns):
                 # We exclude Kepler's obscure "RB_LEVEL" column from cutouts
                 # for now because it has an awkward shape
                 if datacol.name == "RB_LEVEL":
                     continue
                 # If the column is 3D
-                if len(self.hdu[1].data[datacol.name].shape) == 3:
-                    # Make a copy, trim it and change the format
-                    datacol = deepcopy(datacol)
-                    datacol.array = datacol.array[
+                column = self._hdu[1].data[datacol.name]
+                if len(column.shape) == 3:
+                    # Make a copy which does not copy the data, trim it and
+                    # change the format
+                    datacol = datacol.copy()
+                    datacol.array = column[
                         :, row_edges[0] : row_edges[1], col_edges[0] : col_edges[1]
                     ]
                     datacol._dim = "{}".format(datacol.array.shape[1:]).replace(" ", "")
                     datacol._dims = datacol.array.shape[1:]
                     datacol._format = fits.column._ColumnFormat(
                         "{}{}".format(
-                            np.product(datacol.array.shape[1:]), datacol._format[-1]
+                            np.prod(datacol.array.shape[1:]), datacol._format[-1]
                         )
                     )
                     data_columns.append(datacol)
@@ -1583,7 +2177,7 @@ class TargetPixelFile(object):
         hdus.append(btbl)
 
         # Correct the aperture mask
-        hdu = self.hdu[2].copy()
+        hdu = self._hdu[2].copy()
         ar = hdu.data
         ar = ar[row_edges[0] : row_edges[1], col_edges[0] : col_edges[1]]
         hdu.header["NAXIS1"] = ar.shape[0]
@@ -2085,6 +2679,14 @@ class KeplerTargetPixelFile(TargetPixelFile):
         have the effect of removing cadences where
         ``(tpf.hdu[1].data['QUALITY'] & quality_bitmask) > 0``.
         See the :class:`KeplerQualityFlags` class for details on the bitmasks.
+    lazy : bool
+        If `True`, the file is memory-mapped and methods such as
+        `estimate_background()` read the pixel data from disk in blocks of
+        `lazy_block_size` cadences, rather than loading the full data cube
+        into memory.  Slicing the object (e.g. ``tpf[1000:2000]``) only reads
+        the selected cadences, and `cutout()` only reads the selected pixels.
+        Properties such as `flux` read all good-quality cadences in blocks
+        every time they are accessed, and the data cube is not kept in memory.
     **kwargs : dict
         Optional keyword arguments passed on to `astropy.io.fits.open`.
 
@@ -2100,11 +2702,11 @@ class KeplerTargetPixelFile(TargetPixelFile):
         )
         try:
             self.quality_mask = KeplerQualityFlags.create_quality_mask(
-                quality_array=self.hdu[1].data["QUALITY"], bitmask=quality_bitmask
+                quality_array=self._hdu[1].data["QUALITY"], bitmask=quality_bitmask
             )
 
             # check to make sure the correct filetype has been provided
-            filetype = detect_filetype(self.hdu)
+            filetype = detect_filetype(self._hdu)
             if filetype == "TessTargetPixelFile":
                 warnings.warn(
                     "A TESS data product is being opened using the "
@@ -2123,7 +2725,7 @@ class KeplerTargetPixelFile(TargetPixelFile):
                 self.targetid = self.get_header().get("KEPLERID")
         except Exception as e:
             # Cannot instantiate TargetPixelFile, close the HDU to release the file handle
-            self.hdu.close()
+            self._hdu.close()
             raise e
 
     def __repr__(self):
@@ -2216,6 +2818,14 @@ class KeplerTargetPixelFile(TargetPixelFile):
             flux_method=flux_method,
             centroid_method=centroid_method,
         )
+        return self._make_aperture_lightcurve(
+            flux, flux_err, centroid_col, centroid_row, aperture_mask
+        )
+
+    def _make_aperture_lightcurve(
+        self, flux, flux_err, centroid_col, centroid_row, aperture_mask
+    ):
+        """Returns a `KeplerLightCurve` holding aperture photometry results."""
         keys = {
             "centroid_col": centroid_col,
             "centroid_row": centroid_row,
@@ -2237,11 +2847,15 @@ class KeplerTargetPixelFile(TargetPixelFile):
 
     def get_bkg_lightcurve(self, aperture_mask=None):
         aperture_mask = self._parse_aperture_mask(aperture_mask)
+        flux_bkg = self._get_masked_quantity("FLUX_BKG", unit="electron/s", copy=False)
+        flux_bkg_err = self._get_masked_quantity(
+            "FLUX_BKG_ERR", unit="electron/s", copy=False
+        )
         # Ignore warnings related to zero or negative errors
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", RuntimeWarning)
             flux_bkg_err = (
-                np.nansum(self.flux_bkg_err[:, aperture_mask] ** 2, axis=1) ** 0.5
+                np.nansum(flux_bkg_err[:, aperture_mask] ** 2, axis=1) ** 0.5
             )
         keys = {
             "quality": self.quality,
@@ -2257,7 +2871,7 @@ class KeplerTargetPixelFile(TargetPixelFile):
         }
         return KeplerLightCurve(
             time=self.time,
-            flux=np.nansum(self.flux_bkg[:, aperture_mask], axis=1),
+            flux=np.nansum(flux_bkg[:, aperture_mask], axis=1),
             flux_err=flux_bkg_err,
             **keys,
         )
@@ -2765,6 +3379,14 @@ class TessTargetPixelFile(TargetPixelFile):
         have the effect of removing cadences where
         ``(tpf.hdu[1].data['QUALITY'] & quality_bitmask) > 0``.
         See the :class:`KeplerQualityFlags` class for details on the bitmasks.
+    lazy : bool
+        If `True`, the file is memory-mapped and methods such as
+        `estimate_background()` read the pixel data from disk in blocks of
+        `lazy_block_size` cadences, rather than loading the full data cube
+        into memory.  Slicing the object (e.g. ``tpf[1000:2000]``) only reads
+        the selected cadences, and `cutout()` only reads the selected pixels.
+        Properties such as `flux` read all good-quality cadences in blocks
+        every time they are accessed, and the data cube is not kept in memory.
     kwargs : dict
         Keyword arguments passed to `astropy.io.fits.open()`.
     """
@@ -2775,16 +3397,16 @@ class TessTargetPixelFile(TargetPixelFile):
         )
         try:
             self.quality_mask = TessQualityFlags.create_quality_mask(
-                quality_array=self.hdu[1].data["QUALITY"], bitmask=quality_bitmask
+                quality_array=self._hdu[1].data["QUALITY"], bitmask=quality_bitmask
             )
             # Early TESS releases had cadences with time=NaN (i.e. missing data)
             # which were not flagged by a QUALITY flag yet; the line below prevents
             # these cadences from being used. They would break most methods!
             if (quality_bitmask != 0) and (quality_bitmask != "none"):
-                self.quality_mask &= np.isfinite(self.hdu[1].data["TIME"])
+                self.quality_mask &= np.isfinite(self._hdu[1].data["TIME"])
 
             # check to make sure the correct filetype has been provided
-            filetype = detect_filetype(self.hdu)
+            filetype = detect_filetype(self._hdu)
             if filetype == "KeplerTargetPixelFile":
                 warnings.warn(
                     "A Kepler data product is being opened using the "
@@ -2803,7 +3425,7 @@ class TessTargetPixelFile(TargetPixelFile):
                 self.targetid = self.get_header().get("TICID")
         except Exception as e:
             # Cannot instantiate TargetPixelFile, close the HDU to release the file handle
-            self.hdu.close()
+            self._hdu.close()
             raise e
 
     def __repr__(self):
@@ -2816,11 +3438,11 @@ class TessTargetPixelFile(TargetPixelFile):
         # bit number 4, cf. Section 6 of the TESS Data Products documentation
         # (EXP-TESS-ARC-ICD-TM-0014.pdf).
         try:
-            return self.hdu[2].data & 4 > 0
+            return self._hdu[2].data & 4 > 0
         except (IndexError, TypeError):
             # `IndexError` may be raised if the aperture extension (#2) is missing
             # `TypeError` may be raised because early versions of TESScut returned floats in HDU 2
-            return np.zeros(self.hdu[1].data["FLUX"][0].shape, dtype=bool)
+            return np.zeros(self._hdu[1].data["FLUX"][0].shape, dtype=bool)
 
     @property
     def sector(self):
@@ -2879,6 +3501,14 @@ class TessTargetPixelFile(TargetPixelFile):
             flux_method=flux_method,
             centroid_method=centroid_method,
         )
+        return self._make_aperture_lightcurve(
+            flux, flux_err, centroid_col, centroid_row, aperture_mask
+        )
+
+    def _make_aperture_lightcurve(
+        self, flux, flux_err, centroid_col, centroid_row, aperture_mask
+    ):
+        """Returns a `TessLightCurve` holding aperture photometry results."""
         keys = {
             "centroid_col": centroid_col,
             "centroid_row": centroid_row,
@@ -2900,11 +3530,15 @@ class TessTargetPixelFile(TargetPixelFile):
 
     def get_bkg_lightcurve(self, aperture_mask=None):
         aperture_mask = self._parse_aperture_mask(aperture_mask)
+        flux_bkg = self._get_masked_quantity("FLUX_BKG", unit="electron/s", copy=False)
+        flux_bkg_err = self._get_masked_quantity(
+            "FLUX_BKG_ERR", unit="electron/s", copy=False
+        )
         # Ignore warnings related to zero or negative errors
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", RuntimeWarning)
             flux_bkg_err = (
-                np.nansum(self.flux_bkg_err[:, aperture_mask] ** 2, axis=1) ** 0.5
+                np.nansum(flux_bkg_err[:, aperture_mask] ** 2, axis=1) ** 0.5
             )
         keys = {
             "quality": self.quality,
@@ -2919,7 +3553,7 @@ class TessTargetPixelFile(TargetPixelFile):
         }
         return TessLightCurve(
             time=self.time,
-            flux=np.nansum(self.flux_bkg[:, aperture_mask], axis=1),
+            flux=np.nansum(flux_bkg[:, aperture_mask], axis=1),
             flux_err=flux_bkg_err,
             **keys,
         )
@@ -1,4 +1,5 @@
 """This module provides various helper functions."""
+import heapq
 import logging
 import sys
 import os
@@ -384,6 +385,178 @@ def running_mean(data, window_size):
     return (cumsum[window_size:] - cumsum[:-window_size]) / float(window_size)
 
 
+def _window_bounds(x, half_width):
+    """Returns the index range of the points within ``half_width`` of each
+    point of the sorted array ``x``."""
+    start = np.searchsorted(x, x - half_width, side="left")
+    stop = np.searchsorted(x, x + half_width, side="right")
+    return start, stop
+
+
+def _running_median(x, y, half_width):
+    """Returns the median of ``y`` in a window of ``x +/- half_width``
+    centered on each point.
+
+    ``x`` must be sorted. The window is split into two heaps, a max-heap of
+    its lower half and a min-heap of its upper half, which are updated as it
+    slides, so that each point is inserted and removed in O(log w) time.
+    Points leaving the window are only discarded once they reach the top of
+    their heap.
+    """
+    start, stop = _window_bounds(x, half_width)
+    values = y.tolist()
+    result = np.empty(len(values))
+    # Heap entries are (value, index) tuples, with negated values in `lower`
+    lower, upper = [], []
+    in_lower = [False] * len(values)
+    # Number of points of the window in each heap
+    n_lower = n_upper = 0
+    low = high = 0
+
+    def prune(heap):
+        while heap and heap[0][1] < low:
+            heapq.heappop(heap)
+
+    for idx in range(len(values)):
+        while high < stop[idx]:
+            prune(lower)
+            if lower and values[high] <= -lower[0][0]:
+                heapq.heappush(lower, (-values[high], high))
+                in_lower[high] = True
+                n_lower += 1
+            else:
+                heapq.heappush(upper, (values[high], high))
+                n_upper += 1
+            high += 1
+        while low < start[idx]:
+            if in_lower[low]:
+                n_lower -= 1
+            else:
+                n_upper -= 1
+            low += 1
+        # Keep the lower half as large as, or one larger than, the upper half
+        prune(lower)
+        prune(upper)
+        while n_lower > n_upper + 1:
+            value, index = heapq.heappop(lower)
+            heapq.heappush(upper, (-value, index))
+            in_lower[index] = False
+            n_lower -= 1
+            n_upper += 1
+            prune(lower)
+        while n_lower < n_upper:
+            value, index = heapq.heappop(upper)
+            heapq.heappush(lower, (-value, index))
+            in_lower[index] = True
+            n_lower += 1
+            n_upper -= 1
+            prune(upper)
+        if n_lower > n_upper:
+            result[idx] = -lower[0][0]
+        else:
+            result[idx] = 0.5 * (upper[0][0] - lower[0][0])
+    return result
+
+
+def _padded_median(window, counts):
+    """Returns the median of each row of a NaN-padded array, given the number
+    of values in each row."""
+    window = np.sort(window, axis=1)  # NaNs are sorted last
+    rows = np.arange(len(window))
+    low = window[rows, np.maximum(counts - 1, 0) // 2]
+    high = window[rows, counts // 2]
+    return 0.5 * (low + high)
+
+
+def _running_biweight(
+    x, y, half_width, c=5.0, niters=5, chunk_size=2 ** 20, points_per_window=32
+):
+    """Returns the Tukey biweight location of ``y`` in a window of
+    ``x +/- half_width`` centered on each point.
+
+    ``x`` must be sorted. The location is iterated starting from the median,
+    with the scale fixed by the median absolute deviation. The windows are
+    gathered into NaN-padded arrays of at most ``chunk_size`` elements and
+    processed together.
+
+    The location varies little between neighboring points of a long window,
+    so it is only evaluated at about ``points_per_window`` points per window
+    (of the median number of points), and linearly interpolated in ``x``
+    in between.  The run time is thereby linear in the number of points,
+    rather than proportional to the number of points times the window length.
+    """
+    start, stop = _window_bounds(x, half_width)
+    result = np.empty(len(y))
+    if len(y) == 0:
+        return result
+    step = max(1, int(np.median(stop - start)) // points_per_window)
+    centers = np.arange(0, len(y), step)
+    if centers[-1] != len(y) - 1:
+        centers = np.append(centers, len(y) - 1)
+    start, stop = start[centers], stop[centers]
+    location = np.empty(len(centers))
+    offsets = np.arange(np.max(stop - start))
+    rows = max(1, chunk_size // len(offsets))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for first in range(0, len(centers), rows):
+            counts = stop[first : first + rows] - start[first : first + rows]
+            window_idx = start[first : first + rows, None] + offsets
+            window = np.where(
+                offsets < counts[:, None],
+                y[np.minimum(window_idx, len(y) - 1)],
+                np.nan,
+            )
+            loc = _padded_median(window, counts)
+            scale = c * _padded_median(np.abs(window - loc[:, None]), counts)
+            valid = offsets < counts[:, None]
+            window[~valid] = 0.0
+            for _ in range(niters):
+                deviation = window - loc[:, None]
+                u2 = (deviation / scale[:, None]) ** 2
+                # Padding and zero scales yield zero weights
+                weights = np.where(valid & (u2 < 1), (1 - u2) ** 2, 0.0)
+                total_weight = weights.sum(axis=1)
+                shift = (weights * deviation).sum(axis=1) / total_weight
+                loc = np.where(total_weight > 0, loc + shift, loc)
+            location[first : first + rows] = loc
+    if step == 1:
+        return location
+    return np.interp(x, x[centers], location)
+
+
+def _robust_spline(x, y, knot_spacing, sigma=3, niters=5):
+    """Returns a cubic spline fitted to ``y``, with knots spaced by
+    ``knot_spacing`` in ``x``, and iteratively refitted without the points
+    deviating by more than ``sigma`` times the robust standard deviation.
+
+    ``x`` must be sorted. Knots are dropped where there are too few points
+    between them, so that the spline stays well-defined across gaps.
+    """
+    from scipy.interpolate import LSQUnivariateSpline
+
+    if len(y) < 4:
+        return np.full(len(y), np.median(y))
+    use = np.ones(len(y), dtype=bool)
+    for _ in range(niters):
+        xu, yu = x[use], y[use]
+        knots = np.arange(xu[0] + knot_spacing, xu[-1], knot_spacing)
+        # Require a few points between each pair of knots
+        counts = np.searchsorted(xu, knots)
+        valid_knots, last_count = [], 0
+        for knot, count in zip(knots, counts):
+            if count - last_count >= 4 and len(xu) - count >= 4:
+                valid_knots.append(knot)
+                last_count = count
+        model = LSQUnivariateSpline(xu, yu, valid_knots, k=3)(x)
+        residual = y - model
+        std = 1.4826 * np.median(np.abs(residual - np.median(residual)))
+        new_use = np.abs(residual) <= sigma * std
+        if np.array_equal(new_use, use) or new_use.sum() < 4:
+            break
+        use = new_use
+    return model
+
+
 def bkjd_to_astropy_time(bkjd) -> Time:
     """Converts Kepler Barycentric Julian Day (BKJD) time values to an
     `astropy.time.Time` object.
@@ -595,6 +768,29 @@ def validate_method(method, supported_methods):
     )
 
 
+# Design matrix (A) used by `centroid_quadratic` to fit the coefficients of a
+# bivariate quadratic to a 3x3 patch of pixels, as defined by Eqn 20 in Vakili &
+# Hogg (arxiv:1610.05873). The design matrix contains a column of ones followed
+# by pixel coordinates: x, y, x**2, xy, y**2.
+_QUADRATIC_A = np.array(
+    [
+        [1, -1, -1, 1, 1, 1],
+        [1, 0, -1, 0, 0, 1],
+        [1, 1, -1, 1, -1, 1],
+        [1, -1, 0, 1, 0, 0],
+        [1, 0, 0, 0, 0, 0],
+        [1, 1, 0, 1, 0, 0],
+        [1, -1, 1, 1, -1, 1],
+        [1, 0, 1, 0, 0, 1],
+        [1, 1, 1, 1, 1, 1],
+    ]
+)
+# We also pre-compute $(A^t A)^-1 A^t$, cf. Eqn 21 in Vakili & Hogg.
+_QUADRATIC_APRIME = (
+    np.linalg.inv(_QUADRATIC_A.T @ _QUADRATIC_A) @ _QUADRATIC_A.T
+)
+
+
 def centroid_quadratic(data, mask=None):
     """Computes the quadratic estimate of the centroid in a 2d-array.
 
@@ -608,16 +804,21 @@ def centroid_quadratic(data, mask=None):
     For the motivation and the details around this technique, please refer
     to Vakili, M., & Hogg, D. W. 2016, ArXiv, 1610.05873.
 
+    A 3D array of shape (n_cadences, n_rows, n_cols) can be passed to
+    compute the centroids of all images at once, in which case arrays of
+    columns and rows are returned.
+
     Caveat: if the brightest pixel falls on the edge of the data array, the fit
     will tend to fail or be inaccurate.
 
     Parameters
     ----------
-    data : 2D array
-        The 2D input array representing the pixel values of the image.
+    data : 2D or 3D array
+        The 2D input array representing the pixel values of the image,
+        or a 3D array representing a stack of such images.
     mask : array_like (bool), optional
-        A boolean mask, with the same shape as `data`, where a **True** value
-        indicates the corresponding element of data is masked.
+        A boolean mask, with the same shape as the image(s) in `data`, where a
+        **True** value indicates the corresponding element of data is masked.
 
     Returns
     -------
@@ -627,76 +828,76 @@ def centroid_quadratic(data, mask=None):
     """
     if isinstance(data, u.Quantity):
         data = data.value
+    data = np.asarray(data)
 
     if np.issubdtype(data.dtype, int):
         # multiple code paths below require data be of float type
         # proactively convert int to float once and for all.
         data = data.astype(float)
 
+    single_image = data.ndim == 2
+    if single_image:
+        data = data[np.newaxis]
+    n_images, n_rows, n_cols = data.shape
+    if n_rows < 3 or n_cols < 3:
+        raise ValueError(
+            "Quadratic centroids require images of at least 3x3 pixels, "
+            "got {}x{}.".format(n_rows, n_cols)
+        )
+
     # Step 1: identify the patch of 3x3 pixels (z_)
     # that is centered on the brightest pixel (xx, yy)
     if mask is not None:
         # mask handling.
         # Issue 1401 demonstrates that using 'data' to find the max will break when all flux is negative
         # set masked pixels NaN (instead of 0) to resolve it.
-        data = data.copy()
-        data[~mask] = np.nan
-    arg_data_max = np.nanargmax(data)
-    yy, xx = np.unravel_index(arg_data_max, data.shape)
+        data = np.where(mask, data, np.nan)
+    flat_data = data.reshape(n_images, -1)
+    is_nan = np.isnan(flat_data)
+    all_nan = is_nan.all(axis=1)
+    # Equivalent to `np.nanargmax`, but does not raise for all-NaN images
+    arg_data_max = np.argmax(np.where(is_nan, -np.inf, flat_data), axis=1)
+    yy, xx = np.unravel_index(arg_data_max, (n_rows, n_cols))
     # Make sure the 3x3 patch does not leave the TPF bounds
-    if yy < 1:
-        yy = 1
-    if xx < 1:
-        xx = 1
-    if yy > (data.shape[0] - 2):
-        yy = data.shape[0] - 2
-    if xx > (data.shape[1] - 2):
-        xx = data.shape[1] - 2
-
-    z_ = data[yy - 1 : yy + 2, xx - 1 : xx + 2]
-    if np.any(np.isnan(z_)):
+    yy = np.clip(yy, 1, n_rows - 2)
+    xx = np.clip(xx, 1, n_cols - 2)
+
+    dy, dx = np.mgrid[-1:2, -1:2]
+    z_ = data[
+        np.arange(n_images)[:, np.newaxis],
+        yy[:, np.newaxis] + dy.ravel(),
+        xx[:, np.newaxis] + dx.ravel(),
+    ]
+    patch_nan = np.isnan(z_)
+    if patch_nan.any():
         # handle edge case the 3X3 patch has NaN
         # Need some finite value for NaN pixels for the
         # quadratic fit below: use the mean of the 3x3 patch
         # to reduce the skew
-        z_ = z_.copy()
-        z_[np.isnan(z_)] = np.nanmean(z_)
-
-    # Next, we will fit the coefficients of the bivariate quadratic with the
-    # help of a design matrix (A) as defined by Eqn 20 in Vakili & Hogg
-    # (arxiv:1610.05873). The design matrix contains a
-    # column of ones followed by pixel coordinates: x, y, x**2, xy, y**2.
-    A = np.array(
-        [
-            [1, -1, -1, 1, 1, 1],
-            [1, 0, -1, 0, 0, 1],
-            [1, 1, -1, 1, -1, 1],
-            [1, -1, 0, 1, 0, 0],
-            [1, 0, 0, 0, 0, 0],
-            [1, 1, 0, 1, 0, 0],
-            [1, -1, 1, 1, -1, 1],
-            [1, 0, 1, 0, 0, 1],
-            [1, 1, 1, 1, 1, 1],
-        ]
-    )
-    # We also pre-compute $(A^t A)^-1 A^t$, cf. Eqn 21 in Vakili & Hogg.
-    At = A.transpose()
-    # In Python 3 this can become `Aprime = np.linalg.inv(At @ A) @ At`
-    Aprime = np.matmul(np.linalg.inv(np.matmul(At, A)), At)
+        with warnings.catch_warnings():
+            # All-NaN patches yield a NaN centroid below
+            warnings.simplefilter("ignore", RuntimeWarning)
+            patch_mean = np.nanmean(z_, axis=1)
+        z_ = np.where(patch_nan, patch_mean[:, np.newaxis], z_)
 
     # Step 2: fit the polynomial $P = a + bx + cy + dx^2 + exy + fy^2$
     # following Equation 21 in Vakili & Hogg.
-    # In Python 3 this can become `Aprime @ z_.flatten()`
-    a, b, c, d, e, f = np.matmul(Aprime, z_.flatten())
+    a, b, c, d, e, f = (z_ @ _QUADRATIC_APRIME.T).T
 
     # Step 3: analytically find the function maximum,
     # following https://en.wikipedia.org/wiki/Quadratic_function
     det = 4 * d * f - e ** 2
-    if abs(det) < 1e-6:
-        return np.nan, np.nan  # No solution
-    xm = -(2 * f * b - c * e) / det
-    ym = -(2 * d * c - b * e) / det
-    return xx + xm, yy + ym
+    no_solution = (np.abs(det) < 1e-6) | all_nan
+    with warnings.catch_warnings():
+        # Cadences without a solution are set to NaN below
+        warnings.simplefilter("ignore", RuntimeWarning)
+        xm = -(2 * f * b - c * e) / det
+        ym = -(2 * d * c - b * e) / det
+    col = np.where(no_solution, np.nan, xx + xm)
+    row = np.where(no_solution, np.nan, yy + ym)
+    if single_image:
+        return col[0], row[0]
+    return col, row
 
 
 def _query_solar_system_objects(
@@ -5,6 +5,7 @@ import tempfile
 import tracemalloc
 
 import pytest
+from numpy.testing import assert_array_equal
 
 from astropy.io import fits
 
@@ -50,6 +51,23 @@ def test_read_lc_in_hdu():
     assert len(lc.flux) > 0, "LC should be functional even the hdul is closed."
 
 
+def test_read_lc_columns():
+    """Can we restrict the columns which are read from a light curve file?"""
+    filename_lc = os.path.join(TESTDATA, "test-lc-tess-pimen-100-cadences.fits")
+    lc = read(filename_lc)
+    lc_minimal = read(filename_lc, columns=[])
+    assert "pos_corr1" in lc.colnames
+    assert "pos_corr1" not in lc_minimal.colnames
+    for colname in ["flux", "flux_err", "quality", "cadenceno", "centroid_col"]:
+        assert colname in lc_minimal.colnames
+        assert (lc_minimal[colname] == lc[colname]).all()
+    assert lc_minimal.meta["TICID"] == lc.meta["TICID"]
+    # Column names are case-insensitive
+    lc_sap = read(filename_lc, columns=["SAP_FLUX"], flux_column="sap_bkg")
+    assert "sap_flux" in lc_sap.colnames
+    assert (lc_sap.flux == lc.sap_bkg).all()
+
+
 def test_read_lc_cloud():
     """Read a lightcurve file from AWS S3 cloud"""
     cloud_uri = 's3://stpubdata/tess/public/tid/s0015/0000/0003/7542/2201/tess2019226182529-s0015-0000000375422201-0151-s_lc.fits'
@@ -117,6 +135,27 @@ def test_read_tpf_collection():
     assert isinstance(collection, TargetPixelFileCollection)
 
 
+def test_read_collection_workers(caplog):
+    """Does reading a collection with a pool of processes give the same result?"""
+    lc_path = os.path.join(TESTDATA, "test-lc-tess-pimen-100-cadences.fits")
+    tpf_path = os.path.join(TESTDATA, "tess25155310-s01-first-cadences.fits.gz")
+    path_list = [lc_path, tpf_path, "invalid.fits", lc_path]
+
+    serial = read_lc_collection(path_list)
+    caplog.clear()
+    parallel = read_lc_collection(path_list, workers=2, flux_column="sap_flux")
+    assert isinstance(parallel, LightCurveCollection)
+    assert len(parallel) == len(serial) == 2
+    assert_array_equal(parallel[0].flux, read(lc_path, flux_column="sap_flux").flux)
+    # Files which could not be read are still reported
+    assert "Unable to read invalid.fits" in caplog.text
+
+    tpfs = read_tpf_collection([tpf_path, lc_path, tpf_path], workers=2)
+    assert isinstance(tpfs, TargetPixelFileCollection)
+    assert len(tpfs) == 2
+    assert_array_equal(tpfs[1].flux, read(tpf_path).flux)
+
+
 def test_open():
     """Does the deprecated `open` function still work?"""
     from lightkurve.io import open
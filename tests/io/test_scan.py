@@ -0,0 +1,41 @@
+import os
+
+import numpy as np
+from astropy.io import fits
+
+from lightkurve import PACKAGEDIR
+from lightkurve.io import detect_filetype, scan_products
+
+from .. import TESTDATA
+
+
+def test_scan_products():
+    """Does scanning the headers give the same file types as `detect_filetype`?"""
+    paths = [
+        os.path.join(TESTDATA, "test-tpf-star.fits"),
+        os.path.join(TESTDATA, "tess25155310-s01-first-cadences.fits.gz"),
+        os.path.join(TESTDATA, "test-lc-tess-pimen-100-cadences.fits"),
+        os.path.join(TESTDATA, "test-tpf-kplr-tabby-100-cadences.fits"),
+        os.path.join(TESTDATA, "test-lc-tess-pimen_s1_eleanor_lite-100-cadences.fits"),
+        os.path.join(PACKAGEDIR, "data", "lightkurve.mplstyle"),
+        "does-not-exist.fits",
+    ]
+    table = scan_products(paths)
+    assert list(table["path"]) == paths
+    for row, path in zip(table[:5], paths):
+        with fits.open(path) as hdulist:
+            assert row["filetype"] == detect_filetype(hdulist)
+    assert list(table["author"][:5]) == ["K2", "SPOC", "SPOC", "Kepler", "ELEANOR"]
+    assert list(table["targetid"][:4]) == [200071160, 25155310, 261136679, 8462852]
+    assert table["campaign"][0] == 91
+    assert table["sector"][1] == 1
+    assert table["quarter"][3] == 8
+    assert np.isclose(table["exptime"][2], 120)
+    assert table["ncadences"][2] == 100
+    # Files which are not data products or cannot be read are masked
+    assert table["filetype"].mask[-2:].all()
+
+    # Scanning in parallel gives the same result
+    parallel = scan_products(paths, workers=2)
+    for name in table.colnames:
+        assert np.all(parallel[name] == table[name])
@@ -60,3 +60,68 @@ def test_get_cache_dir():
             assert expected_dir == actual_dir
         finally:
             lk.conf.cache_dir = None
+
+
+def test_cache_index():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        index = lk.config.CacheIndex(cache_dir)
+        assert len(index) == 0
+        assert index.get("mast:TESS/product/a.fits") is None
+
+        path = os.path.join(cache_dir, "a.fits")
+        with open(path, "wb") as fh:
+            fh.write(b"some data")
+        index.add("mast:TESS/product/a.fits", path)
+        assert "mast:TESS/product/a.fits" in index
+        assert index.get("mast:TESS/product/a.fits") == path
+        # The index persists across instances
+        assert lk.config.CacheIndex(cache_dir).get("mast:TESS/product/a.fits") == path
+        key, _, size, checksum, _ = index.entries()[0]
+        assert key == "mast:TESS/product/a.fits"
+        assert size == 9
+        assert checksum == lk.config.cache.file_checksum(path)
+
+        # Entries of files which were modified or removed are discarded
+        with open(path, "ab") as fh:
+            fh.write(b"more data")
+        assert index.get("mast:TESS/product/a.fits") is None
+        assert len(index) == 0
+
+
+def test_cache_index_eviction_and_verification():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        index = lk.config.CacheIndex(cache_dir)
+        paths = {}
+        for name in ["a", "b", "c"]:
+            paths[name] = os.path.join(cache_dir, name + ".fits")
+            with open(paths[name], "wb") as fh:
+                fh.write(b"0123456789")
+            index.add(name, paths[name])
+        # Accessing "a" makes "b" the least recently used file
+        index.get("a")
+        assert index.total_size() == 30
+        assert index.evict(25) == ["b"]
+        assert not os.path.exists(paths["b"])
+        assert index.evict(5, keep={"a"}) == ["c"]
+        assert index.total_size() == 10
+
+        # Corrupted files are deleted by the verification pass
+        with open(paths["a"], "r+b") as fh:
+            fh.write(b"X")
+        assert index.get("a") == paths["a"]
+        assert index.verify() == ["a"]
+        assert not os.path.exists(paths["a"])
+        assert len(index) == 0
+
+
+def test_download_staging_dir():
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with lk.config.cache.download_staging_dir(cache_dir) as staging_dir:
+            path = os.path.join(staging_dir, "mastDownload", "a.fits")
+            os.makedirs(os.path.dirname(path))
+            with open(path, "wb") as fh:
+                fh.write(b"some data")
+            path = lk.config.cache.move_into_cache(path, staging_dir, cache_dir)
+        assert path == os.path.join(cache_dir, "mastDownload", "a.fits")
+        assert os.path.exists(path)
+        assert not os.path.exists(staging_dir)
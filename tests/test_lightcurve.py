@@ -715,6 +715,49 @@ def test_bin_quality():
         assert_allclose(binned_lc.centroid_row, [2./3, 2])   # Expect mean
 
 
+@pytest.mark.parametrize(
+    "bin_kwargs",
+    [dict(time_bin_size=0.7 * u.day), dict(binsize=7), dict(time_bin_size=2 * u.day, n_bins=8),
+     dict(time_bin_start=Time(2459003.2, format="jd"), time_bin_size=[1.5, 2, 0.5] * u.day)],
+)
+def test_bin_matches_aggregate_downsample(bin_kwargs):
+    """The binned columns and uncertainties must agree with AstroPy's aggregate_downsample."""
+    np.random.seed(42)
+    time = 2459000 + np.sort(np.random.uniform(0, 20, 200))
+    time[time > 2459008] += 3  # introduce a gap
+    flux = np.random.normal(1, 0.1, 200)
+    flux[[3, 4, 100]] = np.nan
+    flux_err = np.random.uniform(0.01, 0.02, 200)
+    flux_err[[5, 101]] = np.nan
+    lc = LightCurve(time=Time(time, format="jd"), flux=flux, flux_err=flux_err,
+                    cadenceno=np.arange(200), centroid_col=np.random.normal(size=200) * u.pix)
+    binned = lc.bin(**bin_kwargs)
+
+    downsample_kwargs = bin_kwargs
+    if "binsize" in bin_kwargs:
+        downsample_kwargs = dict(time_bin_start=lc.time[::bin_kwargs["binsize"]])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        expected = aggregate_downsample(lc, aggregate_func=np.nanmean, **downsample_kwargs)
+        rmse = aggregate_downsample(
+            lc, aggregate_func=lambda x: np.sqrt(np.nansum(x ** 2)) / len(np.atleast_1d(x))
+            if np.any(np.isfinite(x)) else np.nan, **downsample_kwargs)
+        std = aggregate_downsample(lc, aggregate_func=np.nanstd, **downsample_kwargs)
+
+    assert len(binned) == len(expected)
+    assert_allclose(binned.time.jd, (expected.time_bin_start + expected.time_bin_size / 2).jd)
+    assert_allclose(binned.flux, expected["flux"])
+    assert_allclose(binned.centroid_col, expected["centroid_col"])
+    assert binned.centroid_col.unit == u.pix
+    assert_array_equal(binned.cadenceno.mask, expected["cadenceno"].mask)
+    assert_array_equal(binned.cadenceno, expected["cadenceno"])
+    assert_allclose(binned.flux_err, rmse["flux_err"])
+
+    # Without uncertainties, `flux_err` is the scatter of `flux`
+    lc.flux_err = np.full(len(lc), np.nan)
+    assert_allclose(lc.bin(**bin_kwargs).flux_err, std["flux"])
+
+
 # TEMPORARILY SKIPPED, cf. https://github.com/lightkurve/lightkurve/issues/663
 @pytest.mark.xfail  # pytest.xfail("aggregate_downsample does not handle bitwise binning correctly")
 def test_binned_quality():
@@ -1155,6 +1198,52 @@ def test_iterative_flatten():
     assert np.isclose(c.flux, 1, rtol=0.00001).sum() == 1999
 
 
+def test_iterative_flatten_reuses_segments(monkeypatch):
+    """Segments without new outliers should not be filtered again."""
+    import lightkurve.lightcurve
+
+    calls = []
+
+    def counting_savgol_filter(x, **kwargs):
+        calls.append(len(x))
+        return savgol_filter(x, **kwargs)
+
+    from scipy.signal import savgol_filter
+    monkeypatch.setattr(lightkurve.lightcurve, "savgol_filter", counting_savgol_filter)
+
+    # Two segments separated by a gap, with an outlier in the first one only
+    np.random.seed(42)
+    x = np.append(np.arange(1000), np.arange(1100, 2100))
+    y = np.sin(x / 200) / 100 + 1 + np.random.normal(0, 1e-4, 2000)
+    y[250] -= 0.01
+    lc = LightCurve(time=x, flux=y)
+    flat_lc = lc.flatten(window_length=25, niters=3, sigma=5)
+    assert flat_lc.flux[250] < 0.995
+    # Both segments are filtered once, then only the segment which lost the outlier
+    assert calls == [1000, 1000, 999]
+
+
+@pytest.mark.parametrize("method", ["median", "biweight", "spline"])
+def test_flatten_robust_methods(method):
+    """Test the alternative detrending filters of flatten()."""
+    np.random.seed(42)
+    x = np.arange(1000) / 32
+    y = np.sin(x / 3) / 100 + 1 + np.random.normal(0, 1e-4, len(x))
+    y[300] += 0.05
+    lc = LightCurve(time=x, flux=y)
+    # The window can be given either in time or in cadences
+    for window_length in [25 / 32 * u.day, 25]:
+        flat_lc = lc.flatten(window_length=window_length, method=method)
+        # The outlier must be preserved while the trend is removed
+        assert flat_lc.flux[300] > 1.04
+        assert np.std(np.delete(flat_lc.flux.value, 300)) < 2e-4
+    # A window in time is not supported by the Savitzky-Golay filter
+    with pytest.raises(ValueError):
+        lc.flatten(window_length=0.5 * u.day)
+    with pytest.raises(ValueError):
+        lc.flatten(method="invalid")
+
+
 def test_fill_gaps():
     lc = LightCurve(time=[1, 2, 3, 4, 6, 7, 8], flux=[1, 1, 1, 1, 1, 1, 1])
     nlc = lc.fill_gaps()
@@ -3,15 +3,16 @@ import sys
 import pytest
 import numpy as np
 import matplotlib.pyplot as plt
-from numpy.testing import assert_almost_equal, assert_array_equal
+from numpy.testing import assert_allclose, assert_almost_equal, assert_array_equal
 
 from astropy import units as u
 from astropy.time import Time
 from astropy.timeseries import BoxLeastSquares
 from astropy.utils.masked import Masked
 
+from lightkurve.collections import LightCurveCollection
 from lightkurve.lightcurve import LightCurve
-from lightkurve.periodogram import Periodogram
+from lightkurve.periodogram import LombScarglePeriodogram, Periodogram
 from lightkurve.utils import LightkurveWarning
 
 
@@ -214,6 +215,41 @@ def test_smooth():
         p.smooth(method="logmedian", filter_width=5.0 * u.day)
 
 
+def test_smooth_logmedian():
+    """The logmedian smoothing should average the medians of all the windows
+    containing each frequency, including with gaps of invalid power."""
+    np.random.seed(42)
+    frequency = np.sort(np.random.uniform(1, 300, 2000))
+    power = np.random.exponential(size=2000)
+    power[np.random.randint(0, 2000, 200)] = np.nan
+    power[(frequency > 2) & (frequency < 10)] = np.nan
+    p = Periodogram(frequency * u.microhertz, power * u.dimensionless_unscaled)
+
+    # Reference implementation computing a mask for each window
+    filter_width = 0.05
+    logf = np.log10(frequency)
+    bkg = np.zeros_like(power)
+    count = np.zeros(len(power), dtype=int)
+    x0 = logf[0]
+    while x0 < logf[-1]:
+        m = np.abs(logf - x0) < filter_width
+        if m.any():
+            with np.testing.suppress_warnings() as sup:
+                sup.filter(RuntimeWarning)
+                bkg[m] += np.nanmedian(power[m]) / (8.0 / 9.0) ** 3
+            count[m] += 1
+        x0 += 0.5 * filter_width
+    expected = bkg / count
+
+    with np.testing.suppress_warnings() as sup:
+        sup.filter(RuntimeWarning)
+        smooth_pg = p.smooth(method="logmedian", filter_width=filter_width)
+    assert_allclose(smooth_pg.power.value, expected, rtol=1e-10)
+    gap = (frequency > 4) & (frequency < 5)
+    assert np.isnan(smooth_pg.power.value[gap]).all()
+    assert np.isfinite(smooth_pg.power.value[frequency > 20]).all()
+
+
 def test_flatten():
     npts = 10000
     np.random.seed(12069424)
@@ -243,6 +279,144 @@ def test_flatten():
     plt.close()
 
 
+def test_from_lightcurves():
+    """Periodograms computed together should match those computed one by one
+    on the same frequency grid."""
+    np.random.seed(42)
+    time = np.arange(0, 27, 2.0 / 60 / 24)[:5000] + 1500
+    lcs = []
+    for idx in range(4):
+        flux = 1 + 0.01 * np.sin(2 * np.pi * (idx + 1) * time)
+        flux += np.random.normal(0, 0.01, len(time))
+        flux[np.random.randint(0, len(time), 100)] = np.nan
+        lcs.append(LightCurve(time=time, flux=flux, flux_err=0.01 + 0 * flux))
+    # A light curve observed at other times
+    lcs.append(lcs[0][::2])
+    lcc = LightCurveCollection(lcs)
+
+    for normalization in ["amplitude", "psd"]:
+        pgs = lcc.to_periodogram(
+            normalization=normalization, maximum_frequency=20 / u.day
+        )
+        assert len(pgs) == len(lcs)
+        for lc, pg in zip(lcs, pgs):
+            assert isinstance(pg, LombScarglePeriodogram)
+            assert_array_equal(pg.frequency, pgs[0].frequency)
+            expected = LombScarglePeriodogram.from_lightcurve(
+                lc, frequency=pgs[0].frequency, normalization=normalization
+            )
+            assert pg.power.unit == expected.power.unit
+            assert_allclose(
+                pg.power.value,
+                expected.power.value,
+                rtol=1e-5,
+                atol=1e-7 * expected.power.value.max(),
+            )
+            # Both match the exact power
+            exact = LombScarglePeriodogram.from_lightcurve(
+                lc,
+                frequency=pgs[0].frequency,
+                normalization=normalization,
+                ls_method="slow",
+            )
+            assert_allclose(
+                pg.power.value, exact.power.value, atol=1e-6 * exact.power.value.max()
+            )
+            assert pg.frequency_at_max_power == expected.frequency_at_max_power
+            assert_allclose(
+                pg.nyquist, lc.to_periodogram(normalization=normalization).nyquist
+            )
+            assert pg._LS_object is not None
+        # The shared grid is the one of the longest light curve
+        expected = lcs[0].to_periodogram(
+            normalization=normalization, maximum_frequency=20 / u.day
+        )
+        assert_array_equal(pgs[0].frequency, expected.frequency)
+
+    # Other methods compute the periodograms one by one on the shared grid
+    pgs = lcc.to_periodogram(ls_method="slow", period=np.arange(1, 10) * u.day)
+    for lc, pg in zip(lcs, pgs):
+        expected = lc.to_periodogram(ls_method="slow", period=np.arange(1, 10) * u.day)
+        assert_array_equal(pg.power, expected.power)
+        assert pg.default_view == "period"
+    assert len(lcc.to_periodogram(method="bls", duration=0.1)) == len(lcs)
+    assert LombScarglePeriodogram.from_lightcurves([]) == []
+
+
+def test_lombscargle_nufft(monkeypatch):
+    """The 'nufft' method should match the exact power, including when the
+    frequency grid is split into many chunks."""
+    import lightkurve.periodogram
+
+    monkeypatch.setattr(lightkurve.periodogram, "NUFFT_CHUNK_SIZE", 200)
+    np.random.seed(42)
+    time = np.sort(np.random.uniform(0, 27, 3000)) + 1500
+    flux = 1 + 0.01 * np.sin(2 * np.pi * 3 * time) + np.random.normal(0, 0.01, 3000)
+    lc = LightCurve(time=time, flux=flux)
+
+    for normalization in ["amplitude", "psd"]:
+        pg = lc.to_periodogram(normalization=normalization, ls_method="nufft")
+        assert len(pg.frequency) > 400
+        assert pg.ls_method == "nufft"
+        expected = lc.to_periodogram(normalization=normalization, ls_method="slow")
+        assert_array_equal(pg.frequency, expected.frequency)
+        assert pg.power.unit == expected.power.unit
+        assert_allclose(
+            pg.power.value,
+            expected.power.value,
+            atol=1e-5 * expected.power.value.max(),
+        )
+        pgs = LombScarglePeriodogram.from_lightcurves(
+            [lc], normalization=normalization, ls_method="nufft"
+        )
+        assert_allclose(pgs[0].power, pg.power)
+
+    # Irregular frequency grids are not supported
+    pg = lc.to_periodogram(ls_method="nufft", period=np.arange(1, 10) * u.day)
+    assert pg.ls_method == "slow"
+    with pytest.raises(ValueError, match="fit_mean"):
+        lc.to_periodogram(ls_method="nufft", fit_mean=False)
+
+
+def test_compact(tmp_path):
+    """A compact periodogram should give the same results as the original,
+    without storing the frequency array."""
+    np.random.seed(42)
+    time = np.arange(0, 90, 1.0 / 48)
+    flux = 1 + 0.01 * np.sin(2 * np.pi * 3 * time) + np.random.normal(0, 0.01, len(time))
+    lc = LightCurve(time=time, flux=flux)
+    pg = lc.to_periodogram(normalization="psd")
+    compact = pg.copy().compact(dtype="float32", filename=tmp_path / "power.npy")
+
+    assert compact.power.dtype == np.float32
+    assert (tmp_path / "power.npy").exists()
+    assert_allclose(compact.frequency, pg.frequency, rtol=1e-12)
+    assert_allclose(compact.power, pg.power, rtol=1e-6)
+    assert_allclose(compact.frequency_at_max_power, pg.frequency_at_max_power)
+
+    # Slices share the stored power values
+    sliced = compact[100:2000:2]
+    assert np.shares_memory(sliced.power.value, compact.power.value)
+    assert_allclose(sliced.frequency, compact.frequency[100:2000:2], rtol=1e-12)
+    with pytest.raises(IndexError):
+        compact._frequency[len(pg.frequency)]
+
+    # The logmedian smoothing uses the grid instead of the frequency array
+    for p in [compact, sliced]:
+        expected = Periodogram(p.frequency, p.power).smooth(method="logmedian")
+        smooth = p.smooth(method="logmedian")
+        assert smooth.power.dtype == np.float32
+        assert_allclose(smooth.power, expected.power, rtol=1e-6)
+    snr = compact.flatten()
+    assert_allclose(snr.power, pg.flatten().power, rtol=1e-4)
+    assert_allclose(compact.smooth().power, pg.smooth().power, rtol=1e-4)
+
+    # Irregular frequency grids cannot be compacted
+    pg = lc.to_periodogram(period=np.arange(1, 10) * u.day)
+    with pytest.raises(ValueError, match="evenly-spaced"):
+        pg.compact()
+
+
 def test_index():
     """Test if you can mask out periodogram"""
     lc = LightCurve(
@@ -356,6 +530,31 @@ def test_bls_period_recovery():
     assert_almost_equal(bls_period.value, period, decimal=2)
 
 
+def test_bls_max_workers():
+    """A BLS search split among several threads should give the same results
+    as a single thread."""
+    np.random.seed(42)
+    time = np.arange(0, 20, 0.02)
+    flux = 1 + 0.01 * np.random.randn(len(time))
+    flux[np.abs((time - 0.5 + 1.0) % 2.0 - 1.0) < 0.05] -= 0.2
+    lc = LightCurve(time=time, flux=flux, flux_err=np.full(len(time), 0.01))
+
+    pg = lc.to_periodogram("bls", duration=[0.05, 0.1])
+    pg_parallel = lc.to_periodogram("bls", duration=[0.05, 0.1], max_workers=3)
+    assert_array_equal(pg_parallel.period, pg.period)
+    for key in ["power", "duration", "depth", "snr"]:
+        assert_array_equal(getattr(pg_parallel, key), getattr(pg, key))
+    assert (pg_parallel.transit_time == pg.transit_time).all()
+    assert pg_parallel.period_at_max_power == pg.period_at_max_power
+    assert pg_parallel._BLS_result.objective == pg._BLS_result.objective
+
+    with pytest.raises(ValueError, match="max_workers"):
+        lc.to_periodogram("bls", max_workers=0)
+    # More threads do not allow larger grids
+    with pytest.raises(ValueError, match="too large"):
+        lc.to_periodogram("bls", frequency_factor=0.00001, max_workers=64)
+
+
 def test_error_messages():
     """Test periodogram raises reasonable errors"""
     # Fake, noisy data
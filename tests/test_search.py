@@ -8,6 +8,7 @@ if no internet connection is available.
 import os
 import pytest
 
+import numpy as np
 from numpy.testing import assert_almost_equal, assert_array_equal
 import tempfile
 from requests import HTTPError
@@ -25,6 +26,7 @@ from lightkurve.search import (
     search_tesscut,
     SearchResult,
     SearchError,
+    TransientDownloadError,
     log,
 )
 from lightkurve import (
@@ -334,6 +336,535 @@ def test_empty_searchresult():
         sr.download_all()
 
 
+def test_download_from_cache_index():
+    """Are files found in the cache index read without querying MAST?"""
+    from shutil import copy
+
+    from . import TESTDATA
+
+    with tempfile.TemporaryDirectory() as download_dir:
+        path = copy(
+            os.path.join(TESTDATA, "test-lc-tess-pimen-100-cadences.fits"), download_dir
+        )
+        uri = "mast:TESS/product/test-lc-tess-pimen-100-cadences.fits"
+        lk.config.CacheIndex(download_dir).add(uri, path)
+        table = Table(
+            {
+                "description": ["Light curves"],
+                "dataURI": [uri],
+                "obs_collection": ["TESS"],
+                "obs_id": ["unknown"],
+                "productFilename": ["unknown.fits"],
+            }
+        )
+        lc = SearchResult(Table())._download_one(
+            table, quality_bitmask="default", download_dir=download_dir, cutout_size=None
+        )
+        assert isinstance(lc, lk.TessLightCurve)
+
+
+def test_persistent_search_cache(monkeypatch):
+    """Are identical searches answered from the persistent cache?"""
+    from astroquery.mast import Observations
+    from lightkurve.search import _search_products
+
+    queries = []
+
+    def fake_query_criteria(**criteria):
+        queries.append(criteria)
+        return Table(
+            {
+                "target_name": ["TESS FFI", "TESS FFI"],
+                "sequence_number": [14, 15],
+                "t_min": [58682.0, 58710.0],
+                "t_exptime": [1800.0, 1800.0],
+                "distance": [0.0, 0.0],
+            }
+        )
+
+    monkeypatch.setattr(Observations, "query_criteria", fake_query_criteria)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        with lk.conf.set_temp("cache_dir", cache_dir):
+            # The cache is disabled by default
+            _search_products("10 20", filetype="ffi", mission="TESS")
+            _search_products("10 20", filetype="ffi", mission="TESS")
+            assert len(queries) == 2
+            with lk.conf.set_temp("search_cache_ttl", 3600):
+                sr = _search_products("10 20", filetype="ffi", mission="TESS")
+                assert len(queries) == 3
+                # Equivalent criteria share the same cache entry
+                sr_cached = _search_products(" 10  20", filetype="FFI", mission=["TESS"])
+                assert len(queries) == 3
+                assert_array_equal(sr_cached.table["mission"], sr.table["mission"])
+                _search_products("10 20", filetype="ffi", mission="TESS", sector=14)
+                assert len(queries) == 4
+                # Manual invalidation
+                lk.config.get_search_cache().clear()
+                _search_products("10 20", filetype="ffi", mission="TESS")
+                assert len(queries) == 5
+            # Expired results are not used
+            with lk.conf.set_temp("search_cache_ttl", 1e-9):
+                _search_products("10 20", filetype="ffi", mission="TESS")
+                assert len(queries) == 6
+
+
+def test_search_cache_serialization():
+    """Do cached tables keep their masks and units?"""
+    from astropy.table import MaskedColumn
+    from lightkurve.config import SearchCache
+
+    table = Table(
+        {
+            "sequence_number": MaskedColumn([14, 15], mask=[False, True]),
+            "t_exptime": [120.0, 1800.0] * u.s,
+            "target_name": ["TESS FFI", "261136679"],
+        }
+    )
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = SearchCache(cache_dir, ttl=3600)
+        cache.set("key", table)
+        cached = cache.get("key")
+        assert_array_equal(cached["sequence_number"].mask, [False, True])
+        assert cached["t_exptime"].unit == u.s
+        assert_array_equal(cached["target_name"], table["target_name"])
+
+
+def test_search_lightcurve_batch(monkeypatch):
+    """Does the batched search return the same results as individual searches,
+    using fewer queries?"""
+    from astropy.table import MaskedColumn
+    from astroquery.mast import Observations
+    from lightkurve.search import _search_products
+
+    queries, product_queries = [], []
+    catalog = {str(tic).zfill(9): tic for tic in range(1, 6)}
+
+    def fake_query_criteria(target_name=None, objectname=None, **criteria):
+        queries.append(target_name or objectname)
+        rows = [
+            (name, f"{tic}{sector}", f"tess-s{sector}-{name}", 120.0, sector)
+            for name in np.atleast_1d(target_name or [])
+            if name in catalog
+            for tic in [catalog[name]]
+            for sector in (1, 2)
+        ]
+        obs = Table(
+            rows=rows,
+            names=["target_name", "obsid", "obs_id", "t_exptime", "sequence_number"],
+            dtype=[str, str, str, float, int],
+        )
+        obs["sequence_number"] = MaskedColumn(obs["sequence_number"])
+        obs["project"] = "TESS"
+        obs["provenance_name"] = "SPOC"
+        obs["t_min"] = 58300.0
+        obs["distance"] = 0.0
+        return obs
+
+    def fake_get_product_list(observations):
+        if isinstance(observations, Table):
+            observations = observations["obsid"]
+        product_queries.append(list(observations))
+        rows = []
+        for obsid in observations:
+            obs_id = f"tess-s{obsid[-1]}-{obsid[:-1].zfill(9)}"
+            for suffix in ("lc.fits", "tp.fits", "dvt.fits"):
+                rows.append((obsid, obs_id, f"{obs_id}_{suffix}", "Light curves"))
+        return Table(
+            rows=rows,
+            names=["parent_obsid", "obs_id", "productFilename", "description"],
+        )
+
+    monkeypatch.setattr(Observations, "query_criteria", fake_query_criteria)
+    monkeypatch.setattr(Observations, "get_product_list", fake_get_product_list)
+
+    targets = ["TIC 1", "TIC 2", "TIC 3", "TIC 4", "TIC 5", "TIC 99"]
+    results = lk.search_lightcurve_batch(targets, batch_size=4)
+    assert list(results.keys()) == targets
+    # Two batched queries by target name, one query for the unknown target
+    assert len(queries) == 3
+    # Ten observations are listed in three batches of products
+    assert len(product_queries) == 3
+    assert len(results["TIC 99"]) == 0
+    for target in targets[:-1]:
+        expected = _search_products(target, filetype="Lightcurve")
+        assert len(results[target]) == 2
+        assert_array_equal(
+            results[target].table["productFilename"], expected.table["productFilename"]
+        )
+        assert_array_equal(results[target].mission, expected.mission)
+
+
+def test_local_catalog(monkeypatch, tmp_path):
+    """Do searches of a local catalog return the same results as MAST?"""
+    from astropy.table import MaskedColumn
+    from astroquery.exceptions import ResolverError
+    from astroquery.mast import Observations
+    import lightkurve.search
+
+    coords = {"KIC 1": (290.0, 44.0), "Kepler-1": (290.0, 44.0), "TIC 2": (10.0, -20.0)}
+
+    def fake_query_criteria(target_name=None, objectname=None, **criteria):
+        rows = [
+            ("kplr000000001", "1", "Kepler", "Kepler", 0, 1800.0, 290.0, 44.0),
+            ("000000002", "21", "TESS", "SPOC", 1, 120.0, 10.0, -20.0),
+            ("000000002", "22", "TESS", "SPOC", 2, 120.0, 10.0, -20.0),
+            ("000000002", "23", "TESS", "QLP", 2, 1800.0, 10.0, -20.0),
+        ]
+        obs = Table(
+            rows=rows,
+            names=[
+                "target_name",
+                "obsid",
+                "project",
+                "provenance_name",
+                "sequence_number",
+                "t_exptime",
+                "s_ra",
+                "s_dec",
+            ],
+        )
+        obs["sequence_number"] = MaskedColumn(
+            obs["sequence_number"], mask=obs["project"] == "Kepler"
+        )
+        obs["obs_id"] = ["kplr1_lc_Q111", "tess-s1-2", "tess-s2-2", "qlp-s2-2"]
+        obs["dataproduct_type"] = "timeseries"
+        obs["t_min"] = 58300.0
+        obs["s_region"] = [
+            "POLYGON {0} {1} {2} {1} {2} {3} {0} {3}".format(
+                ra - 0.01, dec - 0.01, ra + 0.01, dec + 0.01
+            )
+            for ra, dec in zip(obs["s_ra"], obs["s_dec"])
+        ]
+        if target_name is not None:
+            mask = np.isin(obs["target_name"], np.atleast_1d(target_name))
+        else:
+            ra, dec = coords[objectname]
+            mask = (obs["s_ra"] == ra) & (obs["s_dec"] == dec)
+            obs["distance"] = 0.0
+        mask &= np.isin(obs["project"], criteria["project"])
+        if "provenance_name" in criteria:
+            mask &= np.isin(obs["provenance_name"], criteria["provenance_name"])
+        if "sequence_number" in criteria:
+            mask &= np.isin(obs["sequence_number"], criteria["sequence_number"])
+        return obs[mask]
+
+    def fake_get_product_list(observations):
+        if isinstance(observations, Table):
+            observations = observations["obsid"]
+        rows = []
+        obs_ids = ["kplr1_lc_Q111", "tess-s1-2", "tess-s2-2", "qlp-s2-2"]
+        for obsid, obs_id in zip(["1", "21", "22", "23"], obs_ids):
+            if obsid in observations:
+                for suffix in ("lc.fits", "tp.fits"):
+                    rows.append(
+                        (
+                            obsid,
+                            obs_id,
+                            f"{obs_id}-2009166043257_{suffix}",
+                            "Lightcurve - Q1",
+                            f"mast:{obs_id}",
+                        )
+                    )
+        return Table(
+            rows=rows,
+            names=[
+                "parent_obsid",
+                "obs_id",
+                "productFilename",
+                "description",
+                "dataURI",
+            ],
+        )
+
+    def fake_resolve_object(target):
+        if target not in coords:
+            raise ResolverError(target)
+        return SkyCoord(*coords[target], unit="deg")
+
+    monkeypatch.setattr(Observations, "query_criteria", fake_query_criteria)
+    monkeypatch.setattr(Observations, "get_product_list", fake_get_product_list)
+    monkeypatch.setattr(lightkurve.search, "_resolve_object", fake_resolve_object)
+
+    searches = [
+        ("KIC 1", {}),
+        ("TIC 2", {}),
+        ("TIC 2", {"author": "any", "sector": 2}),
+        ("TIC 2", {"author": "QLP", "exptime": "long"}),
+        ("Kepler-1", {}),
+    ]
+    online = [
+        search_lightcurve.__wrapped__(target, **kwargs) for target, kwargs in searches
+    ]
+    path = str(tmp_path / "catalog.sqlite")
+    catalog = lk.build_local_catalog(["KIC 1", "TIC 2", "Kepler-1"], path)
+    assert len(catalog) == 4
+
+    def no_network(*args, **kwargs):
+        raise AssertionError("MAST should not be queried")
+
+    monkeypatch.setattr(Observations, "query_criteria", no_network)
+    monkeypatch.setattr(Observations, "get_product_list", no_network)
+    with lk.conf.set_temp("local_catalog", path):
+        for (target, kwargs), expected in zip(searches, online):
+            result = search_lightcurve.__wrapped__(target, **kwargs)
+            assert len(result) == len(expected) > 0
+            for column in ("productFilename", "mission", "author", "exptime"):
+                assert_array_equal(result.table[column], expected.table[column])
+        # Cone searches by coordinates do not require the name resolver
+        result = search_lightcurve.__wrapped__(SkyCoord(10, -20, unit="deg"), radius=1)
+        assert len(result) == 3
+        # Unknown target names cannot be resolved
+        assert len(search_lightcurve.__wrapped__("Kepler-2")) == 0
+
+
+def test_mission_names():
+    """Are the mission names of Kepler, K2 and TESS products formatted correctly?"""
+    from astropy.table import MaskedColumn
+    from lightkurve.search import _mission_names
+
+    products = Table(
+        {
+            "project": ["Kepler", "Kepler", "K2", "K2", "K2", "TESS", "TESS"],
+            "sequence_number": MaskedColumn(
+                [0, 0, 5, 9, 10, 14, 0], mask=[1, 1, 0, 0, 0, 0, 1]
+            ),
+            "productFilename": [
+                "kplr0001-2009259160929_llc.fits",
+                "kplr0001-2012121044856_slc.fits",
+                "ktwo2001-c05_llc.fits",
+                "ktwo2001-c91_llc.fits",
+                "ktwo2001-c102_llc.fits",
+                "tess-s0014-0001_lc.fits",
+                "tesscut.fits",
+            ],
+            "description": [
+                "Lightcurve Long Cadence (CLC) - Q3",
+                "Lightcurve Short Cadence (CSC) - Q14",
+                "Lightcurve Long Cadence (KLC) - C5",
+                "Lightcurve Long Cadence (KLC) - C91",
+                "Lightcurve Long Cadence (KLC) - C102",
+                "Light curves",
+                "TESScut",
+            ],
+        }
+    )
+    assert list(_mission_names(products)) == [
+        "Kepler Quarter 03",
+        "Kepler Quarter 14",
+        "K2 Campaign 05",
+        "K2 Campaign 09a",
+        "K2 Campaign 10b",
+        "TESS Sector 14",
+        "TESS Sector ",
+    ]
+    assert len(_mission_names(products[:0])) == 0
+
+
+def test_download_all_concurrent(monkeypatch):
+    """Does `download_all(max_workers=...)` preserve the order of the products
+    and retry transient errors?"""
+    import threading
+    import time
+
+    sr = SearchResult(Table())
+    sr.table = Table({"idx": np.arange(8)})
+    lock = threading.Lock()
+    attempts = {}
+
+    def fake_download_one(table, **kwargs):
+        idx = int(table["idx"][0])
+        with lock:
+            attempts[idx] = attempts.get(idx, 0) + 1
+            first_attempt = attempts[idx] == 1
+        # Make the first products the slowest to complete
+        time.sleep(0.01 * (8 - idx))
+        if idx == 3 and first_attempt:
+            raise HTTPError("503 Service Unavailable")
+        return lk.LightCurve(time=[idx], flux=[idx])
+
+    monkeypatch.setattr(sr, "_download_one", fake_download_one)
+    lcc = sr.download_all(max_workers=4, max_retries=2, retry_delay=0)
+    assert isinstance(lcc, lk.LightCurveCollection)
+    assert [lc.flux[0].value for lc in lcc] == list(range(8))
+    assert attempts[3] == 2
+    # Errors are raised once the retries are exhausted
+    attempts.clear()
+    with pytest.raises(HTTPError):
+        sr.download_all(max_workers=4, retry_delay=0)
+
+
+def test_download_retries_transient_errors_only():
+    """Are only connection errors, timeouts, and HTTP 429 or 5xx errors retried?"""
+    from requests import Response
+    from requests.exceptions import ConnectTimeout
+    from lightkurve.search import _is_transient_download_error
+
+    def http_error(status):
+        response = Response()
+        response.status_code = status
+        return HTTPError("{} Error".format(status), response=response)
+
+    for status in [429, 500, 503, 504]:
+        assert _is_transient_download_error(http_error(status))
+    for status in [400, 403, 404]:
+        assert not _is_transient_download_error(http_error(status))
+    assert _is_transient_download_error(HTTPError("returned 504 Gateway Timeout"))
+    assert not _is_transient_download_error(HTTPError("Not Found"))
+    assert _is_transient_download_error(ConnectTimeout())
+    assert _is_transient_download_error(ConnectionResetError())
+    assert not _is_transient_download_error(ValueError())
+
+    sr = SearchResult(Table())
+    sr.table = Table({"idx": np.arange(2)})
+    attempts = []
+
+    def fake_download_one(table, **kwargs):
+        attempts.append(int(table["idx"][0]))
+        raise http_error(404)
+
+    sr._download_one = fake_download_one
+    with pytest.raises(HTTPError):
+        sr.download_all(max_retries=3, retry_delay=0)
+    assert attempts.count(0) == 1
+
+
+def test_download_retries_mast_server_errors(monkeypatch, tmp_path):
+    """Are downloads which MAST fails to serve with a 5xx error retried?"""
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from astropy.utils.data import get_pkg_data_filename
+    from astroquery.mast import Observations
+
+    with open(get_pkg_data_filename("data/test-lc-tess-pimen-100-cadences.fits"), "rb") as f:
+        content = f.read()
+    errors = []
+
+    class Handler(BaseHTTPRequestHandler):
+        """Serves the file, unless an error status is queued in `errors`."""
+
+        def do_HEAD(self):
+            if errors:
+                self.send_error(errors.pop(0))
+                return False
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            return True
+
+        def do_GET(self):
+            if self.do_HEAD():
+                self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        monkeypatch.setattr(
+            Observations._portal_api_connection,
+            "MAST_DOWNLOAD_URL",
+            "http://127.0.0.1:{}/".format(server.server_port),
+        )
+        sr = SearchResult(Table())
+        sr.table = Table(
+            {
+                "dataURI": ["mast:TESS/product/pimen_lc.fits"],
+                "obs_collection": ["TESS"],
+                "obs_id": ["pimen"],
+                "productFilename": ["pimen_lc.fits"],
+                "description": ["Light curves"],
+            }
+        )
+        # Client errors are not retried
+        errors[:] = [404]
+        with pytest.raises(LightkurveError, match="404"):
+            sr.download_all(download_dir=str(tmp_path), max_retries=1, retry_delay=0)
+        errors[:] = [503]
+        with pytest.raises(TransientDownloadError, match="503"):
+            sr.download_all(download_dir=str(tmp_path), max_retries=0)
+        # The server responds with 503, and then 200
+        errors[:] = [503]
+        lcs = sr.download_all(download_dir=str(tmp_path), max_retries=1, retry_delay=0)
+        assert errors == []
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert len(lcs) == 1
+    assert isinstance(lcs[0], lk.TessLightCurve)
+
+
+def test_download_cache_eviction(monkeypatch, tmp_path):
+    """Are the files in use by other threads, and the files of a batch which
+    is being downloaded, protected from being evicted from the cache?"""
+    from lightkurve.search import _cache_keys_in_use
+
+    index = lk.config.CacheIndex(str(tmp_path))
+    for name in ["a", "b", "c"]:
+        path = tmp_path / (name + ".fits")
+        path.write_bytes(b"0123456789")
+        index.add(name, str(path))
+    sr = SearchResult(Table())
+    with lk.conf.set_temp("cache_size_limit", 15):
+        with _cache_keys_in_use("a", "b"):
+            sr._evict_cache(str(tmp_path))
+        assert "a" in index and "b" in index and "c" not in index
+        sr._evict_cache(str(tmp_path))
+        assert "a" not in index and "b" in index
+
+    # `download_all` evicts the cache once, after all the downloads
+    sr.table = Table({"idx": np.arange(4)})
+    evict_flags, evictions = [], []
+
+    def fake_download_one(table, evict=True, **kwargs):
+        evict_flags.append(evict)
+        return lk.LightCurve(time=[0], flux=[0])
+
+    monkeypatch.setattr(sr, "_download_one", fake_download_one)
+    monkeypatch.setattr(sr, "_evict_cache", evictions.append)
+    sr.download_all(max_workers=2, download_dir=str(tmp_path))
+    assert evict_flags == [False] * 4
+    assert evictions == [str(tmp_path)]
+
+
+def test_iter_download(monkeypatch):
+    """Does `iter_download()` yield the products one at a time, downloading
+    at most `max_workers` products ahead?"""
+    import threading
+    import time
+
+    sr = SearchResult(Table())
+    sr.table = Table({"idx": np.arange(10)})
+    lock = threading.Lock()
+    started = []
+
+    def fake_download_one(table, **kwargs):
+        idx = int(table["idx"][0])
+        with lock:
+            started.append(idx)
+        time.sleep(0.01 * (idx % 3))
+        return lk.LightCurve(time=[idx], flux=[idx])
+
+    monkeypatch.setattr(sr, "_download_one", fake_download_one)
+    products = sr.iter_download(max_workers=2)
+    assert started == []  # nothing is downloaded before iterating
+    for idx, lc in enumerate(products):
+        assert lc.flux[0].value == idx
+        # The next two products are downloaded while this one is processed
+        assert len(started) <= idx + 3
+    assert sorted(started) == list(range(10))
+
+    # Unordered iteration yields every product once
+    values = [lc.flux[0].value for lc in sr.iter_download(max_workers=3, ordered=False)]
+    assert sorted(values) == list(range(10))
+
+    # Stopping the iteration cancels the remaining downloads
+    started.clear()
+    for lc in sr.iter_download(max_workers=2):
+        break
+    assert len(started) <= 3
+
 @pytest.mark.remote_data
 def test_issue_472():
     """Regression test for https://github.com/lightkurve/lightkurve/issues/472"""
@@ -20,6 +20,7 @@ from astropy.utils.exceptions import AstropyWarning
 from lightkurve.targetpixelfile import KeplerTargetPixelFile, TargetPixelFileFactory
 from lightkurve.targetpixelfile import TessTargetPixelFile, TargetPixelFile
 from lightkurve.lightcurve import TessLightCurve
+from lightkurve.collections import LightCurveCollection
 from lightkurve.utils import LightkurveWarning, LightkurveDeprecationWarning
 from lightkurve.io import read
 from lightkurve.search import search_tesscut
@@ -725,7 +726,7 @@ def test_cutout():
         assert ntpf.flux.shape[2] == 1
         ntpf = tpf.cutout(SkyCoord(tpf.ra, tpf.dec, unit="deg"), size=2)
         ntpf = tpf.cutout(size=2)
-        assert np.product(ntpf.flux.shape[1:]) == 4
+        assert np.prod(ntpf.flux.shape[1:]) == 4
         assert ntpf.targetid == tpf.targetid
 
 
@@ -915,3 +916,206 @@ def test_parse_aperture_masks():
     tpf._parse_aperture_mask("pipeline")
     assert isinstance(mask, np.ndarray)
     assert np.issubdtype(mask.dtype, bool)
+
+
+def test_column_cache():
+    """Are quality-masked columns cached and invalidated correctly?"""
+    tpf = read(filename_tpf_tabby_lite)
+    tpf.clear_column_cache()
+    flux = tpf.flux
+    assert tpf.column_cache_info().misses == 1
+    assert_array_equal(tpf.flux.value, flux.value)
+    assert tpf.column_cache_info().hits == 1
+    assert tpf.column_cache_info().currsize == 1
+    assert tpf.column_cache_info().nbytes == flux.nbytes
+    # The aperture photometry should only need to read each column once
+    tpf.to_lightcurve()
+    info = tpf.column_cache_info()
+    tpf.to_lightcurve()
+    assert tpf.column_cache_info().misses == info.misses
+    # The properties return copies which can be modified
+    # without changing the cached arrays
+    flux = tpf.flux
+    flux[0] = 0
+    quality = tpf.quality
+    quality[0] = 5
+    assert not (tpf.flux[0] == 0).all()
+    assert tpf.quality[0] != 5
+    assert not tpf._get_masked_column("FLUX").flags.writeable
+    # Changing the quality mask invalidates the cache
+    tpf.quality_mask = np.zeros_like(tpf.quality_mask)
+    tpf.quality_mask[:10] = True
+    assert tpf.column_cache_info().currsize == 0
+    assert tpf.flux.shape[0] == 10
+    # Changing `hdu` invalidates the cache
+    tpf.hdu = tpf.hdu
+    assert tpf.column_cache_info().currsize == 0
+    # In-place changes through `hdu` are picked up
+    tpf.flux
+    tpf.hdu[1].data["FLUX"][0] = 0
+    assert (tpf.flux[0] == 0).all()
+    tpf.clear_column_cache()
+    tpf.flux
+    assert tpf.column_cache_info() == (0, 1, 1, tpf.flux.nbytes)
+
+
+def test_lazy_mode():
+    """Does a lazily-opened TPF give the same results as an eager one?"""
+    tpf = read(filename_tpf_tabby_lite)
+    lazy_tpf = read(filename_tpf_tabby_lite, lazy=True)
+    assert lazy_tpf.lazy
+    lazy_tpf.lazy_block_size = 7
+    assert lazy_tpf.shape == tpf.shape
+    for mask in ["background", "all"]:
+        assert_array_equal(
+            lazy_tpf.estimate_background(mask).flux,
+            tpf.estimate_background(mask).flux,
+        )
+    # The full data cube should not have been loaded
+    assert "FLUX" not in lazy_tpf._column_cache
+    assert_array_equal(lazy_tpf[10:20].flux, tpf[10:20].flux)
+    assert_array_equal(lazy_tpf.cutout(size=3).flux, tpf.cutout(size=3).flux)
+    assert "FLUX" not in lazy_tpf._column_cache
+    # The data cube is read in blocks, but not cached
+    assert_array_equal(lazy_tpf.flux, tpf.flux)
+    assert_array_equal(lazy_tpf.flux_err, tpf.flux_err)
+    assert "FLUX" not in lazy_tpf._column_cache
+    assert "TIME" in lazy_tpf._column_cache
+    # Masking all cadences should not break the blocked reads
+    lazy_tpf.quality_mask = np.zeros_like(lazy_tpf.quality_mask)
+    assert len(lazy_tpf.estimate_background("all").flux) == 0
+
+
+def test_tpf_slicing_views():
+    """Do contiguous slices share their data with the parent TPF?"""
+    tpf = read(filename_tpf_tabby_lite)
+    for key in [5, -1, slice(10, 20), tpf.time.value < tpf.time.value[30]]:
+        frames = tpf[key]
+        assert np.shares_memory(frames._hdu[1].data["FLUX"], tpf._hdu[1].data["FLUX"])
+        assert_array_equal(frames.flux.value.ravel(), tpf.flux.value[key].ravel())
+    # Slices skipping good-quality cadences are copies
+    frames = tpf[::2]
+    assert not np.shares_memory(frames._hdu[1].data["FLUX"], tpf._hdu[1].data["FLUX"])
+    assert_array_equal(frames.flux, tpf.flux[::2])
+    # Cadences rejected by the quality mask are skipped by the view
+    with fits.open(filename_tpf_tabby_lite) as hdulist:
+        hdulist[1].data["QUALITY"][:] = 0
+        hdulist[1].data["QUALITY"][12] = 1
+        tpf = KeplerTargetPixelFile(hdulist, quality_bitmask=1)
+        frames = tpf[10:20]
+        assert np.shares_memory(frames._hdu[1].data["FLUX"], tpf._hdu[1].data["FLUX"])
+        assert_array_equal(frames.time.value, tpf.time.value[10:20])
+        # `copy()` does not share data
+        frames = frames.copy()
+        assert not np.shares_memory(
+            frames._hdu[1].data["FLUX"], tpf._hdu[1].data["FLUX"]
+        )
+        assert_array_equal(frames.flux, tpf.flux[10:20])
+
+
+def test_tpf_slicing_copy_on_write():
+    """Are the data shared by slices copied before they are modified?"""
+    tpf = read(filename_tpf_tabby_lite)
+    flux = tpf.flux
+    frames, other_frames = tpf[10:20], tpf[10:20]
+    sub_frames = frames[2:5]
+    # Writing to a slice does not change the parent or the other slices
+    frames.hdu[1].data["FLUX"][2] += 100
+    assert_array_equal(frames.flux.value[2], flux.value[12] + 100)
+    assert_array_equal(tpf.flux, flux)
+    assert_array_equal(other_frames.flux, flux[10:20])
+    assert_array_equal(sub_frames.flux, flux[12:15])
+    assert np.shares_memory(
+        other_frames._hdu[1].data["FLUX"], tpf._hdu[1].data["FLUX"]
+    )
+    # Writing to the parent does not change the slices
+    tpf.hdu[1].data["FLUX"][15] = 0
+    assert (tpf.flux[15] == 0).all()
+    assert_array_equal(other_frames.flux, flux[10:20])
+    assert_array_equal(sub_frames.flux, flux[12:15])
+    assert not np.shares_memory(
+        other_frames._hdu[1].data["FLUX"], tpf._hdu[1].data["FLUX"]
+    )
+    # `copy()` keeps the lazy mode
+    lazy_tpf = read(filename_tpf_tabby_lite, lazy=True)
+    lazy_tpf.lazy_block_size = 7
+    for obj in [lazy_tpf.copy(), lazy_tpf[10:20], lazy_tpf[::2]]:
+        assert obj.lazy
+        assert obj.lazy_block_size == 7
+
+
+@pytest.mark.parametrize("use_numba", [False, True])
+def test_aperture_photometry_kernel(monkeypatch, use_numba):
+    """Do the fused photometry kernels agree with a straightforward calculation?"""
+    from lightkurve import targetpixelfile
+
+    if use_numba:
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(
+            targetpixelfile, "_get_numba_aperture_photometry_kernel", lambda: None
+        )
+    with fits.open(filename_tpf_tabby_lite) as hdulist:
+        hdulist[1].data["FLUX"][3] = 0  # all-zero cadence
+        hdulist[1].data["FLUX"][4] = np.nan  # all-NaN cadence
+        hdulist[1].data["FLUX"][5, 0, 0] = np.nan  # single NaN pixel
+        tpf = KeplerTargetPixelFile(hdulist)
+        mask = tpf.pipeline_mask
+        lc = tpf.to_lightcurve(aperture_mask=mask)
+        flux = tpf.flux.value[:, mask]
+        expected = np.nansum(flux, axis=1)
+        expected[[3, 4]] = np.nan
+        assert_array_equal(np.isnan(lc.flux.value), np.isnan(expected))
+        assert np.allclose(lc.flux.value, expected, rtol=1e-6, equal_nan=True)
+        expected_err = np.sum(tpf.flux_err.value[:, mask] ** 2, axis=1) ** 0.5
+        assert np.allclose(lc.flux_err.value, expected_err, rtol=1e-6)
+        col, row = tpf.estimate_centroids(mask)
+        assert np.allclose(lc.centroid_col, col, equal_nan=True)
+        assert np.allclose(lc.centroid_row, row, equal_nan=True)
+
+        # Processing the data cube in blocks should not change the result
+        tpf.lazy, tpf.lazy_block_size = True, 7
+        lc_blocks = tpf.to_lightcurve(aperture_mask=mask, centroid_method="quadratic")
+        tpf.lazy = False
+        lc = tpf.to_lightcurve(aperture_mask=mask, centroid_method="quadratic")
+        assert np.allclose(lc_blocks.flux, lc.flux, rtol=1e-6, equal_nan=True)
+        assert np.allclose(lc_blocks.centroid_col, lc.centroid_col, equal_nan=True)
+
+
+@pytest.mark.parametrize("flux_method", ["sum", "mean", "median"])
+@pytest.mark.parametrize("centroid_method", ["moments", "quadratic"])
+def test_aperture_photometry_batch(flux_method, centroid_method):
+    """Does batch photometry match one extraction per mask?"""
+    for tpf in [read(filename_tpf_tabby_lite), TessTargetPixelFile(filename_tess)]:
+        masks = [tpf.create_threshold_mask(threshold) for threshold in [1, 3, 10]]
+        masks += ["all", "pipeline" if tpf.pipeline_mask.any() else "threshold"]
+        lcs = tpf.extract_aperture_photometry_batch(
+            masks, flux_method=flux_method, centroid_method=centroid_method
+        )
+        assert isinstance(lcs, LightCurveCollection)
+        assert len(lcs) == len(masks)
+        for lc, mask in zip(lcs, masks):
+            expected = tpf.extract_aperture_photometry(
+                mask, flux_method=flux_method, centroid_method=centroid_method
+            )
+            assert type(lc) is type(expected)
+            assert lc.flux.unit == expected.flux.unit
+            for column in ["flux", "flux_err", "centroid_col", "centroid_row"]:
+                assert np.allclose(
+                    lc[column], expected[column], rtol=1e-5, equal_nan=True
+                )
+            assert_array_equal(lc.meta["APERTURE_MASK"], mask)
+
+
+def test_pickle():
+    """Can target pixel files be pickled, e.g. to be sent to other processes?"""
+    import pickle
+
+    for tpf in [read(filename_tess), read(filename_tpf_one_center, lazy=True)]:
+        tpf.quality_mask = tpf.quality_mask.copy()
+        tpf.quality_mask[0] = False
+        unpickled = pickle.loads(pickle.dumps(tpf))
+        assert type(unpickled) is type(tpf)
+        assert unpickled.targetid == tpf.targetid
+        assert_array_equal(unpickled.quality_mask, tpf.quality_mask)
+        assert_array_equal(unpickled.flux, tpf.flux)
@@ -2,12 +2,13 @@ import pytest
 import warnings
 
 import numpy as np
-from numpy.testing import assert_almost_equal, assert_array_equal
+from numpy.testing import assert_almost_equal, assert_array_equal, assert_allclose
 
 from lightkurve.utils import KeplerQualityFlags, TessQualityFlags
 from lightkurve.utils import module_output_to_channel, channel_to_module_output
 from lightkurve.utils import LightkurveWarning
 from lightkurve.utils import running_mean, validate_method
+from lightkurve.utils import _running_median, _running_biweight
 from lightkurve.utils import bkjd_to_astropy_time, btjd_to_astropy_time
 from lightkurve.utils import centroid_quadratic
 from lightkurve.utils import show_citation_instructions
@@ -41,6 +42,49 @@ def test_running_mean():
     assert_almost_equal(running_mean([3, 4, 5], window_size=20), [4])
 
 
+def test_running_median():
+    """Compare the sliding-window median against a direct computation."""
+    np.random.seed(42)
+    x = np.sort(np.random.uniform(0, 10, 200))
+    y = np.random.normal(0, 1, 200)
+    expected = [np.median(y[np.abs(x - xi) <= 0.5]) for xi in x]
+    assert_almost_equal(_running_median(x, y, 0.5), expected)
+    # The biweight location should be close to the median for Gaussian noise,
+    # but should not be affected by a single outlier
+    y[100] = 1e3
+    biweight = _running_biweight(x, y, 0.5)
+    assert np.all(np.abs(biweight) < 1.5)
+
+
+def test_running_biweight_complexity(monkeypatch):
+    """The biweight location should only be evaluated at a bounded number of
+    points per window, so that its cost does not grow with the window length."""
+    import lightkurve.utils
+
+    np.random.seed(42)
+    x = np.arange(20000) * 20 / 86400  # 20-second cadence
+    y = 1 + 0.01 * np.sin(2 * np.pi * x / 3) + np.random.normal(0, 1e-3, len(x))
+    y[np.random.randint(0, len(x), 100)] += 0.05
+    # The location is interpolated between the points where it is evaluated
+    exact = _running_biweight(x, y, 0.1, points_per_window=len(x))
+    assert_allclose(_running_biweight(x, y, 0.1), exact, atol=1e-4)
+
+    sizes = []
+    padded_median = lightkurve.utils._padded_median
+
+    def counting_padded_median(window, counts):
+        sizes.append(window.size)
+        return padded_median(window, counts)
+
+    monkeypatch.setattr(lightkurve.utils, "_padded_median", counting_padded_median)
+    for half_width in [0.1, 0.5]:  # about 900 and 4300 points per window
+        sizes.clear()
+        _running_biweight(x, y, half_width)
+        # The location and the scale are the medians of about 32 windows per
+        # window length, instead of one window per point
+        assert sum(sizes) < 2 * 40 * len(x)
+
+
 def test_quality_flag_decoding_kepler():
     """Can the QUALITY flags be parsed correctly?"""
     flags = list(KeplerQualityFlags.STRINGS.items())
@@ -228,3 +272,31 @@ def test_centroid_quadratic_robustness(data_dtype, mask):
 
 def test_show_citation_instructions():
     show_citation_instructions()
+
+
+def test_centroid_quadratic_batch():
+    """Does passing a stack of images give the same result as a loop?"""
+    rng = np.random.default_rng(42)
+    data = rng.normal(size=(20, 7, 8))
+    data[:, 3, 4] += 10
+    data[5, 2, 2] += 20  # brightest pixel moves
+    data[6] = np.nan  # all-NaN image
+    data[7, 3, 5] = np.nan  # NaN in the 3x3 patch
+    mask = np.ones((7, 8), dtype=bool)
+    mask[:, -1] = False
+    col, row = centroid_quadratic(data, mask=mask)
+    assert col.shape == row.shape == (20,)
+    assert np.isnan(col[6]) & np.isnan(row[6])
+    for idx in [0, 5, 7, 19]:
+        expected = centroid_quadratic(data[idx], mask=mask)
+        assert np.allclose((col[idx], row[idx]), expected)
+    assert np.all(np.abs(col[8:] - 4) < 0.5) & np.all(np.abs(row[8:] - 3) < 0.5)
+
+
+@pytest.mark.parametrize("shape", [(2, 5), (5, 2), (4, 2, 5)])
+def test_centroid_quadratic_small_images(shape):
+    """Images smaller than the 3x3 patch cannot be fitted."""
+    data = np.zeros(shape)
+    data[..., 1, 1] = 10
+    with pytest.raises(ValueError, match="at least 3x3"):
+        centroid_quadratic(data)